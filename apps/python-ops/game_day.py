@@ -13,24 +13,64 @@ Scenarios:
 4. health_sweep    - Verify all services are healthy
 5. trace_verify    - Validate distributed tracing connectivity
 6. slo_check       - Validate SLO metrics are being captured
+7. mixed_load      - Drive a weighted request mix across services
+8. connection_churn - Compare per-request connections with keep-alive
+9. soak            - Hold steady load for hours and flag resource leaks
+10. loki_errors    - Correlate client errors with error logs in Loki
+11. openapi_load   - Weighted load over every OpenAPI operation, checked
+                     against the contract
+12. webhook_delivery - Webhook delivery latency, duplicates and ordering
+                     into a local receiver
+13. retry_storm    - Compare client retry policies against a target that
+                     degrades and recovers
+
+serve-fakes starts local stand-ins for every service instead of running a
+scenario; --with-fakes runs a scenario against in-process stand-ins.
 
 Usage:
     python game_day.py load_test
+    python game_day.py mixed_load --mix scenarios/production_mix.json
+    python game_day.py openapi_load --rps 50 --duration 60
     python game_day.py health_sweep
+    python game_day.py serve-fakes
     python game_day.py --all
 """
 
 import argparse
+import asyncio
+import atexit
+import bisect
+import codecs
+import contextlib
+import functools
+import hashlib
+import heapq
+import hmac
+import http.client
 import json
+import math
+import os
 import random
+import re
+import socket
 import sys
+import threading
 import time
-from dataclasses import dataclass
+import uuid
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, urlsplit
 
 import requests
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: JSON workload files only
+    tomllib = None
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -67,6 +107,39 @@ ENDPOINTS = {
     },
 }
 
+# ATLAS_ENDPOINT_<SERVICE> (e.g. ATLAS_ENDPOINT_RUST_API) overrides a
+# service's endpoint in both modes, e.g. to target ``serve-fakes``.
+ENDPOINT_ENV_PREFIX = "ATLAS_ENDPOINT_"
+
+
+# LogQL selecting error-level lines shipped by Alloy's OTLP -> Loki exporter.
+LOKI_ERROR_QUERY = '{exporter="OTLP"} |~ `(?i)\\berror\\b`'
+LOKI_PAGE_LIMIT = 5000
+
+# Thresholds above which a scenario's numbers describe the load generator
+# rather than the service under test.
+CLIENT_BOUND_THRESHOLDS = {
+    "cpu_fraction": 0.85,  # share of one core used by this process
+    "sched_lag_p99_ms": 50.0,  # oversleep of the sampler thread
+    "pool_wait_ratio": 0.05,  # requests that found every connection busy
+    "send_drift_p95_ms": 100.0,  # lateness against the intended send schedule
+}
+
+
+# Target series watched by the soak scenario, and the relative growth per
+# hour (against the run mean) above which a steady trend is flagged.
+SOAK_TRACKED_METRICS = {
+    "rss_bytes": "process_resident_memory_bytes",
+    "goroutines": "go_goroutines",
+    "open_fds": "process_open_fds",
+}
+SOAK_GROWTH_THRESHOLDS = {
+    "rss_bytes": 0.05,
+    "goroutines": 0.05,
+    "open_fds": 0.05,
+    "latency_p95_ms": 0.10,
+}
+
 
 @dataclass
 class GameDayResult:
@@ -89,33 +162,461 @@ def get_endpoint(service: str, prefer_internal: bool = True) -> str:
     if service not in ENDPOINTS:
         raise ValueError(f"Unknown service: {service}")
 
+    override = os.environ.get(f"{ENDPOINT_ENV_PREFIX}{service.upper()}")
+    if override:
+        return override.rstrip("/")
+
     mode = "internal" if prefer_internal else "external"
     return ENDPOINTS[service][mode]
 
 
 def timed_request(method: str, url: str, **kwargs) -> Dict[str, Any]:
-    """Make a timed HTTP request and return result with latency."""
+    """
+    Make a timed HTTP request and return result with latency.
+
+    With ``keep_response=True`` the ``requests.Response`` (None on a
+    transport error) is returned under ``"response"`` for callers that
+    inspect the body.
+    """
+    keep_response = kwargs.pop("keep_response", False)
+    monitor = current_monitor()
+    if monitor:
+        monitor.request_started()
+
     start = time.time()
     error = None
     response = None
 
     try:
-        response = requests.request(
-            method, url, timeout=kwargs.pop("timeout", 5), **kwargs
-        )
+        with PROFILER.phase("http"):
+            response = requests.request(
+                method, url, timeout=kwargs.pop("timeout", 5), **kwargs
+            )
+        PROFILER.count("http requests")
+        PROFILER.count("bytes received", len(response.content))
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         error = str(e)
+        PROFILER.count("http errors")
+    finally:
+        if monitor:
+            monitor.request_finished()
 
     latency_ms = (time.time() - start) * 1000
 
-    return {
+    result = {
         "url": url,
-        "status_code": response.status_code if response else None,
+        "status_code": response.status_code if response is not None else None,
         "latency_ms": round(latency_ms, 2),
         "error": error,
         "success": error is None,
     }
+    if keep_response:
+        result["response"] = response
+    return result
+
+
+def parse_prometheus_text(text: str) -> Dict[str, float]:
+    """
+    Parse Prometheus text exposition into ``{series: value}``.
+
+    Series keys keep their label set verbatim, e.g.
+    ``shield_active_scans_total{type="compliance"}``.
+    """
+    samples: Dict[str, float] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if "}" in line:
+            series, _, rest = line.rpartition("}")
+            series += "}"
+        else:
+            series, _, rest = line.partition(" ")
+        fields = rest.split()
+        if not fields:
+            continue
+        try:
+            samples[series.strip()] = float(fields[0])
+        except ValueError:
+            continue
+    return samples
+
+
+def scrape_metrics(url: str, timeout: float = 5) -> Optional[Dict[str, float]]:
+    """Fetch and parse a ``/metrics`` endpoint, or None if unreachable."""
+    try:
+        with PROFILER.phase("http"):
+            response = requests.get(url, timeout=timeout)
+        PROFILER.count("http requests")
+        PROFILER.count("bytes received", len(response.content))
+        response.raise_for_status()
+    except requests.exceptions.RequestException:
+        PROFILER.count("http errors")
+        return None
+    with PROFILER.phase("metrics parse"):
+        return parse_prometheus_text(response.text)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 for an empty list)."""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct), len(ordered) - 1)]
+
+
+# =============================================================================
+# Client Self-Instrumentation
+# =============================================================================
+
+
+def _open_fd_count() -> Optional[int]:
+    """Number of file descriptors held by this process (Linux only)."""
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
+
+
+class ClientMonitor:
+    """
+    Samples the load generator's own health while a scenario runs.
+
+    A background thread wakes every ``interval_s`` and records process CPU
+    usage and how late it was woken (thread scheduling delay). Request
+    helpers report in-flight requests and send-schedule drift so the summary
+    can tell a slow service apart from a starved client.
+    """
+
+    def __init__(self, interval_s: float = 0.1, pool_size: int = 1, window: int = 4096):
+        self.interval_s = interval_s
+        self.pool_size = pool_size
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._cpu_samples: deque = deque(maxlen=window)
+        self._lag_samples: deque = deque(maxlen=window)
+        self._drift_samples: deque = deque(maxlen=window)
+        self._fd_peak: Optional[int] = None
+
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._requests = 0
+        self._pool_waits = 0
+
+    # -- lifecycle ------------------------------------------------------------
+
+    def start(self) -> "ClientMonitor":
+        self._thread = threading.Thread(
+            target=self._sample_loop, name="client-monitor", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval_s * 5)
+
+    def __enter__(self) -> "ClientMonitor":
+        _MONITORS.append(self)
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+        _MONITORS.remove(self)
+
+    def _sample_loop(self) -> None:
+        last_wall = time.perf_counter()
+        last_cpu = time.process_time()
+        while not self._stop.is_set():
+            time.sleep(self.interval_s)
+            now_wall = time.perf_counter()
+            now_cpu = time.process_time()
+            elapsed = now_wall - last_wall
+
+            fds = _open_fd_count()
+            with self._lock:
+                self._lag_samples.append(max(0.0, elapsed - self.interval_s) * 1000)
+                if elapsed > 0:
+                    self._cpu_samples.append((now_cpu - last_cpu) / elapsed)
+                if fds is not None:
+                    self._fd_peak = max(self._fd_peak or 0, fds)
+
+            last_wall, last_cpu = now_wall, now_cpu
+
+    # -- hooks ----------------------------------------------------------------
+
+    def request_started(self) -> None:
+        with self._lock:
+            if self._in_flight >= self.pool_size:
+                self._pool_waits += 1
+            self._in_flight += 1
+            self._requests += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def request_finished(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def record_pool_wait(self) -> None:
+        """Record a send that found every worker/connection busy."""
+        with self._lock:
+            self._pool_waits += 1
+
+    def record_send(self, scheduled: float, actual: float) -> None:
+        """Record how late a request was sent against its intended time."""
+        with self._lock:
+            self._drift_samples.append(max(0.0, actual - scheduled) * 1000)
+
+    # -- reporting ------------------------------------------------------------
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            cpu = list(self._cpu_samples)
+            lag = list(self._lag_samples)
+            drift = list(self._drift_samples)
+            requests_seen = self._requests
+            pool_waits = self._pool_waits
+            peak_in_flight = self._peak_in_flight
+            fd_peak = self._fd_peak
+
+        cpu_avg = sum(cpu) / len(cpu) if cpu else 0
+        pool_wait_ratio = pool_waits / requests_seen if requests_seen else 0
+        stats = {
+            "cpu_fraction_avg": round(cpu_avg, 3),
+            "cpu_fraction_max": round(max(cpu), 3) if cpu else 0,
+            "sched_lag_p50_ms": round(percentile(lag, 0.50), 2),
+            "sched_lag_p99_ms": round(percentile(lag, 0.99), 2),
+            "send_drift_p50_ms": round(percentile(drift, 0.50), 2),
+            "send_drift_p95_ms": round(percentile(drift, 0.95), 2),
+            "pool_size": self.pool_size,
+            "peak_in_flight": peak_in_flight,
+            "pool_waits": pool_waits,
+            "pool_wait_ratio": round(pool_wait_ratio, 3),
+            "open_fds_peak": fd_peak,
+            "samples": len(cpu),
+        }
+
+        limits = CLIENT_BOUND_THRESHOLDS
+        reasons = []
+        if cpu_avg >= limits["cpu_fraction"]:
+            reasons.append("cpu")
+        if stats["sched_lag_p99_ms"] >= limits["sched_lag_p99_ms"]:
+            reasons.append("scheduling-lag")
+        if pool_wait_ratio >= limits["pool_wait_ratio"]:
+            reasons.append("pool-exhausted")
+        if stats["send_drift_p95_ms"] >= limits["send_drift_p95_ms"]:
+            reasons.append("send-drift")
+
+        stats["client_bound"] = bool(reasons)
+        stats["client_bound_reasons"] = reasons
+        return stats
+
+
+_MONITORS: List[ClientMonitor] = []
+
+
+def current_monitor() -> Optional[ClientMonitor]:
+    """Return the monitor of the scenario currently running, if any."""
+    return _MONITORS[-1] if _MONITORS else None
+
+
+def instrumented(fn: Callable[..., GameDayResult]) -> Callable[..., GameDayResult]:
+    """
+    Run a scenario under a ClientMonitor and attach its summary.
+
+    Every scenario result carries ``details["client"]`` and
+    ``details["client_bound"]`` so generator limits are never reported as
+    service limits.
+    """
+
+    scenario = (
+        fn.__name__[len("run_") :] if fn.__name__.startswith("run_") else fn.__name__
+    )
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs) -> GameDayResult:
+        with ClientMonitor(pool_size=kwargs.get("concurrency", 1)) as monitor:
+            with PROFILER.phase(f"scenario {scenario}"):
+                result = fn(*args, **kwargs)
+
+        client = monitor.summary()
+        result.details["client"] = client
+        result.details["client_bound"] = client["client_bound"]
+        if client["client_bound"]:
+            print(
+                f"  ⚠ CLIENT-BOUND ({', '.join(client['client_bound_reasons'])}): "
+                "results reflect load generator limits"
+            )
+        return result
+
+    return wrapper
+
+
+# =============================================================================
+# Phase Profiling
+# =============================================================================
+
+PROFILE_ENV = "ATLAS_PROFILE"
+PROFILE_DUMP_ENV = "ATLAS_PROFILE_DUMP"
+
+_NULL_PHASE = contextlib.nullcontext()
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "parent", "wall", "cpu", "child_wall", "child_cpu")
+
+    def __init__(self, profiler: "PhaseProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> "_Phase":
+        stack = self.profiler._stack()
+        self.parent = stack[-1] if stack else None
+        stack.append(self)
+        self.child_wall = self.child_cpu = 0.0
+        self.cpu = time.thread_time()
+        self.wall = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        wall = time.perf_counter() - self.wall
+        cpu = time.thread_time() - self.cpu
+        self.profiler._stack().pop()
+        if self.parent is not None:
+            self.parent.child_wall += wall
+            self.parent.child_cpu += cpu
+        self.profiler._record(self.name, wall - self.child_wall, cpu - self.child_cpu)
+
+
+class PhaseProfiler:
+    """
+    Per-phase wall/CPU timing of the toolkit itself.
+
+    Same model and output as ``scripts/profiling.py`` in the docs tree:
+    phases (``http``, ``connect``, ``metrics parse``, one per scenario...)
+    nest and are charged self time, with counters for requests and bytes.
+    Worker threads time their own phases, so under concurrency phase totals
+    exceed the run's wall time. Enabled with ``--profile`` or
+    ``ATLAS_PROFILE=1``; ``--profile-dump`` writes a cProfile ``.prof`` or
+    the table as ``.json``.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.dump: Optional[str] = None
+        self.phases: Dict[str, List[float]] = {}
+        self.counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._cprofile = None
+        self._wall0 = self._cpu0 = 0.0
+
+    def enable(self, dump: Optional[str] = None) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        self.dump = dump
+        self._wall0 = time.perf_counter()
+        self._cpu0 = time.process_time()
+        if dump and dump.endswith(".prof"):
+            import cProfile
+
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        atexit.register(self.finish)
+
+    def phase(self, name: str):
+        """Context manager timing ``name`` (a no-op while disabled)."""
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def count(self, name: str, n: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, name: str, wall: float, cpu: float) -> None:
+        with self._lock:
+            row = self.phases.setdefault(name, [0, 0.0, 0.0])
+            row[0] += 1
+            row[1] += wall
+            row[2] += cpu
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            phases = [
+                {"name": name, "calls": c, "wall_s": w, "cpu_s": u}
+                for name, (c, w, u) in self.phases.items()
+            ]
+            counts = dict(self.counts)
+        return {
+            "script": "game_day.py",
+            "wall_s": time.perf_counter() - self._wall0,
+            "cpu_s": time.process_time() - self._cpu0,
+            "phases": phases,
+            "counts": counts,
+        }
+
+    def format_table(self, summary: Dict[str, Any]) -> str:
+        total = summary["wall_s"] or 1e-9
+        width = max([len(p["name"]) for p in summary["phases"]] + [len("(other)")])
+        lines = [
+            f"profile: {summary['script']}  wall {summary['wall_s']:.3f}s  "
+            f"cpu {summary['cpu_s']:.3f}s",
+            f"  {'phase':<{width}}  {'calls':>8}  {'wall s':>8}  {'cpu s':>8}  {'wall %':>6}",
+        ]
+        attributed = 0.0
+        for p in sorted(summary["phases"], key=lambda p: -p["wall_s"]):
+            attributed += p["wall_s"]
+            lines.append(
+                f"  {p['name']:<{width}}  {p['calls']:>8}  {p['wall_s']:>8.3f}  "
+                f"{p['cpu_s']:>8.3f}  {100 * p['wall_s'] / total:>5.1f}%"
+            )
+        other = summary["wall_s"] - attributed
+        if other > 0:
+            lines.append(
+                f"  {'(other)':<{width}}  {'':>8}  {other:>8.3f}  {'':>8}  "
+                f"{100 * other / total:>5.1f}%"
+            )
+        if summary["counts"]:
+            lines.append(
+                "  counts: "
+                + ", ".join(f"{k} {v:,}" for k, v in sorted(summary["counts"].items()))
+            )
+        return "\n".join(lines)
+
+    def finish(self) -> None:
+        """Print the table and write the dump; runs once, at exit."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        summary = self.summary()
+        print(self.format_table(summary), file=sys.stderr)
+        if not self.dump:
+            return
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(self.dump)
+        else:
+            with open(self.dump, "w") as f:
+                json.dump(summary, f, indent=2)
+        print(f"profile: wrote {self.dump}", file=sys.stderr)
+
+
+PROFILER = PhaseProfiler()
 
 
 # =============================================================================
@@ -123,6 +624,7 @@ def timed_request(method: str, url: str, **kwargs) -> Dict[str, Any]:
 # =============================================================================
 
 
+@instrumented
 def run_load_test(
     target_url: Optional[str] = None,
     num_requests: int = 50,
@@ -146,6 +648,9 @@ def run_load_test(
     latencies = []
     errors = []
 
+    monitor = current_monitor()
+    next_send = time.perf_counter()
+
     for i in range(num_requests):
         proj_id = f"proj_{random.randint(100, 999)}"
         payload = {
@@ -153,51 +658,2865 @@ def run_load_test(
             "content": f"Game day load test iteration {i+1}",
         }
 
-        result = timed_request("POST", url, json=payload)
-        latencies.append(result["latency_ms"])
+        if monitor:
+            monitor.record_send(next_send, time.perf_counter())
+        result = timed_request("POST", url, json=payload)
+        latencies.append(result["latency_ms"])
+
+        if result["success"]:
+            success_count += 1
+            print(
+                f"[{i+1}/{num_requests}] OK - {proj_id} ({result['latency_ms']:.0f}ms)"
+            )
+        else:
+            error_count += 1
+            errors.append(result["error"])
+            print(f"[{i+1}/{num_requests}] FAIL - {result['error']}")
+
+        # Realistic traffic pattern
+        think_s = random.uniform(0.05, 0.3)
+        next_send = time.perf_counter() + think_s
+        time.sleep(think_s)
+
+    duration = (time.time() - start_time) * 1000
+
+    # Calculate stats
+    avg_latency = sum(latencies) / len(latencies) if latencies else 0
+    p95_latency = percentile(latencies, 0.95)
+
+    status = (
+        "passed" if error_count == 0 else ("partial" if success_count > 0 else "failed")
+    )
+
+    print(f"\n{'='*60}")
+    print(f"RESULTS: {status.upper()}")
+    print(f"  Success: {success_count}/{num_requests}")
+    print(f"  Errors: {error_count}")
+    print(f"  Avg Latency: {avg_latency:.0f}ms")
+    print(f"  P95 Latency: {p95_latency:.0f}ms")
+    print(f"{'='*60}")
+
+    return GameDayResult(
+        scenario="load_test",
+        status=status,
+        duration_ms=duration,
+        details={
+            "total_requests": num_requests,
+            "success": success_count,
+            "errors": error_count,
+            "avg_latency_ms": round(avg_latency, 2),
+            "p95_latency_ms": round(p95_latency, 2),
+            "error_samples": errors[:5],
+        },
+        timestamp=datetime.utcnow().isoformat(),
+    )
+
+
+# =============================================================================
+# Scenario: Mixed Load
+# =============================================================================
+
+
+@dataclass
+class WorkloadEntry:
+    """One request stream in a workload mix."""
+
+    name: str
+    service: str
+    method: str
+    path: str
+    rate_rps: float
+    payloads: List[Any] = field(default_factory=list)
+    headers: Dict[str, str] = field(default_factory=dict)
+    think_time: Dict[str, Any] = field(default_factory=dict)
+
+    def next_gap(self, rng: random.Random) -> float:
+        """Seconds until this stream's next send, drawn from ``think_time``."""
+        mean = 1.0 / self.rate_rps
+        dist = self.think_time.get("distribution", "exponential")
+
+        if dist == "constant":
+            return mean
+        if dist == "uniform":
+            # load_workload fills in the bound(s) that centre it on ``mean``.
+            return rng.uniform(
+                self.think_time.get("min_s", 0.0),
+                self.think_time.get("max_s", 2 * mean),
+            )
+        if dist == "normal":
+            return max(0.0, rng.gauss(mean, self.think_time.get("stddev_s", mean / 4)))
+        if dist == "exponential":
+            return rng.expovariate(self.rate_rps)
+        raise ValueError(f"{self.name}: unknown think_time distribution: {dist}")
+
+
+@dataclass
+class Workload:
+    """A weighted request mix loaded from a scenario file."""
+
+    name: str
+    duration_s: float
+    concurrency: int
+    prefer_internal: bool
+    entries: List[WorkloadEntry]
+
+
+# Relative disagreement tolerated between a think-time distribution's mean
+# and the entry's rate.
+THINK_TIME_MEAN_TOLERANCE = 0.01
+
+
+def _think_time_for_rate(
+    name: str, rate: float, think_time: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    ``think_time`` with a mean of exactly ``1 / rate``.
+
+    A uniform range missing a bound gets the one that centres it on the
+    mean. Parameters that imply a different mean, or a normal spread wide
+    enough for clipping at zero to raise the mean, are rejected: the
+    reported target rate must be the rate that is sent.
+    """
+    mean = 1.0 / rate
+    think_time = dict(think_time)
+    dist = think_time.get("distribution", "exponential")
+
+    def disagree(implied: float) -> bool:
+        return abs(implied - mean) > THINK_TIME_MEAN_TOLERANCE * mean
+
+    if dist not in ("constant", "uniform", "normal", "exponential"):
+        raise ValueError(f"{name}: unknown think_time distribution: {dist}")
+    if "mean_s" in think_time and disagree(float(think_time["mean_s"])):
+        raise ValueError(
+            f"{name}: think_time mean_s {think_time['mean_s']} does not match "
+            f"rate {rate:.3g} rps (mean {mean:.3g}s)"
+        )
+    if dist == "uniform":
+        lo, hi = think_time.get("min_s"), think_time.get("max_s")
+        if lo is None and hi is None:
+            lo, hi = 0.0, 2 * mean
+        elif hi is None:
+            lo = float(lo)
+            hi = 2 * mean - lo
+        elif lo is None:
+            hi = float(hi)
+            lo = 2 * mean - hi
+        lo, hi = float(lo), float(hi)
+        if lo < 0 or hi < lo or disagree((lo + hi) / 2):
+            raise ValueError(
+                f"{name}: uniform think_time [{lo:.3g}s, {hi:.3g}s] cannot average "
+                f"{mean:.3g}s for rate {rate:.3g} rps"
+            )
+        think_time["min_s"], think_time["max_s"] = lo, hi
+    elif dist == "normal":
+        if float(think_time.get("stddev_s", mean / 4)) > mean / 3:
+            raise ValueError(
+                f"{name}: normal think_time stddev_s above mean/3 ({mean / 3:.3g}s) "
+                "would be clipped at zero and miss the rate"
+            )
+    return think_time
+
+
+def load_workload(path: str) -> Workload:
+    """
+    Load a workload mix from a JSON or TOML scenario file.
+
+    Each entry names a service from ``ENDPOINTS`` and either an explicit
+    ``rate`` (requests/second) or a ``weight`` that shares the top-level
+    ``rate`` with the other weighted entries. An entry's ``think_time``
+    distribution must average ``1 / rate`` (see ``_think_time_for_rate``).
+    """
+    with open(path, "rb") as f:
+        if path.endswith(".toml"):
+            if tomllib is None:
+                raise ValueError("TOML workload files need Python 3.11+")
+            raw = tomllib.load(f)
+        else:
+            raw = json.load(f)
+
+    entries_raw = raw.get("entries", [])
+    if not entries_raw:
+        raise ValueError(f"{path}: workload has no entries")
+
+    total_rate = float(raw.get("rate", 0))
+    total_weight = sum(
+        float(e.get("weight", 0)) for e in entries_raw if "rate" not in e
+    )
+
+    entries = []
+    for i, e in enumerate(entries_raw):
+        name = e.get("name", f"entry_{i}")
+        if e.get("service") not in ENDPOINTS:
+            raise ValueError(f"{name}: unknown service: {e.get('service')}")
+
+        if "rate" in e:
+            rate = float(e["rate"])
+        elif total_weight > 0:
+            rate = total_rate * float(e.get("weight", 0)) / total_weight
+        else:
+            rate = 0.0
+        if rate <= 0:
+            raise ValueError(f"{name}: needs a positive rate or weight")
+
+        entries.append(
+            WorkloadEntry(
+                name=name,
+                service=e["service"],
+                method=e.get("method", "GET").upper(),
+                path=e.get("path", "/"),
+                rate_rps=rate,
+                payloads=e.get("payloads", []),
+                headers=e.get("headers", {}),
+                think_time=_think_time_for_rate(name, rate, e.get("think_time", {})),
+            )
+        )
+
+    return Workload(
+        name=raw.get("name", os.path.splitext(os.path.basename(path))[0]),
+        duration_s=float(raw.get("duration_s", 30)),
+        concurrency=int(raw.get("concurrency", 16)),
+        prefer_internal=bool(raw.get("prefer_internal", True)),
+        entries=entries,
+    )
+
+
+def _render_payload(template: Any, seq: int, rng: random.Random) -> Any:
+    """Fill ``{seq}`` / ``{rand}`` placeholders in a payload template."""
+    if isinstance(template, str):
+        return template.replace("{seq}", str(seq)).replace(
+            "{rand}", str(rng.randint(100, 999))
+        )
+    if isinstance(template, dict):
+        return {k: _render_payload(v, seq, rng) for k, v in template.items()}
+    if isinstance(template, list):
+        return [_render_payload(v, seq, rng) for v in template]
+    return template
+
+
+def _latency_stats(latencies: List[float]) -> Dict[str, float]:
+    return {
+        "avg_latency_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0,
+        "p50_latency_ms": round(percentile(latencies, 0.50), 2),
+        "p95_latency_ms": round(percentile(latencies, 0.95), 2),
+        "p99_latency_ms": round(percentile(latencies, 0.99), 2),
+    }
+
+
+@instrumented
+def run_mixed_load(
+    workload: Workload,
+    duration_s: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> GameDayResult:
+    """
+    Drive every entry of a workload mix concurrently from one scheduler.
+
+    Sends are open-loop: a single heap orders the next send time of every
+    stream and dispatches onto a bounded worker pool, so slow responses
+    show up as latency (and send drift) instead of silently lowering RPS.
+    """
+    print(f"\n{'='*60}")
+    print(f"GAME DAY SCENARIO: Mixed Load ({workload.name})")
+    print(f"{'='*60}")
+
+    duration_s = duration_s or workload.duration_s
+    rng = random.Random(seed)
+    # Payloads draw from their own generator, in send order, so a seed
+    # reproduces both the schedule and the bodies.
+    payload_rng = random.Random(None if seed is None else f"{seed}:payloads")
+    monitor = current_monitor()
+    if monitor:
+        monitor.pool_size = workload.concurrency
+
+    for entry in workload.entries:
+        print(
+            f"  {entry.name}: {entry.method} {entry.service}{entry.path} "
+            f"@ {entry.rate_rps:.1f} rps"
+        )
+
+    stats = {
+        e.name: {"latencies": [], "success": 0, "errors": 0, "error_samples": []}
+        for e in workload.entries
+    }
+    stats_lock = threading.Lock()
+    busy = 0
+
+    def send(entry: WorkloadEntry, scheduled: float, kwargs: Dict[str, Any]) -> None:
+        nonlocal busy
+        if monitor:
+            monitor.record_send(scheduled, time.perf_counter())
+
+        base = get_endpoint(entry.service, workload.prefer_internal)
+        result = timed_request(entry.method, f"{base}{entry.path}", **kwargs)
+
+        with stats_lock:
+            busy -= 1
+            s = stats[entry.name]
+            s["latencies"].append(result["latency_ms"])
+            if result["success"]:
+                s["success"] += 1
+            else:
+                s["errors"] += 1
+                if len(s["error_samples"]) < 5:
+                    s["error_samples"].append(result["error"])
+
+    start_time = time.time()
+    t0 = time.perf_counter()
+    deadline = t0 + duration_s
+
+    heap = [(t0 + e.next_gap(rng), i) for i, e in enumerate(workload.entries)]
+    heapq.heapify(heap)
+    seq = 0
+
+    with ThreadPoolExecutor(max_workers=workload.concurrency) as pool:
+        while heap:
+            due, idx = heapq.heappop(heap)
+            if due >= deadline:
+                continue
+
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            entry = workload.entries[idx]
+            seq += 1
+            kwargs: Dict[str, Any] = {"headers": entry.headers}
+            if entry.payloads:
+                template = payload_rng.choice(entry.payloads)
+                kwargs["json"] = _render_payload(template, seq, payload_rng)
+            with stats_lock:
+                if busy >= workload.concurrency and monitor:
+                    monitor.record_pool_wait()
+                busy += 1
+            pool.submit(send, entry, due, kwargs)
+
+            heapq.heappush(heap, (due + entry.next_gap(rng), idx))
+
+    duration = (time.time() - start_time) * 1000
+    elapsed_s = duration / 1000
+
+    per_entry = {}
+    success_count = error_count = 0
+    for entry in workload.entries:
+        s = stats[entry.name]
+        total = s["success"] + s["errors"]
+        success_count += s["success"]
+        error_count += s["errors"]
+        per_entry[entry.name] = {
+            "service": entry.service,
+            "target_rps": round(entry.rate_rps, 2),
+            "achieved_rps": round(total / elapsed_s, 2) if elapsed_s else 0,
+            "requests": total,
+            "success": s["success"],
+            "errors": s["errors"],
+            **_latency_stats(s["latencies"]),
+            "error_samples": s["error_samples"],
+        }
+
+    status = (
+        "passed" if error_count == 0 else ("partial" if success_count > 0 else "failed")
+    )
+
+    print(f"\n{'='*60}")
+    print(f"RESULTS: {status.upper()}")
+    for name, e in per_entry.items():
+        print(
+            f"  {name}: {e['success']}/{e['requests']} ok, "
+            f"{e['achieved_rps']:.1f}/{e['target_rps']:.1f} rps, "
+            f"p95 {e['p95_latency_ms']:.0f}ms"
+        )
+    print(f"{'='*60}")
+
+    return GameDayResult(
+        scenario="mixed_load",
+        status=status,
+        duration_ms=duration,
+        details={
+            "workload": workload.name,
+            "total_requests": success_count + error_count,
+            "success": success_count,
+            "errors": error_count,
+            "entries": per_entry,
+        },
+        timestamp=datetime.utcnow().isoformat(),
+    )
+
+
+# =============================================================================
+# Scenario: Connection Churn
+# =============================================================================
+
+
+def _open_connection(
+    url: str, timeout: float
+) -> Tuple[http.client.HTTPConnection, float]:
+    """Open a raw HTTP(S) connection and return it with its connect time."""
+    parts = urlsplit(url)
+    cls = (
+        http.client.HTTPSConnection
+        if parts.scheme == "https"
+        else http.client.HTTPConnection
+    )
+    conn = cls(parts.hostname, parts.port, timeout=timeout)
+    start = time.perf_counter()
+    with PROFILER.phase("connect"):
+        conn.connect()
+    PROFILER.count("connections opened")
+    connect_ms = (time.perf_counter() - start) * 1000
+    # Match urllib3, which disables Nagle on every socket it opens.
+    conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return conn, connect_ms
+
+
+def _run_connection_mode(
+    url: str,
+    keep_alive: bool,
+    rps: float,
+    duration_s: float,
+    concurrency: int,
+    server_metrics_url: Optional[str],
+) -> Dict[str, Any]:
+    """Send GETs at a fixed rate with either pooled or per-request connections."""
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    headers = {"Connection": "keep-alive" if keep_alive else "close"}
+
+    monitor = current_monitor()
+    local = threading.local()
+    lock = threading.Lock()
+    pooled: List[http.client.HTTPConnection] = []
+    latencies: List[float] = []
+    connect_times: List[float] = []
+    errors: List[str] = []
+    success = 0
+
+    def retire(conn: http.client.HTTPConnection) -> None:
+        """Close a worker's keep-alive connection that cannot be reused."""
+        conn.close()
+        local.conn = None
+        with lock:
+            if conn in pooled:
+                pooled.remove(conn)
+
+    def send(scheduled: float) -> None:
+        nonlocal success
+        if monitor:
+            monitor.record_send(scheduled, time.perf_counter())
+            monitor.request_started()
+
+        start = time.perf_counter()
+        connect_ms = None
+        error = None
+        conn = getattr(local, "conn", None) if keep_alive else None
+        try:
+            if conn is None:
+                conn, connect_ms = _open_connection(url, timeout=5)
+                if keep_alive:
+                    local.conn = conn
+                    with lock:
+                        pooled.append(conn)
+            with PROFILER.phase("http"):
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            PROFILER.count("http requests")
+            PROFILER.count("bytes received", len(body))
+            if response.status >= 400:
+                error = f"HTTP {response.status}"
+            if keep_alive and response.will_close:
+                retire(conn)
+        except (OSError, http.client.HTTPException) as e:
+            error = str(e) or type(e).__name__
+            if keep_alive and conn is not None:
+                retire(conn)
+        finally:
+            if not keep_alive and conn is not None:
+                conn.close()
+            if monitor:
+                monitor.request_finished()
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.append(latency_ms)
+            if connect_ms is not None:
+                connect_times.append(connect_ms)
+            if error:
+                errors.append(error)
+            else:
+                success += 1
+
+    client_fds: List[int] = []
+    server_fds: List[float] = []
+    sampling = threading.Event()
+
+    def sample_fds() -> None:
+        while not sampling.wait(1.0):
+            fds = _open_fd_count()
+            if fds is not None:
+                client_fds.append(fds)
+            if server_metrics_url:
+                metrics = scrape_metrics(server_metrics_url, timeout=1)
+                if metrics and "process_open_fds" in metrics:
+                    server_fds.append(metrics["process_open_fds"])
+
+    client_fd_baseline = _open_fd_count()
+    server_baseline = scrape_metrics(server_metrics_url) if server_metrics_url else None
+    sampler = threading.Thread(target=sample_fds, daemon=True)
+    sampler.start()
+
+    interval = 1.0 / rps
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for i in range(int(rps * duration_s)):
+            due = t0 + i * interval
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(send, due)
+    elapsed_s = time.perf_counter() - t0
+
+    sampling.set()
+    sampler.join()
+    for conn in pooled:
+        conn.close()
+
+    return {
+        "mode": "keep_alive" if keep_alive else "new_connection",
+        "requests": len(latencies),
+        "success": success,
+        "errors": len(errors),
+        "achieved_rps": round(len(latencies) / elapsed_s, 2) if elapsed_s else 0,
+        "connections_opened": len(connect_times),
+        "connect_p50_ms": round(percentile(connect_times, 0.50), 2),
+        "connect_p95_ms": round(percentile(connect_times, 0.95), 2),
+        "connect_p99_ms": round(percentile(connect_times, 0.99), 2),
+        "connect_max_ms": round(max(connect_times), 2) if connect_times else 0,
+        **_latency_stats(latencies),
+        "client_fds_baseline": client_fd_baseline,
+        "client_fds_peak": max(client_fds) if client_fds else None,
+        "server_fds_baseline": (server_baseline or {}).get("process_open_fds"),
+        "server_fds_peak": max(server_fds) if server_fds else None,
+        "error_samples": errors[:5],
+    }
+
+
+@instrumented
+def run_connection_churn(
+    target_url: Optional[str] = None,
+    rps: float = 20,
+    duration_s: float = 15,
+    concurrency: int = 8,
+    server_metrics_url: Optional[str] = None,
+) -> GameDayResult:
+    """
+    Compare new-connection-per-request against pooled keep-alive.
+
+    Both modes run at the same fixed RPS so the difference in latency,
+    connect-time distribution and file descriptors (client, and server when
+    ``server_metrics_url`` exposes ``process_open_fds``) is the cost of
+    connection setup alone.
+    """
+    print(f"\n{'='*60}")
+    print("GAME DAY SCENARIO: Connection Churn")
+    print(f"{'='*60}")
+
+    url = target_url or f"{get_endpoint('rust_api')}/health"
+    print(f"Target: {url}")
+    print(f"Rate: {rps} rps for {duration_s}s per mode")
+
+    monitor = current_monitor()
+    if monitor:
+        monitor.pool_size = concurrency
+
+    start_time = time.time()
+    modes = {}
+    for keep_alive in (False, True):
+        summary = _run_connection_mode(
+            url, keep_alive, rps, duration_s, concurrency, server_metrics_url
+        )
+        modes[summary["mode"]] = summary
+        print(
+            f"  {summary['mode']}: {summary['success']}/{summary['requests']} ok, "
+            f"{summary['connections_opened']} connects "
+            f"(p95 {summary['connect_p95_ms']:.1f}ms), "
+            f"p95 latency {summary['p95_latency_ms']:.0f}ms, "
+            f"client fds peak {summary['client_fds_peak']}"
+        )
+
+    duration = (time.time() - start_time) * 1000
+    churn, pooled = modes["new_connection"], modes["keep_alive"]
+    total_errors = churn["errors"] + pooled["errors"]
+    total_success = churn["success"] + pooled["success"]
+    status = (
+        "passed"
+        if total_errors == 0
+        else ("partial" if total_success > 0 else "failed")
+    )
+
+    print(f"\n{'='*60}")
+    print(f"RESULTS: {status.upper()}")
+    print(
+        f"  Connection setup overhead (p50): "
+        f"{churn['p50_latency_ms'] - pooled['p50_latency_ms']:.1f}ms"
+    )
+    print(f"{'='*60}")
+
+    return GameDayResult(
+        scenario="connection_churn",
+        status=status,
+        duration_ms=duration,
+        details={
+            "target": url,
+            "rps": rps,
+            "duration_s_per_mode": duration_s,
+            "modes": modes,
+            "setup_overhead_p50_ms": round(
+                churn["p50_latency_ms"] - pooled["p50_latency_ms"], 2
+            ),
+        },
+        timestamp=datetime.utcnow().isoformat(),
+    )
+
+
+# =============================================================================
+# Scenario: Soak
+# =============================================================================
+
+
+class TrendTracker:
+    """
+    Constant-memory linear trend over an unbounded time series.
+
+    The least-squares fit is maintained with running co-moments, so hours of
+    samples cost the same as ten. A bounded window of recent points gives
+    the short-term level for comparison with the whole-run baseline.
+    """
+
+    def __init__(self, window: int = 120):
+        self.n = 0
+        self.first: Optional[float] = None
+        self.last: Optional[float] = None
+        self._mean_x = 0.0
+        self._mean_y = 0.0
+        self._m2_x = 0.0
+        self._m2_y = 0.0
+        self._c_xy = 0.0
+        self.recent: deque = deque(maxlen=window)
+
+    def add(self, x: float, y: float) -> None:
+        self.n += 1
+        if self.first is None:
+            self.first = y
+        self.last = y
+        self.recent.append(y)
+
+        dx = x - self._mean_x
+        self._mean_x += dx / self.n
+        dy = y - self._mean_y
+        self._mean_y += dy / self.n
+        self._m2_x += dx * (x - self._mean_x)
+        self._m2_y += dy * (y - self._mean_y)
+        self._c_xy += dx * (y - self._mean_y)
+
+    @property
+    def slope(self) -> float:
+        return self._c_xy / self._m2_x if self._m2_x else 0.0
+
+    @property
+    def r2(self) -> float:
+        if not self._m2_x or not self._m2_y:
+            return 0.0
+        return (self._c_xy * self._c_xy) / (self._m2_x * self._m2_y)
+
+    def summary(self) -> Dict[str, Any]:
+        slope_per_hour = self.slope * 3600
+        growth = slope_per_hour / self._mean_y if self._mean_y else 0.0
+        recent_mean = sum(self.recent) / len(self.recent) if self.recent else 0.0
+        return {
+            "samples": self.n,
+            "first": self.first,
+            "last": self.last,
+            "mean": round(self._mean_y, 3),
+            "recent_mean": round(recent_mean, 3),
+            "slope_per_hour": round(slope_per_hour, 3),
+            "relative_growth_per_hour": round(growth, 4),
+            "r2": round(self.r2, 3),
+        }
+
+    def is_degrading(self, threshold: float, min_samples: int = 10) -> bool:
+        """True for a steady (r2 >= 0.6) upward trend above ``threshold``/hour."""
+        s = self.summary()
+        return (
+            self.n >= min_samples
+            and s["r2"] >= 0.6
+            and s["relative_growth_per_hour"] >= threshold
+        )
+
+
+@instrumented
+def run_soak(
+    target_url: Optional[str] = None,
+    rps: float = 10,
+    duration_s: float = 3600,
+    scrape_interval_s: float = 30,
+    concurrency: int = 8,
+    metrics_urls: Optional[Dict[str, str]] = None,
+) -> GameDayResult:
+    """
+    Run steady load for a long period and flag slow resource leaks.
+
+    Every ``scrape_interval_s`` the target ``/metrics`` endpoints are scraped
+    for RSS, goroutine and FD counts, and the client p95 latency of the last
+    interval is recorded. Each series feeds a TrendTracker, so memory use
+    stays flat however long the soak runs. At most ``concurrency`` sends
+    are in flight; a send due while all are busy is skipped and counted
+    rather than queued, so a hung target cannot build an unbounded backlog.
+    """
+    print(f"\n{'='*60}")
+    print("GAME DAY SCENARIO: Soak")
+    print(f"{'='*60}")
+
+    url = target_url or f"{get_endpoint('rust_api')}/manuscript/sync"
+    metrics_urls = metrics_urls or {
+        "go-controller": f"{get_endpoint('go_controller')}/metrics",
+        "prometheus": f"{get_endpoint('prometheus')}/metrics",
+    }
+    print(f"Target: {url}")
+    print(f"Rate: {rps} rps for {duration_s:.0f}s (scrape every {scrape_interval_s}s)")
+
+    monitor = current_monitor()
+    if monitor:
+        monitor.pool_size = concurrency
+
+    lock = threading.Lock()
+    interval_latencies: List[float] = []
+    counts = {"success": 0, "errors": 0, "skipped": 0}
+    error_samples: deque = deque(maxlen=5)
+    busy = 0
+
+    def send(scheduled: float, seq: int) -> None:
+        nonlocal busy
+        if monitor:
+            monitor.record_send(scheduled, time.perf_counter())
+        payload = {"project_id": f"soak_{seq % 1000}", "content": f"Soak {seq}"}
+        result = timed_request("POST", url, json=payload)
+        with lock:
+            busy -= 1
+            interval_latencies.append(result["latency_ms"])
+            if result["success"]:
+                counts["success"] += 1
+            else:
+                counts["errors"] += 1
+                error_samples.append(result["error"])
+
+    trends: Dict[str, Dict[str, TrendTracker]] = {
+        name: {key: TrendTracker() for key in SOAK_TRACKED_METRICS}
+        for name in metrics_urls
+    }
+    latency_trend = TrendTracker()
+    scrape_failures = {name: 0 for name in metrics_urls}
+    stop = threading.Event()
+    t0 = time.perf_counter()
+
+    def scrape_loop() -> None:
+        while not stop.wait(scrape_interval_s):
+            elapsed = time.perf_counter() - t0
+            with lock:
+                window = interval_latencies[:]
+                interval_latencies.clear()
+            if window:
+                latency_trend.add(elapsed, percentile(window, 0.95))
+
+            for name, metrics_url in metrics_urls.items():
+                metrics = scrape_metrics(metrics_url)
+                if metrics is None:
+                    scrape_failures[name] += 1
+                    continue
+                for key, series in SOAK_TRACKED_METRICS.items():
+                    if series in metrics:
+                        trends[name][key].add(elapsed, metrics[series])
+
+            print(
+                f"  [{elapsed:>6.0f}s] p95 {percentile(window, 0.95):.0f}ms, "
+                f"ok {counts['success']}, errors {counts['errors']}, "
+                f"skipped {counts['skipped']}"
+            )
+
+    scraper = threading.Thread(target=scrape_loop, name="soak-scraper", daemon=True)
+    start_time = time.time()
+    scraper.start()
+
+    interval = 1.0 / rps
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        seq = 0
+        while True:
+            due = t0 + seq * interval
+            if due - t0 >= duration_s:
+                break
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            seq += 1
+            with lock:
+                if busy >= concurrency:
+                    counts["skipped"] += 1
+                    if monitor:
+                        monitor.record_pool_wait()
+                    continue
+                busy += 1
+            pool.submit(send, due, seq - 1)
+
+    stop.set()
+    scraper.join()
+    duration = (time.time() - start_time) * 1000
+
+    flags = []
+    resources: Dict[str, Dict[str, Any]] = {}
+    for name, by_key in trends.items():
+        resources[name] = {}
+        for key, tracker in by_key.items():
+            if not tracker.n:
+                continue
+            resources[name][key] = tracker.summary()
+            if tracker.is_degrading(SOAK_GROWTH_THRESHOLDS[key]):
+                flags.append(f"{name}:{key}")
+    if latency_trend.is_degrading(SOAK_GROWTH_THRESHOLDS["latency_p95_ms"]):
+        flags.append("client:latency_p95_ms")
+
+    success_count, error_count = counts["success"], counts["errors"]
+    skipped = counts["skipped"]
+    status = (
+        "passed" if error_count == 0 else ("partial" if success_count > 0 else "failed")
+    )
+    if (flags or skipped) and status == "passed":
+        status = "partial"
+
+    print(f"\n{'='*60}")
+    print(f"RESULTS: {status.upper()}")
+    print(f"  Success: {success_count}/{success_count + error_count}")
+    if skipped:
+        print(f"  ⚠ Skipped {skipped} sends with all {concurrency} workers busy")
+    for name, by_key in resources.items():
+        for key, summary in by_key.items():
+            print(
+                f"  {name} {key}: {summary['first']} -> {summary['last']} "
+                f"({summary['relative_growth_per_hour']:+.1%}/h, r2 {summary['r2']})"
+            )
+    if flags:
+        print(f"  ⚠ Degradation flagged: {', '.join(flags)}")
+    print(f"{'='*60}")
+
+    return GameDayResult(
+        scenario="soak",
+        status=status,
+        duration_ms=duration,
+        details={
+            "target": url,
+            "rps": rps,
+            "total_requests": success_count + error_count,
+            "success": success_count,
+            "errors": error_count,
+            "skipped_sends": skipped,
+            "latency_p95_trend": latency_trend.summary(),
+            "resources": resources,
+            "scrape_failures": scrape_failures,
+            "degradation_flags": flags,
+            "error_samples": list(error_samples),
+        },
+        timestamp=datetime.utcnow().isoformat(),
+    )
+
+
+# =============================================================================
+# Scenario: Loki Error Correlation
+# =============================================================================
+
+_JSON_STRUCT_RE = re.compile(r'["{}\[\]:,]')
+_JSON_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+def _with_end(chunks: Iterable[bytes]) -> Iterator[Optional[bytes]]:
+    yield from chunks
+    yield None
+
+
+def iter_loki_entries(
+    chunks: Iterable[bytes],
+) -> Iterator[Tuple[Dict[str, str], int, str]]:
+    """
+    Stream ``(labels, timestamp_ns, line)`` out of a Loki streams response.
+
+    Only structural characters are scanned; each ``stream`` label set and
+    each ``values`` pair is decoded on its own once fully buffered, so
+    memory is bounded by one chunk plus one log line regardless of the
+    response size.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    # Each frame is [kind, key, expecting_key] for "{" or [kind, owner_key] for "[".
+    stack: List[list] = []
+    labels: Dict[str, str] = {}
+    buf = ""
+
+    for chunk in _with_end(chunks):
+        buf += utf8.decode(b"", final=True) if chunk is None else utf8.decode(chunk)
+        pos = 0
+        while True:
+            m = _JSON_STRUCT_RE.search(buf, pos)
+            if not m:
+                pos = len(buf)
+                break
+            i = m.start()
+            c = buf[i]
+            top = stack[-1] if stack else None
+
+            capture = top is not None and (
+                (c == "[" and top[0] == "[" and top[1] == "values")
+                or (c == "{" and top[0] == "{" and top[1] == "stream" and not top[2])
+            )
+            if capture:
+                try:
+                    value, end = decoder.raw_decode(buf, i)
+                except json.JSONDecodeError:
+                    pos = i  # incomplete; wait for the next chunk
+                    break
+                if c == "{":
+                    labels = value
+                else:
+                    yield labels, int(value[0]), value[1]
+                pos = end
+                continue
+
+            if c == '"':
+                sm = _JSON_STRING_RE.match(buf, i)
+                if not sm:
+                    pos = i
+                    break
+                if top is not None and top[0] == "{" and top[2]:
+                    top[1] = json.loads(sm.group())
+                pos = sm.end()
+                continue
+
+            if c == "{":
+                stack.append(["{", None, True])
+            elif c == "[":
+                owner = top[1] if top is not None and top[0] == "{" else None
+                stack.append(["[", owner])
+            elif c in "}]":
+                if stack:
+                    stack.pop()
+            elif c == ":" and top is not None and top[0] == "{":
+                top[2] = False
+            elif c == "," and top is not None and top[0] == "{":
+                top[2] = True
+            pos = i + 1
+
+        buf = buf[pos:]
+
+
+def query_loki_range(
+    query: str,
+    start_ns: int,
+    end_ns: int,
+    limit: int = LOKI_PAGE_LIMIT,
+    base_url: Optional[str] = None,
+) -> Iterator[Tuple[Dict[str, str], int, str]]:
+    """
+    Yield every entry matching ``query`` in ``[start_ns, end_ns]``.
+
+    Pages forward through ``query_range`` in ``limit``-sized requests and
+    stream-parses each response, so arbitrarily large windows are read in
+    bounded memory.
+    """
+    url = f"{base_url or get_endpoint('loki')}/loki/api/v1/query_range"
+    cursor = start_ns
+
+    while cursor <= end_ns:
+        params = {
+            "query": query,
+            "start": str(cursor),
+            "end": str(end_ns),
+            "limit": str(limit),
+            "direction": "forward",
+        }
+        # Only the request is timed: the body is parsed as the caller
+        # consumes entries, so its time lands in the caller's phase.
+        with PROFILER.phase("http"):
+            response = requests.get(url, params=params, stream=True, timeout=30)
+        PROFILER.count("http requests")
+        with response:
+            response.raise_for_status()
+            count = 0
+            last_ts = cursor
+            for entry in iter_loki_entries(response.iter_content(64 * 1024)):
+                count += 1
+                last_ts = max(last_ts, entry[1])
+                yield entry
+        PROFILER.count("loki entries", count)
+
+        if count < limit:
+            break
+        cursor = last_ts + 1
+
+
+def _pearson(xs: List[float], ys: List[float]) -> Optional[float]:
+    """Pearson correlation of two equal-length series (None without variance)."""
+    n = len(xs)
+    if n < 2:
+        return None
+    mx = sum(xs) / n
+    my = sum(ys) / n
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    sxx = sum((x - mx) ** 2 for x in xs)
+    syy = sum((y - my) ** 2 for y in ys)
+    if not sxx or not syy:
+        return None
+    return sxy / (sxx * syy) ** 0.5
+
+
+@instrumented
+def run_loki_errors(
+    target_url: Optional[str] = None,
+    rps: float = 10,
+    duration_s: float = 60,
+    interval_s: float = 10,
+    ingest_wait_s: float = 5,
+    query: str = LOKI_ERROR_QUERY,
+    loki_url: Optional[str] = None,
+) -> GameDayResult:
+    """
+    Correlate client-side errors with error-level logs in Loki.
+
+    Runs a fixed-rate load phase (skipped when ``rps`` is 0, in which case
+    the last ``duration_s`` are queried), waits for log ingestion, then
+    streams the matching Loki entries for the run window and compares both
+    error counts per ``interval_s`` bucket.
+    """
+    print(f"\n{'='*60}")
+    print("GAME DAY SCENARIO: Loki Error Correlation")
+    print(f"{'='*60}")
+
+    url = target_url or f"{get_endpoint('rust_api')}/manuscript/sync"
+    start_time = time.time()
+    client_errors: Counter = Counter()
+    client_requests = 0
+
+    if rps > 0:
+        print(f"Target: {url}")
+        print(f"Rate: {rps} rps for {duration_s:.0f}s")
+        monitor = current_monitor()
+        interval = 1.0 / rps
+        t0 = time.perf_counter()
+        for i in range(int(rps * duration_s)):
+            due = t0 + i * interval
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            if monitor:
+                monitor.record_send(due, time.perf_counter())
+            payload = {"project_id": f"loki_{i}", "content": "Loki correlation"}
+            result = timed_request("POST", url, json=payload)
+            client_requests += 1
+            if not result["success"]:
+                client_errors[int((time.time() - start_time) // interval_s)] += 1
+        window_start, window_end = start_time, time.time()
+
+        print(f"  Waiting for log ingestion ({ingest_wait_s:.0f}s)...")
+        time.sleep(ingest_wait_s)
+    else:
+        window_end = start_time
+        window_start = window_end - duration_s
+
+    print(f"  Querying Loki: {query}")
+    log_errors: Counter = Counter()
+    by_stream: Counter = Counter()
+    log_total = 0
+    query_error = None
+    try:
+        for labels, ts_ns, _line in query_loki_range(
+            query,
+            int(window_start * 1e9),
+            int(window_end * 1e9),
+            base_url=loki_url,
+        ):
+            log_total += 1
+            log_errors[int((ts_ns / 1e9 - window_start) // interval_s)] += 1
+            by_stream[",".join(f"{k}={v}" for k, v in sorted(labels.items()))] += 1
+    except requests.exceptions.RequestException as e:
+        query_error = str(e)
+        print(f"  ✗ Loki query failed: {e}")
+
+    buckets = int((window_end - window_start) // interval_s) + 1
+    client_series = [client_errors.get(b, 0) for b in range(buckets)]
+    log_series = [log_errors.get(b, 0) for b in range(buckets)]
+    correlation = _pearson(client_series, log_series)
+    client_total = sum(client_series)
+
+    duration = (time.time() - start_time) * 1000
+    if query_error:
+        status = "failed"
+    elif client_total and not log_total:
+        # Errors the client saw never reached Loki: the loop is broken.
+        status = "partial"
+    else:
+        status = "passed"
+
+    print(f"\n{'='*60}")
+    print(f"RESULTS: {status.upper()}")
+    print(f"  Client errors: {client_total}/{client_requests}")
+    print(f"  Loki error lines: {log_total}")
+    if correlation is not None:
+        print(f"  Per-interval correlation: {correlation:.2f}")
+    print(f"{'='*60}")
+
+    return GameDayResult(
+        scenario="loki_errors",
+        status=status,
+        duration_ms=duration,
+        details={
+            "query": query,
+            "window_start": datetime.utcfromtimestamp(window_start).isoformat(),
+            "window_end": datetime.utcfromtimestamp(window_end).isoformat(),
+            "interval_s": interval_s,
+            "client_requests": client_requests,
+            "client_errors": client_total,
+            "log_errors": log_total,
+            "client_errors_per_interval": client_series,
+            "log_errors_per_interval": log_series,
+            "correlation": round(correlation, 3) if correlation is not None else None,
+            "log_errors_by_stream": dict(by_stream.most_common(10)),
+            "query_error": query_error,
+        },
+        timestamp=datetime.utcnow().isoformat(),
+    )
+
+
+# =============================================================================
+# Scenario: OpenAPI Contract Load
+# =============================================================================
+
+# The published contract, at the root of the Atlas docs tree.
+OPENAPI_SPEC = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "openapi", "openapi.json"
+)
+OPENAPI_METHODS = ("get", "put", "post", "delete", "patch", "head", "options")
+
+# Read-heavy default mix; an operation's ``x-game-day-weight`` overrides it.
+OPENAPI_METHOD_WEIGHTS = {
+    "get": 4.0,
+    "head": 1.0,
+    "options": 1.0,
+    "post": 2.0,
+    "put": 2.0,
+    "patch": 2.0,
+    "delete": 1.0,
+}
+
+# Share of requests built from spec examples, random valid values and
+# boundary values (min/max lengths, ranges and item counts).
+OPENAPI_VALUE_MODES = {"example": 0.5, "random": 0.3, "boundary": 0.2}
+
+# Upper bounds of the per-operation latency histogram buckets.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+INT_FORMAT_BOUNDS = {
+    "int32": (-(2**31), 2**31 - 1),
+    "int64": (-(2**63), 2**63 - 1),
+}
+
+# Bearer token sent to operations whose spec requires security.
+API_TOKEN_ENV = "ATLAS_API_TOKEN"
+
+
+def _deref(spec: Dict[str, Any], node: Any) -> Any:
+    """Follow local ``$ref`` pointers (``#/components/...``) to their target."""
+    hops = 0
+    while isinstance(node, dict) and "$ref" in node:
+        ref = node["$ref"]
+        if not ref.startswith("#/"):
+            raise ValueError(f"unsupported $ref (only local refs): {ref}")
+        node = spec
+        for part in ref[2:].split("/"):
+            node = node[part.replace("~1", "/").replace("~0", "~")]
+        hops += 1
+        if hops > 32:
+            raise ValueError(f"$ref loop at {ref}")
+    return node
+
+
+def _schema_type(schema: Dict[str, Any]) -> Optional[str]:
+    typ = schema.get("type")
+    if isinstance(typ, list):  # OpenAPI 3.1: ["string", "null"]
+        typ = next((t for t in typ if t != "null"), "null")
+    if typ is None:
+        if "properties" in schema:
+            return "object"
+        if "items" in schema:
+            return "array"
+    return typ
+
+
+def _nullable(schema: Dict[str, Any]) -> bool:
+    typ = schema.get("type")
+    return bool(schema.get("nullable")) or (isinstance(typ, list) and "null" in typ)
+
+
+class SchemaSampler:
+    """
+    Generate request values from OpenAPI 3 schemas.
+
+    ``mode`` is ``example`` (the schema's ``example``/``default`` where
+    present, random otherwise), ``random`` (valid values) or ``boundary``
+    (values at the edges of ``minimum``/``maximum``, length and item
+    limits). Recursive schemas stop at ``max_depth`` with only required
+    properties.
+    """
+
+    def __init__(self, spec: Dict[str, Any], rng: random.Random, max_depth: int = 6):
+        self.spec = spec
+        self.rng = rng
+        self.max_depth = max_depth
+
+    def sample(self, schema: Any, mode: str = "random", depth: int = 0) -> Any:
+        schema = _deref(self.spec, schema or {})
+        rng = self.rng
+
+        if mode == "example":
+            if "example" in schema:
+                return schema["example"]
+            if isinstance(schema.get("examples"), list) and schema["examples"]:
+                return rng.choice(schema["examples"])
+            if "default" in schema:
+                return schema["default"]
+        if "const" in schema:
+            return schema["const"]
+        if schema.get("enum"):
+            values = schema["enum"]
+            return rng.choice([values[0], values[-1]] if mode == "boundary" else values)
+        if "allOf" in schema:
+            merged: Dict[str, Any] = {}
+            for part in schema["allOf"]:
+                value = self.sample(part, mode, depth)
+                if not isinstance(value, dict):
+                    return value
+                merged.update(value)
+            return merged
+        for key in ("oneOf", "anyOf"):
+            if schema.get(key):
+                return self.sample(rng.choice(schema[key]), mode, depth)
+
+        typ = _schema_type(schema)
+        if typ == "object":
+            return self._object(schema, mode, depth)
+        if typ == "array":
+            lo = int(schema.get("minItems", 0))
+            hi = int(schema.get("maxItems", lo + 3))
+            if depth >= self.max_depth:
+                n = lo
+            elif mode == "boundary":
+                n = rng.choice([lo, min(hi, lo + 50)])
+            else:
+                n = rng.randint(lo, min(hi, lo + 5))
+            return [
+                self.sample(schema.get("items", {}), mode, depth + 1) for _ in range(n)
+            ]
+        if typ == "integer":
+            lo, hi = self._range(
+                schema, INT_FORMAT_BOUNDS.get(schema.get("format"), (0, 1000))
+            )
+            lo, hi = int(math.ceil(lo)), int(math.floor(hi))
+            if mode == "boundary":
+                return rng.choice([lo, hi])
+            # Small non-negative values where legal, even for int64 ranges.
+            base = min(max(lo, 0), hi)
+            return rng.randint(base, min(hi, base + 1000))
+        if typ == "number":
+            lo, hi = self._range(schema, (0.0, 1000.0))
+            if mode == "boundary":
+                return rng.choice([float(lo), float(hi)])
+            return round(rng.uniform(lo, hi), 3)
+        if typ == "boolean":
+            return rng.random() < 0.5
+        if typ == "null":
+            return None
+        return self._string(schema, mode)
+
+    def _range(
+        self, schema: Dict[str, Any], default: Tuple[float, float]
+    ) -> Tuple[float, float]:
+        """Legal ``(low, high)``; ``default`` stands in for missing bounds."""
+        lo = schema.get("minimum", default[0])
+        hi = schema.get("maximum", default[1])
+        if hi < lo:
+            # e.g. minimum 5000 with the (0, 1000) default
+            hi = lo + default[1] - default[0]
+        step = 1 if _schema_type(schema) == "integer" else 1e-6
+        # 3.0 uses boolean exclusive flags, 3.1 numeric bounds.
+        ex_lo, ex_hi = schema.get("exclusiveMinimum"), schema.get("exclusiveMaximum")
+        if ex_lo is True:
+            lo += step
+        elif isinstance(ex_lo, (int, float)) and not isinstance(ex_lo, bool):
+            lo = ex_lo + step
+        if ex_hi is True:
+            hi -= step
+        elif isinstance(ex_hi, (int, float)) and not isinstance(ex_hi, bool):
+            hi = ex_hi - step
+        return lo, max(lo, hi)
+
+    def _object(self, schema: Dict[str, Any], mode: str, depth: int) -> Dict[str, Any]:
+        required = set(schema.get("required", ()))
+        out: Dict[str, Any] = {}
+        for name, prop in schema.get("properties", {}).items():
+            prop_schema = _deref(self.spec, prop)
+            if prop_schema.get("readOnly"):
+                continue
+            if name not in required:
+                if depth >= self.max_depth:
+                    continue
+                if mode != "boundary" and self.rng.random() < 0.5:
+                    continue
+            out[name] = self.sample(prop_schema, mode, depth + 1)
+        return out
+
+    def _string(self, schema: Dict[str, Any], mode: str) -> str:
+        rng = self.rng
+        fmt = schema.get("format")
+        if fmt == "date-time":
+            return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+        if fmt == "date":
+            return datetime.utcnow().date().isoformat()
+        if fmt == "uuid":
+            return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        if fmt == "email":
+            return f"gameday{rng.randint(0, 99999)}@example.com"
+        if fmt in ("uri", "url"):
+            return f"https://example.com/game-day/{rng.randint(0, 99999)}"
+        lo = int(schema.get("minLength", 1))
+        hi = int(schema.get("maxLength", lo + 256))
+        if mode == "boundary":
+            n = rng.choice([lo, hi])
+        else:
+            n = rng.randint(lo, min(hi, lo + 16))
+        return "".join(
+            rng.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(n)
+        )
+
+
+def validate_schema(
+    spec: Dict[str, Any], schema: Any, value: Any, path: str = "$", depth: int = 0
+) -> List[str]:
+    """
+    Check ``value`` against an OpenAPI 3 schema; returns violations.
+
+    Covers types, ``nullable``, ``enum``, ``required``, properties, items
+    (first 100) and ``allOf``/``oneOf``/``anyOf``; formats and patterns are
+    not checked.
+    """
+    schema = _deref(spec, schema or {})
+    if depth > 32:
+        return []
+    if value is None:
+        return [] if _nullable(schema) or not schema else [f"{path}: null"]
+    if "enum" in schema and value not in schema["enum"]:
+        return [f"{path}: {value!r} not in enum"]
+    for part in schema.get("allOf", ()):
+        errors = validate_schema(spec, part, value, path, depth + 1)
+        if errors:
+            return errors
+    for key in ("oneOf", "anyOf"):
+        options = schema.get(key)
+        if options and all(
+            validate_schema(spec, option, value, path, depth + 1) for option in options
+        ):
+            return [f"{path}: matches no {key} option"]
+
+    typ = _schema_type(schema)
+    checks = {
+        "object": lambda v: isinstance(v, dict),
+        "array": lambda v: isinstance(v, list),
+        "string": lambda v: isinstance(v, str),
+        "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+        "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+        "boolean": lambda v: isinstance(v, bool),
+    }
+    if typ in checks and not checks[typ](value):
+        return [f"{path}: expected {typ}, got {type(value).__name__}"]
+
+    errors: List[str] = []
+    if typ == "object":
+        for name in schema.get("required", ()):
+            if name not in value:
+                errors.append(f"{path}.{name}: missing")
+        for name, prop in schema.get("properties", {}).items():
+            if name in value:
+                errors.extend(
+                    validate_schema(
+                        spec, prop, value[name], f"{path}.{name}", depth + 1
+                    )
+                )
+    elif typ == "array" and "items" in schema:
+        for i, item in enumerate(value[:100]):
+            errors.extend(
+                validate_schema(spec, schema["items"], item, f"{path}[{i}]", depth + 1)
+            )
+    return errors
+
+
+@dataclass
+class ApiOperation:
+    """One operation of an OpenAPI spec, ready to generate requests for."""
+
+    op_id: str
+    method: str
+    path: str
+    weight: float
+    parameters: List[Dict[str, Any]]
+    body_schema: Optional[Dict[str, Any]]
+    body_example: Any
+    body_required: bool
+    responses: Dict[str, Any]
+    secured: bool
+
+
+def load_openapi_operations(path: str) -> Tuple[Dict[str, Any], List[ApiOperation]]:
+    """Load a JSON OpenAPI 3 spec and return it with its operations."""
+    with open(path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+
+    global_security = spec.get("security") or []
+    operations = []
+    for route, item in spec.get("paths", {}).items():
+        item = _deref(spec, item)
+        shared = [_deref(spec, p) for p in item.get("parameters", [])]
+        for method in OPENAPI_METHODS:
+            op = item.get(method)
+            if not isinstance(op, dict):
+                continue
+            params = {(p["name"], p["in"]): p for p in shared}
+            for p in op.get("parameters", []):
+                p = _deref(spec, p)
+                params[(p["name"], p["in"])] = p
+
+            body_schema = body_example = None
+            body_required = False
+            if "requestBody" in op:
+                body = _deref(spec, op["requestBody"])
+                media = body.get("content", {}).get("application/json")
+                if media is not None:
+                    body_schema = media.get("schema", {})
+                    body_example = media.get("example")
+                    if body_example is None and media.get("examples"):
+                        first = next(iter(media["examples"].values()))
+                        body_example = _deref(spec, first).get("value")
+                    body_required = bool(body.get("required"))
+
+            operations.append(
+                ApiOperation(
+                    op_id=op.get("operationId") or f"{method.upper()} {route}",
+                    method=method.upper(),
+                    path=route,
+                    weight=float(
+                        op.get("x-game-day-weight", OPENAPI_METHOD_WEIGHTS[method])
+                    ),
+                    parameters=list(params.values()),
+                    body_schema=body_schema,
+                    body_example=body_example,
+                    body_required=body_required,
+                    responses=op.get("responses", {}),
+                    secured=bool(op.get("security", global_security)),
+                )
+            )
+    if not operations:
+        raise ValueError(f"{path}: spec has no operations")
+    return spec, operations
+
+
+def _param_text(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def build_openapi_request(
+    op: ApiOperation, sampler: SchemaSampler, mode: str
+) -> Tuple[str, Dict[str, Any]]:
+    """Return ``(path, requests kwargs)`` for one call to ``op``."""
+    rng = sampler.rng
+    path = op.path
+    params: Dict[str, Any] = {}
+    headers: Dict[str, str] = {}
+    for p in op.parameters:
+        where = p.get("in")
+        if where != "path" and not p.get("required") and mode != "boundary":
+            if rng.random() < 0.5:
+                continue
+        if mode == "example" and "example" in p:
+            value = p["example"]
+        else:
+            value = sampler.sample(p.get("schema", {}), mode)
+        if where == "path":
+            path = path.replace(f"{{{p['name']}}}", quote(_param_text(value), safe=""))
+        elif where == "query":
+            if isinstance(value, list):
+                params[p["name"]] = [_param_text(v) for v in value]
+            else:
+                params[p["name"]] = _param_text(value)
+        elif where == "header":
+            headers[p["name"]] = _param_text(value)
+
+    kwargs: Dict[str, Any] = {"params": params, "headers": headers}
+    if op.body_schema is not None and (op.body_required or rng.random() < 0.5):
+        if mode == "example" and op.body_example is not None:
+            kwargs["json"] = op.body_example
+        else:
+            kwargs["json"] = sampler.sample(op.body_schema, mode)
+    return path, kwargs
+
+
+def check_openapi_response(
+    spec: Dict[str, Any], op: ApiOperation, status: int, body: bytes
+) -> List[str]:
+    """Contract violations of a response: undocumented status or body shape."""
+    code = str(status)
+    response = (
+        op.responses.get(code)
+        or op.responses.get(f"{code[0]}XX")
+        or op.responses.get("default")
+    )
+    if response is None:
+        return [f"undocumented status {status}"]
+    media = _deref(spec, response).get("content", {}).get("application/json")
+    if media is None or "schema" not in media:
+        return []
+    if not body:
+        return ["empty body, expected application/json"]
+    try:
+        value = json.loads(body)
+    except ValueError:
+        return ["body is not JSON"]
+    return validate_schema(spec, media["schema"], value)[:5]
+
+
+def _latency_histogram(latencies: List[float]) -> Dict[str, int]:
+    """Non-cumulative counts per ``LATENCY_BUCKETS_MS`` bucket."""
+    counts = Counter(bisect.bisect_left(LATENCY_BUCKETS_MS, v) for v in latencies)
+    labels = [f"le_{b}ms" for b in LATENCY_BUCKETS_MS] + [
+        f"gt_{LATENCY_BUCKETS_MS[-1]}ms"
+    ]
+    return {labels[i]: counts[i] for i in range(len(labels)) if counts[i]}
+
+
+@instrumented
+def run_openapi_load(
+    spec_path: str = OPENAPI_SPEC,
+    base_url: Optional[str] = None,
+    rps: float = 20,
+    duration_s: float = 30,
+    concurrency: int = 16,
+    seed: Optional[int] = None,
+) -> GameDayResult:
+    """
+    Drive a weighted load across every operation of an OpenAPI spec.
+
+    Requests are generated from each operation's parameter and body
+    schemas (spec examples, random valid values and boundary values).
+    Responses are checked against the documented status codes and JSON
+    schemas. Sends are open-loop at ``rps`` (Poisson arrivals), so
+    per-operation latency histograms and achieved rates describe capacity
+    rather than client pacing.
+    """
+    print(f"\n{'='*60}")
+    print("GAME DAY SCENARIO: OpenAPI Contract Load")
+    print(f"{'='*60}")
+
+    spec, operations = load_openapi_operations(spec_path)
+    base = (base_url or get_endpoint("rust_api")).rstrip("/")
+    rng = random.Random(seed)
+    sampler = SchemaSampler(spec, rng)
+    token = os.environ.get(API_TOKEN_ENV)
+    modes = list(OPENAPI_VALUE_MODES)
+    mode_weights = list(OPENAPI_VALUE_MODES.values())
+    weights = [op.weight for op in operations]
+    total_weight = sum(weights)
+
+    print(f"Spec: {spec_path} ({spec.get('info', {}).get('title', '?')})")
+    print(f"Target: {base}")
+    print(f"Rate: {rps} rps for {duration_s:.0f}s across {len(operations)} operations")
+
+    monitor = current_monitor()
+    if monitor:
+        monitor.pool_size = concurrency
+
+    stats = {
+        op.op_id: {
+            "latencies": [],
+            "statuses": Counter(),
+            "modes": Counter(),
+            "ok": 0,
+            "violations": 0,
+            "transport_errors": 0,
+            "samples": [],
+        }
+        for op in operations
+    }
+    stats_lock = threading.Lock()
+    busy = 0
+
+    def send(
+        op: ApiOperation, url: str, kwargs: Dict[str, Any], scheduled: float
+    ) -> None:
+        nonlocal busy
+        if monitor:
+            monitor.record_send(scheduled, time.perf_counter())
+        result = timed_request(op.method, url, keep_response=True, **kwargs)
+        response = result["response"]
+        if response is not None:
+            with PROFILER.phase("contract check"):
+                problems = check_openapi_response(
+                    spec, op, response.status_code, response.content
+                )
+        with stats_lock:
+            busy -= 1
+            s = stats[op.op_id]
+            s["latencies"].append(result["latency_ms"])
+            if response is None:
+                s["transport_errors"] += 1
+                problem = result["error"]
+            else:
+                s["statuses"][str(response.status_code)] += 1
+                if problems:
+                    s["violations"] += 1
+                    problem = f"{response.status_code}: {'; '.join(problems)}"
+                else:
+                    s["ok"] += 1
+                    problem = None
+            if problem and len(s["samples"]) < 5:
+                s["samples"].append(problem)
+
+    start_time = time.time()
+    t0 = time.perf_counter()
+    deadline = t0 + duration_s
+    due = t0 + rng.expovariate(rps)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        while due < deadline:
+            op = rng.choices(operations, weights)[0]
+            mode = rng.choices(modes, mode_weights)[0]
+            with PROFILER.phase("request build"):
+                path, kwargs = build_openapi_request(op, sampler, mode)
+            if token and op.secured:
+                kwargs["headers"]["Authorization"] = f"Bearer {token}"
+            stats[op.op_id]["modes"][mode] += 1
+
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            with stats_lock:
+                if busy >= concurrency and monitor:
+                    monitor.record_pool_wait()
+                busy += 1
+            pool.submit(send, op, f"{base}{path}", kwargs, due)
+            due += rng.expovariate(rps)
+
+    duration = (time.time() - start_time) * 1000
+    elapsed_s = duration / 1000
+
+    per_op = {}
+    ok_total = violations_total = transport_total = 0
+    for op in operations:
+        s = stats[op.op_id]
+        total = len(s["latencies"])
+        ok_total += s["ok"]
+        violations_total += s["violations"]
+        transport_total += s["transport_errors"]
+        per_op[op.op_id] = {
+            "method": op.method,
+            "path": op.path,
+            "weight_share": round(op.weight / total_weight, 3),
+            "requests": total,
+            "achieved_rps": round(total / elapsed_s, 2) if elapsed_s else 0,
+            "ok": s["ok"],
+            "contract_violations": s["violations"],
+            "transport_errors": s["transport_errors"],
+            "statuses": dict(s["statuses"]),
+            "value_modes": dict(s["modes"]),
+            **_latency_stats(s["latencies"]),
+            "latency_histogram_ms": _latency_histogram(s["latencies"]),
+            "samples": s["samples"],
+        }
+
+    if violations_total == 0 and transport_total == 0:
+        status = "passed"
+    else:
+        status = "partial" if ok_total > 0 else "failed"
+
+    print(f"\n{'='*60}")
+    print(f"RESULTS: {status.upper()}")
+    for op_id, o in per_op.items():
+        print(
+            f"  {op_id}: {o['ok']}/{o['requests']} conform, "
+            f"{o['achieved_rps']:.1f} rps, p95 {o['p95_latency_ms']:.0f}ms, "
+            f"statuses {o['statuses']}"
+        )
+    print(f"{'='*60}")
+
+    return GameDayResult(
+        scenario="openapi_load",
+        status=status,
+        duration_ms=duration,
+        details={
+            "spec": spec_path,
+            "target": base,
+            "rps": rps,
+            "total_requests": sum(o["requests"] for o in per_op.values()),
+            "conforming": ok_total,
+            "contract_violations": violations_total,
+            "transport_errors": transport_total,
+            "operations": per_op,
+        },
+        timestamp=datetime.utcnow().isoformat(),
+    )
+
+
+# =============================================================================
+# Asyncio HTTP Plumbing
+# =============================================================================
+
+# Cap on request/response bodies read by the asyncio helpers below.
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+_HTTP_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    204: "No Content",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class AsyncLoopThread:
+    """An asyncio event loop running in a daemon thread.
+
+    Lets the thread-based scenarios host asyncio servers and clients:
+    ``submit`` schedules a coroutine from any thread and returns a
+    ``concurrent.futures.Future``.
+    """
+
+    def __init__(self, name: str = "asyncio"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def start(self) -> "AsyncLoopThread":
+        self._thread.start()
+        return self
+
+    def submit(self, coro) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self) -> None:
+        async def cancel_all() -> None:
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._thread.is_alive():
+            self.submit(cancel_all()).result(timeout=5)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=5)
+        self.loop.close()
+
+
+async def read_http_message(
+    reader: asyncio.StreamReader,
+) -> Optional[Tuple[str, Dict[str, str], bytes]]:
+    """
+    Read one HTTP/1.1 message: ``(start line, lower-cased headers, body)``.
+
+    Returns None at a clean EOF between messages. Bodies need a
+    ``Content-Length`` (chunked encoding is not supported).
+    """
+    start = await reader.readline()
+    if not start:
+        return None
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0) or 0)
+    if length > MAX_BODY_BYTES:
+        raise ValueError(f"body of {length} bytes exceeds {MAX_BODY_BYTES}")
+    body = await reader.readexactly(length) if length else b""
+    return start.decode("latin-1").rstrip("\r\n"), headers, body
+
+
+def http_response_bytes(
+    status: int,
+    body: bytes = b"",
+    content_type: str = "application/json",
+    headers: Optional[Dict[str, str]] = None,
+) -> bytes:
+    """Serialize an HTTP/1.1 response with a ``Content-Length``."""
+    lines = [
+        f"HTTP/1.1 {status} {_HTTP_REASONS.get(status, 'Status')}",
+        f"Content-Length: {len(body)}",
+    ]
+    if body:
+        lines.append(f"Content-Type: {content_type}")
+    for name, value in (headers or {}).items():
+        lines.append(f"{name}: {value}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+class AsyncHttpPool:
+    """
+    Keep-alive HTTP/1.1 client connections to one host, for asyncio code.
+
+    At most ``max_connections`` requests are in flight; the rest wait for
+    a free connection. ``timeout_s`` bounds the connect and the response
+    separately, not the wait for a connection. Create it on the loop that
+    will use it.
+    """
+
+    def __init__(self, host: str, port: int, max_connections: int, timeout_s: float):
+        self.host = host
+        self.port = port
+        self.timeout_s = timeout_s
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes = b"",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[int]:
+        """Status code of one exchange; None if it failed or timed out."""
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+        for name, value in (headers or {}).items():
+            head += f"{name}: {value}\r\n"
+        raw = f"{head}Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+        async with self._slots:
+            conn = None
+            try:
+                conn = (
+                    self._idle.pop()
+                    if self._idle
+                    else await asyncio.wait_for(
+                        asyncio.open_connection(self.host, self.port), self.timeout_s
+                    )
+                )
+                reader, writer = conn
+                writer.write(raw)
+                message = await asyncio.wait_for(
+                    read_http_message(reader), self.timeout_s
+                )
+                if message is None:
+                    raise ConnectionError("connection closed")
+                status = int(message[0].split()[1])
+            except (
+                OSError,
+                asyncio.TimeoutError,
+                asyncio.IncompleteReadError,
+                ValueError,
+            ):
+                if conn is not None:
+                    conn[1].close()
+                return None
+            except asyncio.CancelledError:
+                # Abandoned mid-exchange: the response may still arrive, so
+                # the connection cannot be reused.
+                if conn is not None:
+                    conn[1].close()
+                raise
+            self._idle.append(conn)
+            return status
+
+    def close(self) -> None:
+        while self._idle:
+            self._idle.pop()[1].close()
+
+
+# =============================================================================
+# Scenario: Webhook Delivery
+# =============================================================================
+
+# Delivery ID and signature headers, as in snippets/examples/webhooks.
+WEBHOOK_ID_HEADER = "X-GitHub-Delivery"
+WEBHOOK_SIGNATURE_HEADER = "X-Hub-Signature-256"
+WEBHOOK_EVENT_HEADER = "X-GitHub-Event"
+WEBHOOK_SECRET_ENV = "GITHUB_WEBHOOK_SECRET"
+WEBHOOK_DEFAULT_SECRET = "game-day-secret"
+
+
+def webhook_signature(secret: str, body: bytes) -> str:
+    return (
+        "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    )
+
+
+class WebhookSink:
+    """
+    Local asyncio HTTP receiver that records every webhook delivery.
+
+    Deliveries are matched by the ``X-GitHub-Delivery`` header (or an
+    ``event_id``/``id`` body field). The receiver can be made slow
+    (``delay_ms``) or failing: ``fail_rate`` answers a random share with
+    500, and ``fail_first`` fails the first N attempts of every event, so
+    the sender's retries are exercised deterministically. With a
+    ``secret``, bad ``X-Hub-Signature-256`` headers get 401.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        secret: Optional[str] = None,
+        delay_ms: float = 0,
+        fail_rate: float = 0,
+        fail_first: int = 0,
+        seed: Optional[int] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.secret = secret
+        self.delay_ms = delay_ms
+        self.fail_rate = fail_rate
+        self.fail_first = fail_first
+        self.rng = random.Random(seed)
+        # (event id, receive time, status); appended on the loop thread.
+        self.deliveries: List[Tuple[str, float, int]] = []
+        self.attempts: Counter = Counter()
+        self.bad_signatures = 0
+        self.unmatched = 0
+        self._runner: Optional[AsyncLoopThread] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/webhook"
+
+    def start(self) -> "WebhookSink":
+        self._runner = AsyncLoopThread("webhook-sink").start()
+        self._server = self._runner.submit(
+            asyncio.start_server(self._serve, self.host, self.port, backlog=1024)
+        ).result(timeout=5)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    def stop(self) -> None:
+        if self._runner is None:
+            return
+        self._server.close()
+        self._runner.stop()
+        self._runner = None
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                message = await read_http_message(reader)
+                if message is None:
+                    break
+                _, headers, body = message
+                status = await self._receive(headers, body)
+                writer.write(http_response_bytes(status))
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # Shutdown; re-raising makes asyncio's stream callback log it.
+            pass
+        finally:
+            writer.close()
+
+    async def _receive(self, headers: Dict[str, str], body: bytes) -> int:
+        received = time.time()
+        event_id = headers.get(WEBHOOK_ID_HEADER.lower())
+        if event_id is None:
+            try:
+                data = json.loads(body)
+                event_id = str(data.get("event_id") or data.get("id"))
+            except (ValueError, AttributeError):
+                event_id = None
+        if not event_id or event_id == "None":
+            self.unmatched += 1
+            return 400
+        if self.secret is not None:
+            signature = headers.get(WEBHOOK_SIGNATURE_HEADER.lower(), "")
+            if not hmac.compare_digest(signature, webhook_signature(self.secret, body)):
+                self.bad_signatures += 1
+                return 401
+
+        self.attempts[event_id] += 1
+        if self.delay_ms:
+            await asyncio.sleep(self.delay_ms / 1000)
+        if self.attempts[event_id] <= self.fail_first or (
+            self.fail_rate and self.rng.random() < self.fail_rate
+        ):
+            status = 500
+        else:
+            status = 200
+        self.deliveries.append((event_id, received, status))
+        return status
+
+
+class LocalWebhookSender:
+    """
+    Stand-in webhook dispatcher, so ``webhook_delivery`` runs without a
+    live API.
+
+    ``trigger`` queues an event; up to ``concurrency`` deliveries are in
+    flight over pooled keep-alive connections. Non-2xx answers and
+    timeouts are retried with full-jitter exponential backoff, up to
+    ``max_attempts``. A timeout after the receiver acked produces a
+    duplicate, as with a real at-least-once dispatcher.
+    """
+
+    def __init__(
+        self,
+        target_url: str,
+        secret: str,
+        concurrency: int = 64,
+        timeout_s: float = 2.0,
+        max_attempts: int = 5,
+        backoff_base_s: float = 0.1,
+        backoff_cap_s: float = 5.0,
+        seed: Optional[int] = None,
+    ):
+        parts = urlsplit(target_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.path = parts.path or "/"
+        self.secret = secret
+        self.concurrency = concurrency
+        self.timeout_s = timeout_s
+        self.max_attempts = max_attempts
+        self.backoff_base_s = backoff_base_s
+        self.backoff_cap_s = backoff_cap_s
+        self.rng = random.Random(seed)
+        self.sent = 0
+        self.gave_up = 0
+        self._runner = AsyncLoopThread("webhook-sender")
+        self._http: Optional[AsyncHttpPool] = None
+        self._pending: set = set()
+
+    def start(self) -> "LocalWebhookSender":
+        self._runner.start()
+
+        async def init() -> None:
+            self._http = AsyncHttpPool(
+                self.host, self.port, self.concurrency, self.timeout_s
+            )
+
+        self._runner.submit(init()).result(timeout=5)
+        return self
+
+    def stop(self) -> None:
+        self._runner.stop()
+
+    def trigger(self, event_id: str, payload: Dict[str, Any]) -> None:
+        """Queue delivery of one event (callable from any thread)."""
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        self._runner.loop.call_soon_threadsafe(self._spawn, event_id, body)
+
+    def _spawn(self, event_id: str, body: bytes) -> None:
+        task = asyncio.ensure_future(self._deliver(event_id, body))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    async def _deliver(self, event_id: str, body: bytes) -> None:
+        headers = {
+            "Content-Type": "application/json",
+            WEBHOOK_EVENT_HEADER: "game_day",
+            WEBHOOK_ID_HEADER: event_id,
+            WEBHOOK_SIGNATURE_HEADER: webhook_signature(self.secret, body),
+        }
+        for attempt in range(self.max_attempts):
+            if attempt:
+                cap = min(self.backoff_cap_s, self.backoff_base_s * 2**attempt)
+                await asyncio.sleep(self.rng.uniform(0, cap))
+            status = await self._http.request("POST", self.path, body, headers)
+            self.sent += 1
+            if status is not None and 200 <= status < 300:
+                return
+        self.gave_up += 1
+
+
+def _delivery_stats(
+    triggered: Dict[str, Tuple[int, float]],
+    deliveries: List[Tuple[str, float, int]],
+) -> Dict[str, Any]:
+    """
+    Latency, duplicate, ordering and throughput figures for a run.
+
+    An event's delivery latency runs from its trigger to the first
+    delivery the receiver acked (2xx), so receiver failures show up as
+    retry delay. Deliveries after that ack are duplicates. An event is
+    out of order when its first delivery arrives after the first delivery
+    of a later-triggered event.
+    """
+    latencies: List[float] = []
+    acked: Dict[str, float] = {}
+    first_seen: set = set()
+    duplicates = out_of_order = unknown = 0
+    max_seq = -1
+    per_second: Counter = Counter()
+
+    for event_id, received, status in sorted(deliveries, key=lambda d: d[1]):
+        origin = triggered.get(event_id)
+        if origin is None:
+            unknown += 1
+            continue
+        seq, sent = origin
+        per_second[int(received)] += 1
+        if event_id not in first_seen:
+            first_seen.add(event_id)
+            if seq < max_seq:
+                out_of_order += 1
+            max_seq = max(max_seq, seq)
+        if event_id in acked:
+            duplicates += 1
+        elif 200 <= status < 300:
+            acked[event_id] = received
+            latencies.append((received - sent) * 1000)
+
+    delivered = len(acked)
+    matched = len(deliveries) - unknown
+    throughput = list(per_second.values())
+    return {
+        "delivered": delivered,
+        "lost": len(triggered) - delivered,
+        "deliveries": matched,
+        "attempts_per_event": round(matched / delivered, 3) if delivered else 0,
+        "duplicates": duplicates,
+        "duplicate_rate": round(duplicates / delivered, 4) if delivered else 0,
+        "out_of_order": out_of_order,
+        "out_of_order_rate": (
+            round(out_of_order / len(first_seen), 4) if first_seen else 0
+        ),
+        "unknown_event_ids": unknown,
+        "throughput_mean_per_s": (
+            round(sum(throughput) / len(throughput), 1) if throughput else 0
+        ),
+        "throughput_peak_per_s": max(throughput) if throughput else 0,
+        **_latency_stats(latencies),
+        "max_latency_ms": round(max(latencies), 2) if latencies else 0,
+    }
+
+
+@instrumented
+def run_webhook_delivery(
+    rps: float = 100,
+    duration_s: float = 30,
+    trigger_url: Optional[str] = None,
+    callback_url: Optional[str] = None,
+    sink_host: str = "127.0.0.1",
+    sink_port: int = 0,
+    receiver_delay_ms: float = 0,
+    receiver_fail_rate: float = 0,
+    receiver_fail_first: int = 0,
+    drain_s: float = 15,
+    concurrency: int = 64,
+    seed: Optional[int] = None,
+) -> GameDayResult:
+    """
+    Measure webhook delivery latency end to end into a local receiver.
+
+    Events are triggered open-loop at ``rps``. With ``trigger_url`` each
+    event is POSTed to the target API as ``{"event_id", "sequence",
+    "callback_url", "payload"}`` and the target is expected to deliver it
+    to ``callback_url`` (the local sink unless overridden, e.g. with a
+    host address the target can reach). Without it, ``LocalWebhookSender``
+    stands in for the API. After the load phase the sink is given up to
+    ``drain_s`` for retries to land.
+    """
+    print(f"\n{'='*60}")
+    print("GAME DAY SCENARIO: Webhook Delivery")
+    print(f"{'='*60}")
+
+    secret = os.environ.get(WEBHOOK_SECRET_ENV, WEBHOOK_DEFAULT_SECRET)
+    # A live target signs with its own secret: only verify when it was given.
+    verify = trigger_url is None or WEBHOOK_SECRET_ENV in os.environ
+    sink = WebhookSink(
+        sink_host,
+        sink_port,
+        secret=secret if verify else None,
+        delay_ms=receiver_delay_ms,
+        fail_rate=receiver_fail_rate,
+        fail_first=receiver_fail_first,
+        seed=seed,
+    ).start()
+    callback = callback_url or sink.url
+    sender = None
+    if trigger_url is None:
+        sender = LocalWebhookSender(sink.url, secret, concurrency, seed=seed).start()
+
+    print(f"Receiver: {sink.url}")
+    print(f"Sender: {trigger_url or 'local stand-in'}")
+    print(
+        f"Rate: {rps} events/s for {duration_s:.0f}s "
+        f"(receiver delay {receiver_delay_ms:.0f}ms, fail rate {receiver_fail_rate}, "
+        f"fail first {receiver_fail_first})"
+    )
+
+    run_id = f"{random.Random(seed).getrandbits(32):08x}"
+    rng = random.Random(seed)
+    monitor = current_monitor()
+    triggered: Dict[str, Tuple[int, float]] = {}
+    trigger_errors: List[str] = []
+    trigger_lock = threading.Lock()
+
+    def trigger_api(event_id: str, body: Dict[str, Any], scheduled: float) -> None:
+        if monitor:
+            monitor.record_send(scheduled, time.perf_counter())
+        result = timed_request("POST", trigger_url, json=body)
+        if not result["success"]:
+            with trigger_lock:
+                trigger_errors.append(result["error"])
+
+    start_time = time.time()
+    t0 = time.perf_counter()
+    deadline = t0 + duration_s
+    due = t0
+    seq = 0
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            while due < deadline:
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                event_id = f"gd-{run_id}-{seq}"
+                payload = {
+                    "event_id": event_id,
+                    "sequence": seq,
+                    "service": "game_day",
+                    "status": "success",
+                }
+                with trigger_lock:
+                    triggered[event_id] = (seq, time.time())
+                if sender is not None:
+                    if monitor:
+                        monitor.record_send(due, time.perf_counter())
+                    sender.trigger(event_id, payload)
+                else:
+                    body = {
+                        "event_id": event_id,
+                        "sequence": seq,
+                        "callback_url": callback,
+                        "payload": payload,
+                    }
+                    pool.submit(trigger_api, event_id, body, due)
+                seq += 1
+                due += rng.expovariate(rps)
+        load_s = time.time() - start_time
+
+        print(f"  Triggered {seq} events; draining up to {drain_s:.0f}s...")
+        drain_deadline = time.time() + drain_s
+        while time.time() < drain_deadline:
+            acked = {d[0] for d in list(sink.deliveries) if 200 <= d[2] < 300}
+            if len(acked) >= len(triggered) and (
+                sender is None or not sender.in_flight()
+            ):
+                break
+            time.sleep(0.1)
+    finally:
+        if sender is not None:
+            sender.stop()
+        sink.stop()
+
+    with PROFILER.phase("delivery stats"):
+        stats = _delivery_stats(triggered, list(sink.deliveries))
+    duration = (time.time() - start_time) * 1000
+
+    if stats["lost"] == 0 and not trigger_errors and not sink.bad_signatures:
+        status = "passed"
+    else:
+        status = "partial" if stats["delivered"] else "failed"
+
+    print(f"\n{'='*60}")
+    print(f"RESULTS: {status.upper()}")
+    print(f"  Delivered: {stats['delivered']}/{len(triggered)} (lost {stats['lost']})")
+    print(
+        f"  Latency p50/p95/p99: {stats['p50_latency_ms']:.0f}/"
+        f"{stats['p95_latency_ms']:.0f}/{stats['p99_latency_ms']:.0f}ms"
+    )
+    print(
+        f"  Attempts/event: {stats['attempts_per_event']}, "
+        f"duplicates {stats['duplicate_rate']:.2%}, "
+        f"out of order {stats['out_of_order_rate']:.2%}"
+    )
+    print(
+        f"  Receiver throughput: {stats['throughput_mean_per_s']}/s mean, "
+        f"{stats['throughput_peak_per_s']}/s peak"
+    )
+    print(f"{'='*60}")
+
+    return GameDayResult(
+        scenario="webhook_delivery",
+        status=status,
+        duration_ms=duration,
+        details={
+            "sender": trigger_url or "local",
+            "receiver": sink.url,
+            "rps": rps,
+            "triggered": len(triggered),
+            "trigger_rps": round(len(triggered) / load_s, 2) if load_s else 0,
+            "trigger_errors": len(trigger_errors),
+            "trigger_error_samples": trigger_errors[:5],
+            "receiver_profile": {
+                "delay_ms": receiver_delay_ms,
+                "fail_rate": receiver_fail_rate,
+                "fail_first": receiver_fail_first,
+            },
+            "bad_signatures": sink.bad_signatures,
+            "unmatched_deliveries": sink.unmatched,
+            "sender_attempts": sender.sent if sender is not None else None,
+            "sender_gave_up": sender.gave_up if sender is not None else None,
+            **stats,
+        },
+        timestamp=datetime.utcnow().isoformat(),
+    )
+
+
+# =============================================================================
+# Scenario: Retry Storm
+# =============================================================================
+
+# Client retry policies compared by ``retry_storm``. Defaults follow the
+# fetch-with-backoff snippet (snippets/examples/retries): 3 attempts,
+# 250ms base delay, 2s cap. "none" never retries, as a control.
+# "retry_budget" is exponential_jitter whose retries also draw on a budget
+# shared by all clients (as in Finagle's RetryBudget and gRPC retry
+# throttling), so retries stay a bounded share of traffic.
+RETRY_POLICY_KINDS = [
+    "none",
+    "immediate",
+    "fixed",
+    "exponential",
+    "exponential_jitter",
+    "retry_budget",
+]
+# Retry tokens earned per request, and the most a budget can bank.
+RETRY_BUDGET_RATIO = 0.1
+RETRY_BUDGET_MAX_TOKENS = 10.0
+
+# (start_s, end_s, slowdown): the stand-in's service time is multiplied by
+# ``slowdown`` from ``start_s`` to ``end_s`` into each policy's run.
+DEFAULT_DEGRADE_SCHEDULE = [(10.0, 20.0, 4.0)]
+
+# A policy has recovered once goodput holds at this fraction of its
+# pre-degradation level, with this little amplification, for
+# RECOVERY_HOLD_S consecutive seconds.
+RECOVERY_GOODPUT_RATIO = 0.9
+RECOVERY_MAX_AMPLIFICATION = 1.2
+RECOVERY_HOLD_S = 3
+
+
+@dataclass
+class RetryPolicy:
+    """How a simulated client retries a timed-out or 5xx request."""
+
+    kind: str
+    max_attempts: int = 3
+    base_s: float = 0.25
+    cap_s: float = 2.0
+    budget_ratio: float = RETRY_BUDGET_RATIO
+
+    @property
+    def attempts(self) -> int:
+        return 1 if self.kind == "none" else self.max_attempts
+
+    def delay(self, retry: int, rng: random.Random) -> float:
+        """Seconds to wait before retry number ``retry`` (from 1)."""
+        if self.kind == "immediate":
+            return 0.0
+        if self.kind == "fixed":
+            return self.base_s
+        ceiling = min(self.cap_s, self.base_s * 2 ** (retry - 1))
+        if self.kind in ("exponential_jitter", "retry_budget"):
+            return rng.uniform(0, ceiling)
+        return ceiling
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a share of requests.
+
+    Every request deposits ``ratio`` tokens (up to ``max_tokens``) and
+    every retry spends one, so retries settle at ``ratio`` of the request
+    rate however long the target stays down. Not thread-safe: share one
+    per event loop.
+    """
+
+    def __init__(self, ratio: float, max_tokens: float = RETRY_BUDGET_MAX_TOKENS):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.denied = 0
+
+    def deposit(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            self.denied += 1
+            return False
+        self.tokens -= 1
+        return True
+
+
+def parse_degrade_schedule(specs: Iterable[str]) -> List[Tuple[float, float, float]]:
+    """``start:end:slowdown`` strings (seconds, seconds, factor) as tuples."""
+    schedule = []
+    for spec in specs:
+        try:
+            start, end, slowdown = (float(part) for part in spec.split(":"))
+        except ValueError:
+            raise ValueError(f"degrade window must be start:end:slowdown, got {spec!r}")
+        if end <= start or slowdown <= 0:
+            raise ValueError(f"invalid degrade window {spec!r}")
+        schedule.append((start, end, slowdown))
+    return sorted(schedule)
+
+
+class DegradingServer:
+    """
+    Local stand-in for a capacity-limited service that degrades on a
+    schedule.
+
+    ``workers`` requests are served at a time, each taking ``service_ms``
+    times the slowdown in effect when it starts; the rest queue FIFO
+    (beyond ``queue_limit`` they are shed with a 503). Work is not
+    cancelled when the client gives up, as with most servers: that
+    wasted work is what lets retries hold a recovered service in
+    overload.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        service_ms: float,
+        schedule: List[Tuple[float, float, float]],
+        queue_limit: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.workers = workers
+        self.service_s = service_ms / 1000
+        self.schedule = schedule
+        self.queue_limit = queue_limit
+        self.host = host
+        self.port = port
+        self.completed = 0
+        self.shed = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.t0 = time.perf_counter()
+        self._runner = AsyncLoopThread("degrading-server")
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    def slowdown(self, elapsed_s: float) -> float:
+        for start, end, factor in self.schedule:
+            if start <= elapsed_s < end:
+                return factor
+        return 1.0
+
+    def start(self) -> "DegradingServer":
+        self._runner.start()
+
+        async def listen() -> None:
+            self._slots = asyncio.Semaphore(self.workers)
+            self._server = await asyncio.start_server(
+                self._serve, self.host, self.port, backlog=1024
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+
+        self._runner.submit(listen()).result(timeout=5)
+        self.t0 = time.perf_counter()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._runner.loop.call_soon_threadsafe(self._server.close)
+        self._runner.stop()
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while await read_http_message(reader) is not None:
+                if self.queue_limit is not None and self.queued >= self.queue_limit:
+                    self.shed += 1
+                    writer.write(http_response_bytes(503, b'{"error":"overloaded"}'))
+                    continue
+                self.queued += 1
+                self.max_queued = max(self.max_queued, self.queued)
+                async with self._slots:
+                    self.queued -= 1
+                    elapsed = time.perf_counter() - self.t0
+                    await asyncio.sleep(self.service_s * self.slowdown(elapsed))
+                self.completed += 1
+                writer.write(http_response_bytes(200, b'{"status":"ok"}'))
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            return
+        finally:
+            writer.close()
+
+
+def _run_retry_clients(
+    policy: RetryPolicy,
+    target_url: str,
+    rps: float,
+    duration_s: float,
+    timeout_s: float,
+    max_in_flight: int,
+    seed: Optional[int],
+) -> Dict[str, Counter]:
+    """
+    Drive open-loop Poisson traffic through ``policy`` for ``duration_s``.
+
+    Returns per-second counters, keyed by seconds since the start:
+    ``intents`` (first attempts), ``attempts``, ``succeeded`` (intents
+    whose final attempt succeeded, by completion second), ``gave_up`` and
+    ``budget_denied`` (retries a ``retry_budget`` policy refused). A
+    client's timeout covers waiting for one of ``max_in_flight``
+    connections, as with a client-side pool.
+    """
+    parts = urlsplit(target_url)
+    host, port = parts.hostname, parts.port or 80
+    path = parts.path or "/"
+    rng = random.Random(seed)
+    timeline = {
+        name: Counter()
+        for name in ("intents", "attempts", "succeeded", "gave_up", "budget_denied")
+    }
+    budget = RetryBudget(policy.budget_ratio) if policy.kind == "retry_budget" else None
+    monitor = current_monitor()
+
+    async def intent(http: AsyncHttpPool, t0: float) -> None:
+        loop = asyncio.get_running_loop()
+        if budget is not None:
+            budget.deposit()
+        for attempt in range(1, policy.attempts + 1):
+            if attempt > 1:
+                if budget is not None and not budget.withdraw():
+                    timeline["budget_denied"][int(loop.time() - t0)] += 1
+                    break
+                await asyncio.sleep(policy.delay(attempt - 1, rng))
+            timeline["attempts"][int(loop.time() - t0)] += 1
+            try:
+                status = await asyncio.wait_for(http.request("GET", path), timeout_s)
+            except asyncio.TimeoutError:
+                status = None
+            if status is not None and status < 500:
+                timeline["succeeded"][int(loop.time() - t0)] += 1
+                return
+        timeline["gave_up"][int(loop.time() - t0)] += 1
+
+    async def drive() -> None:
+        loop = asyncio.get_running_loop()
+        http = AsyncHttpPool(host, port, max_in_flight, timeout_s)
+        pending: set = set()
+        t0 = loop.time()
+        due = t0
+        try:
+            while due < t0 + duration_s:
+                delay = due - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                if monitor:
+                    monitor.record_send(due, loop.time())
+                timeline["intents"][int(due - t0)] += 1
+                task = asyncio.ensure_future(intent(http, t0))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                due += rng.expovariate(rps)
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            http.close()
+
+    runner = AsyncLoopThread(f"retry-{policy.kind}").start()
+    try:
+        # Every intent finishes within its attempts, timeouts and delays.
+        drain_s = policy.attempts * (timeout_s + policy.cap_s) + 5
+        runner.submit(drive()).result(timeout=duration_s + drain_s)
+    finally:
+        runner.stop()
+    return timeline
+
+
+def _retry_storm_stats(
+    timeline: Dict[str, Counter],
+    schedule: List[Tuple[float, float, float]],
+    duration_s: float,
+) -> Dict[str, Any]:
+    """
+    Amplification, goodput and recovery time for one policy's timeline.
+
+    Amplification is attempts per intent; goodput is intents that
+    succeeded per second. The baseline is the goodput before the first
+    degradation (skipping the first, warm-up second). Recovery time runs
+    from the end of the last degradation until goodput is back to
+    RECOVERY_GOODPUT_RATIO of baseline with amplification at most
+    RECOVERY_MAX_AMPLIFICATION for RECOVERY_HOLD_S seconds; a policy that
+    never gets there before the run ends is flagged metastable.
+    """
+    seconds = int(math.ceil(duration_s))
+    degrade_start = int(schedule[0][0]) if schedule else seconds
+    degrade_end = int(math.ceil(schedule[-1][1])) if schedule else seconds
+
+    def window(name: str, lo: int, hi: int) -> int:
+        return sum(timeline[name][s] for s in range(lo, hi))
+
+    def amplification(lo: int, hi: int) -> Optional[float]:
+        intents = window("intents", lo, hi)
+        return round(window("attempts", lo, hi) / intents, 3) if intents else None
+
+    baseline_from = 1 if degrade_start > 1 else 0
+    baseline_s = max(degrade_start - baseline_from, 1)
+    baseline = window("succeeded", baseline_from, degrade_start) / baseline_s
+
+    recovered_at = None
+    run = 0
+    for s in range(degrade_end, seconds):
+        intents = timeline["intents"][s]
+        healthy = (
+            intents
+            and timeline["succeeded"][s] >= RECOVERY_GOODPUT_RATIO * baseline
+            and timeline["attempts"][s] / intents <= RECOVERY_MAX_AMPLIFICATION
+        )
+        run = run + 1 if healthy else 0
+        if run == RECOVERY_HOLD_S:
+            recovered_at = s - RECOVERY_HOLD_S + 1
+            break
+
+    intents = sum(timeline["intents"].values())
+    succeeded = sum(timeline["succeeded"].values())
+    after_s = max(seconds - degrade_end, 1)
+    return {
+        "intents": intents,
+        "attempts": sum(timeline["attempts"].values()),
+        "succeeded": succeeded,
+        "gave_up": sum(timeline["gave_up"].values()),
+        "budget_denied": sum(timeline["budget_denied"].values()),
+        "success_rate": round(succeeded / intents, 4) if intents else 0,
+        "amplification": amplification(0, seconds + 1),
+        "amplification_degraded": amplification(degrade_start, degrade_end),
+        "amplification_after": amplification(degrade_end, seconds),
+        "baseline_goodput_per_s": round(baseline, 2),
+        "goodput_per_s": round(succeeded / duration_s, 2),
+        "goodput_after_per_s": round(
+            window("succeeded", degrade_end, seconds) / after_s, 2
+        ),
+        "recovery_s": (
+            recovered_at - degrade_end if recovered_at is not None else None
+        ),
+        "metastable": recovered_at is None,
+        "timeline": [
+            {name: timeline[name][s] for name in timeline} for s in range(seconds + 1)
+        ],
+    }
+
+
+@instrumented
+def run_retry_storm(
+    policies: Optional[List[str]] = None,
+    rps: float = 200,
+    duration_s: float = 40,
+    schedule: Optional[List[Tuple[float, float, float]]] = None,
+    target_url: Optional[str] = None,
+    utilization: float = 0.6,
+    service_ms: float = 25,
+    queue_limit: Optional[int] = None,
+    timeout_s: float = 0.5,
+    max_attempts: int = 3,
+    backoff_base_ms: float = 250,
+    backoff_cap_ms: float = 2000,
+    max_in_flight: int = 1024,
+    seed: Optional[int] = None,
+) -> GameDayResult:
+    """
+    Compare client retry policies against a target that degrades, then
+    recovers.
+
+    Each policy gets its own run of ``duration_s`` at ``rps`` open-loop
+    intents. Without ``target_url`` a fresh ``DegradingServer`` is
+    started per run, sized so the offered load is ``utilization`` of its
+    healthy capacity, and slowed down according to ``schedule``. Its
+    queue is capped at ``queue_limit`` (by default what it can serve
+    within half a client timeout when healthy; 0 for no cap) and sheds the
+    excess with 503s, as a service that protects itself would. With
+    ``target_url`` (e.g. rust-api behind a fault proxy) the degradation
+    is up to the operator, on the same schedule relative to each run's
+    start, since only the recovery windows are derived from it.
+
+    Retrying policies are ranked by whether and how fast they recovered,
+    then by the extra load they put on the degraded target (amplification
+    during the degradation), then by goodput after it, so there is a best
+    policy even when every one of them stays overloaded. The ``none``
+    control is reported but not ranked.
+    """
+    print(f"\n{'='*60}")
+    print("GAME DAY SCENARIO: Retry Storm")
+    print(f"{'='*60}")
+
+    policies = policies or RETRY_POLICY_KINDS
+    schedule = DEFAULT_DEGRADE_SCHEDULE if schedule is None else schedule
+    workers = max(1, math.ceil(rps * service_ms / 1000 / utilization))
+    capacity = workers * 1000 / service_ms
+    if queue_limit is None:
+        # Queued work is served within half a client timeout, so requests
+        # the stand-in accepts can still succeed once it is healthy again.
+        queue_limit = workers * max(1, math.ceil(timeout_s * 500 / service_ms))
+    shed_above = queue_limit or None
+    print(f"Target: {target_url or 'local stand-in'}")
+    print(
+        f"Load: {rps} intents/s for {duration_s:.0f}s per policy, "
+        f"client timeout {timeout_s * 1000:.0f}ms, {max_attempts} attempts"
+    )
+    if target_url is None:
+        print(
+            f"Stand-in: {workers} workers x {service_ms:.0f}ms "
+            f"({capacity:.0f} req/s healthy), "
+            + (f"shedding above {shed_above} queued" if shed_above else "no queue cap")
+        )
+    for start, end, slowdown in schedule:
+        print(f"Degradation: {slowdown}x slower from {start:.0f}s to {end:.0f}s")
 
-        if result["success"]:
-            success_count += 1
-            print(
-                f"[{i+1}/{num_requests}] OK - {proj_id} ({result['latency_ms']:.0f}ms)"
-            )
-        else:
-            error_count += 1
-            errors.append(result["error"])
-            print(f"[{i+1}/{num_requests}] FAIL - {result['error']}")
+    start_time = time.time()
+    results: Dict[str, Dict[str, Any]] = {}
+    for kind in policies:
+        policy = RetryPolicy(
+            kind, max_attempts, backoff_base_ms / 1000, backoff_cap_ms / 1000
+        )
+        server = None
+        if target_url is None:
+            server = DegradingServer(workers, service_ms, schedule, shed_above)
+            server.start()
+        try:
+            with PROFILER.phase(f"policy {kind}"):
+                timeline = _run_retry_clients(
+                    policy,
+                    target_url or server.url,
+                    rps,
+                    duration_s,
+                    timeout_s,
+                    max_in_flight,
+                    seed,
+                )
+        finally:
+            if server is not None:
+                server.stop()
+        stats = _retry_storm_stats(timeline, schedule, duration_s)
+        if server is not None:
+            stats["server_completed"] = server.completed
+            # Completions nobody was waiting for any more.
+            stats["wasted_work"] = max(server.completed - stats["succeeded"], 0)
+            stats["server_shed"] = server.shed
+            stats["server_max_queue"] = server.max_queued
+        results[kind] = stats
 
-        # Realistic traffic pattern
-        time.sleep(random.uniform(0.05, 0.3))
+        recovery = (
+            f"recovered in {stats['recovery_s']}s"
+            if not stats["metastable"]
+            else "did not recover (metastable)"
+        )
+        print(
+            f"  {kind:<20} amplification {stats['amplification']}x "
+            f"(after {stats['amplification_after']}x), "
+            f"goodput {stats['goodput_after_per_s']}/s after "
+            f"vs {stats['baseline_goodput_per_s']}/s baseline, {recovery}"
+        )
 
     duration = (time.time() - start_time) * 1000
+    recovered = [k for k in policies if not results[k]["metastable"]]
 
-    # Calculate stats
-    avg_latency = sum(latencies) / len(latencies) if latencies else 0
-    p95_latency = sorted(latencies)[int(len(latencies) * 0.95)] if latencies else 0
+    def rank(kind: str) -> Tuple:
+        r = results[kind]
+        return (
+            r["metastable"],
+            r["recovery_s"] if r["recovery_s"] is not None else math.inf,
+            r["amplification_degraded"] or 0,
+            -r["goodput_after_per_s"],
+        )
 
-    status = (
-        "passed" if error_count == 0 else ("partial" if success_count > 0 else "failed")
-    )
+    ranking = sorted((k for k in policies if k != "none"), key=rank)
+    best = ranking[0] if ranking else None
+    if len(recovered) == len(policies):
+        status = "passed"
+    else:
+        status = "partial" if recovered else "failed"
 
     print(f"\n{'='*60}")
     print(f"RESULTS: {status.upper()}")
-    print(f"  Success: {success_count}/{num_requests}")
-    print(f"  Errors: {error_count}")
-    print(f"  Avg Latency: {avg_latency:.0f}ms")
-    print(f"  P95 Latency: {p95_latency:.0f}ms")
+    print(f"  Recovered: {len(recovered)}/{len(policies)} policies")
+    metastable = [k for k in policies if results[k]["metastable"]]
+    if metastable:
+        print(f"  Metastable: {', '.join(metastable)}")
+    if best:
+        print(f"  Best policy: {best}")
+        print(f"  Ranking: {' > '.join(ranking)}")
     print(f"{'='*60}")
 
     return GameDayResult(
-        scenario="load_test",
+        scenario="retry_storm",
         status=status,
         duration_ms=duration,
         details={
-            "total_requests": num_requests,
-            "success": success_count,
-            "errors": error_count,
-            "avg_latency_ms": round(avg_latency, 2),
-            "p95_latency_ms": round(p95_latency, 2),
-            "error_samples": errors[:5],
+            "target": target_url or "local",
+            "rps": rps,
+            "duration_s": duration_s,
+            "schedule": [list(window) for window in schedule],
+            "stand_in": (
+                {
+                    "workers": workers,
+                    "service_ms": service_ms,
+                    "capacity_per_s": round(capacity, 1),
+                    "queue_limit": shed_above,
+                }
+                if target_url is None
+                else None
+            ),
+            "client": {
+                "timeout_ms": timeout_s * 1000,
+                "max_attempts": max_attempts,
+                "backoff_base_ms": backoff_base_ms,
+                "backoff_cap_ms": backoff_cap_ms,
+                "max_in_flight": max_in_flight,
+            },
+            "best_policy": best,
+            "ranking": ranking,
+            "metastable_policies": metastable,
+            "policies": results,
         },
         timestamp=datetime.utcnow().isoformat(),
     )
@@ -208,6 +3527,7 @@ def run_load_test(
 # =============================================================================
 
 
+@instrumented
 def run_health_sweep() -> GameDayResult:
     """
     Verify all Atlas platform services are healthy.
@@ -273,6 +3593,7 @@ def run_health_sweep() -> GameDayResult:
 # =============================================================================
 
 
+@instrumented
 def run_trace_verify() -> GameDayResult:
     """
     Validate that distributed tracing is working end-to-end.
@@ -344,6 +3665,7 @@ def run_trace_verify() -> GameDayResult:
 # =============================================================================
 
 
+@instrumented
 def run_slo_check() -> GameDayResult:
     """
     Validate that SLO metrics are being captured by Go controller.
@@ -394,6 +3716,665 @@ def run_slo_check() -> GameDayResult:
     )
 
 
+# =============================================================================
+# Local Stand-in Services
+# =============================================================================
+
+# Stand-ins answer application routes after a sampled latency, fail a
+# share of them with 500s and pad their bodies to a size. Health, readiness
+# and /metrics routes always answer at once: they are how the toolkit
+# decides whether a service is up.
+FAKE_DEFAULT_BASE_PORT = 18000
+FAKE_LATENCY_DISTS = ("constant", "exponential")
+# Stand-ins whose /metrics carry Go runtime series, as the real ones do.
+FAKE_GO_SERVICES = {"go_controller", "prometheus", "loki", "alloy", "grafana"}
+# Request log entries kept for the Loki stand-in's query_range.
+FAKE_LOG_LIMIT = 200_000
+FAKE_DURATION_BUCKETS_S = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+_LOKI_MATCHER_RE = re.compile(r'(\w+)\s*(=~|!~|!=|=)\s*"((?:[^"\\]|\\.)*)"')
+_LOKI_FILTER_RE = re.compile(r'(\|=|!=|\|~|!~)\s*("(?:[^"\\]|\\.)*"|`[^`]*`)')
+
+
+@dataclass
+class FakeProfile:
+    """How a stand-in answers its application routes."""
+
+    latency_ms: float = 1.0
+    latency_dist: str = "exponential"
+    error_rate: float = 0.0
+    payload_bytes: int = 256
+
+
+def parse_fake_profiles(specs: Iterable[str]) -> Dict[str, FakeProfile]:
+    """
+    Per-service profiles from ``[service:]key=value,...`` strings.
+
+    A spec without a service applies to every stand-in; later specs
+    override earlier ones, e.g. ``latency_ms=2`` then
+    ``rust_api:latency_ms=20,error_rate=0.01``.
+    """
+    fields = {
+        "latency_ms": float,
+        "latency_dist": str,
+        "error_rate": float,
+        "payload_bytes": int,
+    }
+    settings: Dict[str, Dict[str, Any]] = {service: {} for service in ENDPOINTS}
+    for spec in specs:
+        service, _, assignments = spec.rpartition(":")
+        if service and service not in ENDPOINTS:
+            raise ValueError(f"unknown service {service!r} in profile {spec!r}")
+        values = {}
+        for assignment in assignments.split(","):
+            key, _, value = assignment.partition("=")
+            key = key.strip()
+            if key not in fields:
+                raise ValueError(f"unknown profile field {key!r} in {spec!r}")
+            try:
+                values[key] = fields[key](value.strip())
+            except ValueError:
+                raise ValueError(f"bad value for {key} in {spec!r}")
+        if values.get("latency_dist", "exponential") not in FAKE_LATENCY_DISTS:
+            raise ValueError(f"latency_dist must be one of {FAKE_LATENCY_DISTS}")
+        for target in [service] if service else ENDPOINTS:
+            settings[target].update(values)
+    return {service: FakeProfile(**values) for service, values in settings.items()}
+
+
+def endpoint_env(service: str) -> str:
+    """Environment variable that overrides ``service``'s endpoint."""
+    return f"{ENDPOINT_ENV_PREFIX}{service.upper()}"
+
+
+def _contract_responses(
+    spec_path: str, seed: Optional[int]
+) -> List[Tuple[str, Any, str, int, bytes]]:
+    """
+    One canned success response per operation in an OpenAPI spec.
+
+    Bodies are sampled once from the lowest documented 2xx response
+    (examples preferred), so the rust-api stand-in satisfies
+    ``openapi_load``'s contract checks. Empty if the spec is unreadable.
+    """
+    try:
+        spec, operations = load_openapi_operations(spec_path)
+    except (OSError, ValueError):
+        return []
+    sampler = SchemaSampler(spec, random.Random(seed))
+    out = []
+    for op in operations:
+        codes = sorted(c for c in op.responses if c.isdigit() and c.startswith("2"))
+        if not codes:
+            continue
+        media = _deref(spec, op.responses[codes[0]]).get("content", {})
+        schema = media.get("application/json", {}).get("schema")
+        body = b""
+        if schema is not None:
+            body = json.dumps(sampler.sample(schema, "example")).encode("utf-8")
+        pattern = re.compile(
+            "".join(
+                "[^/]+" if part.startswith("{") else re.escape(part)
+                for part in re.split(r"(\{[^}]+\})", op.path)
+            )
+            + "$"
+        )
+        out.append((op.method.upper(), pattern, op.path, int(codes[0]), body))
+    return out
+
+
+def _rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _loki_selector(query: str) -> Tuple[List[Tuple[str, str, str]], List[Tuple]]:
+    """Label matchers and line filters of a LogQL log query (no parsers)."""
+    selector, _, pipeline = query.partition("}")
+    matchers = [
+        (name, op, json.loads(f'"{value}"'))
+        for name, op, value in _LOKI_MATCHER_RE.findall(selector)
+    ]
+    filters = []
+    for op, raw in _LOKI_FILTER_RE.findall(pipeline):
+        value = raw[1:-1] if raw.startswith("`") else json.loads(raw)
+        filters.append((op, re.compile(value) if "~" in op else value))
+    return matchers, filters
+
+
+def _loki_labels_match(labels: Dict[str, str], matchers: List[Tuple]) -> bool:
+    for name, op, value in matchers:
+        actual = labels.get(name, "")
+        if op == "=" and actual != value:
+            return False
+        if op == "!=" and actual == value:
+            return False
+        if op in ("=~", "!~") and (re.fullmatch(value, actual) is None) == (op == "=~"):
+            return False
+    return True
+
+
+def _loki_line_matches(line: str, filters: List[Tuple]) -> bool:
+    for op, value in filters:
+        if op == "|=" and value not in line:
+            return False
+        if op == "!=" and value in line:
+            return False
+        if op == "|~" and not value.search(line):
+            return False
+        if op == "!~" and value.search(line):
+            return False
+    return True
+
+
+@dataclass
+class _FakeState:
+    service: str
+    profile: FakeProfile
+    routes: Dict[Tuple[str, str], Callable[..., Tuple[int, bytes, str]]]
+    # Application routes off the route table answer too (rust-api,
+    # go-controller and shield serve many more paths than are modelled).
+    catch_all: bool
+    # (method, path pattern, route, status, body) answered from the spec.
+    contract: List[Tuple[str, Any, str, int, bytes]] = field(default_factory=list)
+    requests: Counter = field(default_factory=Counter)
+    buckets: List[int] = field(
+        default_factory=lambda: [0] * (len(FAKE_DURATION_BUCKETS_S) + 1)
+    )
+    duration_sum_s: float = 0.0
+    port: int = 0
+
+
+class FakeServices:
+    """
+    asyncio stand-ins for every ``ENDPOINTS`` service, on one event loop.
+
+    Each serves the health path the scenarios probe, a Prometheus
+    ``/metrics`` page with request counters, a latency histogram and
+    process series, and its own API where the toolkit reads one: an
+    instant/range query API on prometheus, ``query_range`` on loki (over
+    a log of the requests every stand-in served, so injected errors show
+    up as error lines), the operations of ``spec_path`` on rust-api and
+    ``/auth/login`` on shield. Other rust-api, go-controller and shield
+    paths answer with JSON padded to the profile's ``payload_bytes``.
+
+    With ``base_port`` the services listen on consecutive ports in
+    ``ENDPOINTS`` order; with 0 on free ports.
+    """
+
+    def __init__(
+        self,
+        profiles: Optional[Dict[str, FakeProfile]] = None,
+        host: str = "127.0.0.1",
+        base_port: int = FAKE_DEFAULT_BASE_PORT,
+        seed: Optional[int] = None,
+        spec_path: str = OPENAPI_SPEC,
+    ):
+        self.host = host
+        self.base_port = base_port
+        self.rng = random.Random(seed)
+        self.started = time.time()
+        self._runner = AsyncLoopThread("fakes")
+        self._servers: List[asyncio.AbstractServer] = []
+        self._env: Dict[str, Optional[str]] = {}
+        self._log_ts: List[int] = []
+        self._log: List[Tuple[int, str, str, str]] = []
+        profiles = profiles or {}
+        probe = {"status": "ok"}
+        self.services = {
+            "rust_api": self._state(
+                "rust_api", profiles, {("GET", "/health"): self._json(probe)}, True
+            ),
+            "go_controller": self._state(
+                "go_controller",
+                profiles,
+                {("GET", "/health"): self._json({"status": "healthy"})},
+                True,
+            ),
+            "prometheus": self._state(
+                "prometheus",
+                profiles,
+                {
+                    ("GET", "/-/ready"): self._text("Prometheus Server is Ready.\n"),
+                    ("GET", "/-/healthy"): self._text(
+                        "Prometheus Server is Healthy.\n"
+                    ),
+                    ("GET", "/api/v1/query"): self._prometheus_query,
+                    ("GET", "/api/v1/query_range"): self._prometheus_query,
+                },
+                False,
+            ),
+            "grafana": self._state(
+                "grafana",
+                profiles,
+                {
+                    ("GET", "/api/health"): self._json(
+                        {"commit": "game-day", "database": "ok", "version": "11.0.0"}
+                    )
+                },
+                False,
+            ),
+            "loki": self._state(
+                "loki",
+                profiles,
+                {
+                    ("GET", "/ready"): self._text("ready\n"),
+                    ("GET", "/loki/api/v1/query_range"): self._loki_query_range,
+                },
+                False,
+            ),
+            "alloy": self._state(
+                "alloy",
+                profiles,
+                {
+                    ("GET", "/-/ready"): self._text("Alloy is ready.\n"),
+                    ("GET", "/-/healthy"): self._text(
+                        "All Alloy components are healthy.\n"
+                    ),
+                },
+                False,
+            ),
+            "shield": self._state(
+                "shield",
+                profiles,
+                {
+                    ("GET", "/health"): self._json(probe),
+                    ("POST", "/auth/login"): self._shield_login,
+                },
+                True,
+            ),
+        }
+        self.services["rust_api"].contract = _contract_responses(spec_path, seed)
+
+    def _state(
+        self,
+        service: str,
+        profiles: Dict[str, FakeProfile],
+        routes: Dict[Tuple[str, str], Callable[..., Tuple[int, bytes, str]]],
+        catch_all: bool,
+    ) -> _FakeState:
+        routes[("GET", "/metrics")] = functools.partial(self._metrics, service)
+        return _FakeState(
+            service, profiles.get(service, FakeProfile()), routes, catch_all
+        )
+
+    @staticmethod
+    def _json(body: Dict[str, Any]) -> Callable[..., Tuple[int, bytes, str]]:
+        raw = json.dumps(body).encode("utf-8")
+        return lambda query, body: (200, raw, "application/json")
+
+    @staticmethod
+    def _text(body: str) -> Callable[..., Tuple[int, bytes, str]]:
+        raw = body.encode("utf-8")
+        return lambda query, body: (200, raw, "text/plain; charset=utf-8")
+
+    # -- lifecycle ------------------------------------------------------------
+
+    @property
+    def urls(self) -> Dict[str, str]:
+        return {
+            service: f"http://{self.host}:{state.port}"
+            for service, state in self.services.items()
+        }
+
+    def start(self) -> "FakeServices":
+        self._runner.start()
+
+        async def listen() -> None:
+            for i, state in enumerate(self.services.values()):
+                port = self.base_port + i if self.base_port else 0
+                server = await asyncio.start_server(
+                    functools.partial(self._serve, state),
+                    self.host,
+                    port,
+                    backlog=4096,
+                )
+                state.port = server.sockets[0].getsockname()[1]
+                self._servers.append(server)
+
+        try:
+            self._runner.submit(listen()).result(timeout=5)
+        except OSError:
+            # A port is taken: release the ones already bound.
+            for server in self._servers:
+                self._runner.loop.call_soon_threadsafe(server.close)
+            self._servers.clear()
+            self._runner.stop()
+            raise
+        self.started = time.time()
+        return self
+
+    def apply_env(self) -> None:
+        """Point ``get_endpoint`` in this process at the stand-ins."""
+        for service, url in self.urls.items():
+            name = endpoint_env(service)
+            self._env.setdefault(name, os.environ.get(name))
+            os.environ[name] = url
+
+    def stop(self) -> None:
+        for name, value in self._env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        for server in self._servers:
+            self._runner.loop.call_soon_threadsafe(server.close)
+        self._runner.stop()
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Requests and 5xx answers per service so far."""
+        out = {}
+        for service, state in self.services.items():
+            counts = list(state.requests.items())
+            out[service] = {
+                "requests": sum(n for _, n in counts),
+                "errors": sum(n for (_, _, status), n in counts if status >= 500),
+            }
+        return out
+
+    # -- serving --------------------------------------------------------------
+
+    async def _serve(
+        self,
+        state: _FakeState,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            while True:
+                message = await read_http_message(reader)
+                if message is None:
+                    break
+                start_line, headers, body = message
+                method, target = start_line.split(" ", 2)[:2]
+                status, payload, content_type = await self._respond(
+                    state, method, target, body
+                )
+                writer.write(http_response_bytes(status, payload, content_type))
+                if headers.get("connection", "").lower() == "close":
+                    break
+                if writer.transport.get_write_buffer_size() > 64 * 1024:
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            return
+        finally:
+            writer.close()
+
+    async def _respond(
+        self, state: _FakeState, method: str, target: str, body: bytes
+    ) -> Tuple[int, bytes, str]:
+        path, _, query = target.partition("?")
+        handler = state.routes.get((method, path))
+        probe = handler is not None and (
+            path == "/metrics" or path.endswith(("health", "ready", "healthy"))
+        )
+        if probe:
+            status, payload, content_type = handler(query, body)
+            state.requests[(method, path, status)] += 1
+            return status, payload, content_type
+        if handler is None and not state.catch_all:
+            state.requests[(method, "other", 404)] += 1
+            return 404, b'{"error":"not found"}', "application/json"
+        route = path if handler is not None else "other"
+        canned = None
+        if handler is None:
+            for op_method, pattern, template, status, payload in state.contract:
+                if op_method == method and pattern.match(path):
+                    route, canned = template, (status, payload, "application/json")
+                    break
+
+        started = time.perf_counter()
+        profile = state.profile
+        if profile.latency_ms > 0:
+            delay = profile.latency_ms / 1000
+            if profile.latency_dist == "exponential":
+                delay = self.rng.expovariate(1 / delay)
+            await asyncio.sleep(delay)
+        if profile.error_rate and self.rng.random() < profile.error_rate:
+            status, payload, content_type = (
+                500,
+                b'{"error":"injected by game_day stand-in"}',
+                "application/json",
+            )
+        elif handler is not None:
+            status, payload, content_type = handler(query, body)
+        elif canned is not None:
+            status, payload, content_type = canned
+        else:
+            status, payload, content_type = (
+                200,
+                self._padded(state, path),
+                "application/json",
+            )
+
+        elapsed = time.perf_counter() - started
+        state.requests[(method, route, status)] += 1
+        state.buckets[bisect.bisect_left(FAKE_DURATION_BUCKETS_S, elapsed)] += 1
+        state.duration_sum_s += elapsed
+        self._record_log(state.service, method, path, status, elapsed)
+        return status, payload, content_type
+
+    @staticmethod
+    def _padded(state: _FakeState, path: str) -> bytes:
+        head = f'{{"status":"ok","service":"{state.service}","padding":"'.encode(
+            "utf-8"
+        )
+        pad = max(state.profile.payload_bytes - len(head) - 2, 0)
+        return head + b"x" * pad + b'"}'
+
+    def _record_log(
+        self, service: str, method: str, path: str, status: int, elapsed: float
+    ) -> None:
+        level = "error" if status >= 500 else "info"
+        line = (
+            f"level={level} service={service} method={method} path={path} "
+            f"status={status} duration_ms={elapsed * 1000:.1f}"
+        )
+        if status >= 500:
+            line += ' msg="injected error"'
+        if len(self._log) >= FAKE_LOG_LIMIT:
+            del self._log[: FAKE_LOG_LIMIT // 2]
+            del self._log_ts[: FAKE_LOG_LIMIT // 2]
+        ts = time.time_ns()
+        self._log_ts.append(ts)
+        self._log.append((ts, service, level, line))
+
+    # -- service APIs ---------------------------------------------------------
+
+    def _metrics(self, service: str, query: str, body: bytes) -> Tuple[int, bytes, str]:
+        state = self.services[service]
+        out = [
+            "# HELP http_requests_total Requests served, by route and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status), n in sorted(state.requests.items()):
+            out.append(
+                f'http_requests_total{{method="{method}",route="{route}",'
+                f'status="{status}"}} {n}'
+            )
+        out += [
+            "# HELP http_request_duration_seconds Application request latency.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        cumulative = 0
+        for le, n in zip((*FAKE_DURATION_BUCKETS_S, "+Inf"), state.buckets):
+            cumulative += n
+            out.append(
+                f'http_request_duration_seconds_bucket{{le="{le}"}} {cumulative}'
+            )
+        out.append(f"http_request_duration_seconds_sum {state.duration_sum_s:.6f}")
+        out.append(f"http_request_duration_seconds_count {cumulative}")
+
+        rss = _rss_bytes()
+        fds = _open_fd_count()
+        out += [
+            "# TYPE process_start_time_seconds gauge",
+            f"process_start_time_seconds {self.started:.3f}",
+        ]
+        if rss is not None:
+            out += [
+                "# TYPE process_resident_memory_bytes gauge",
+                f"process_resident_memory_bytes {rss}",
+            ]
+        if fds is not None:
+            out += ["# TYPE process_open_fds gauge", f"process_open_fds {fds}"]
+        if service in FAKE_GO_SERVICES:
+            out += [
+                "# TYPE go_goroutines gauge",
+                f"go_goroutines {len(asyncio.all_tasks())}",
+            ]
+        if service == "go_controller":
+            errors = sum(
+                n for (_, _, status), n in state.requests.items() if status >= 500
+            )
+            total = sum(state.requests.values()) or 1
+            out += [
+                "# HELP shield_system_health_score Overall Shield health (0-1).",
+                "# TYPE shield_system_health_score gauge",
+                f"shield_system_health_score {1 - errors / total:.4f}",
+                "# HELP shield_active_scans_total Scans started, by type.",
+                "# TYPE shield_active_scans_total counter",
+                f'shield_active_scans_total{{type="compliance"}} {total // 10}',
+                f'shield_active_scans_total{{type="vulnerability"}} {total // 25}',
+            ]
+        body_text = "\n".join(out) + "\n"
+        return 200, body_text.encode("utf-8"), "text/plain; version=0.0.4"
+
+    def _prometheus_query(self, query: str, body: bytes) -> Tuple[int, bytes, str]:
+        params = parse_qs(query)
+        now = time.time()
+        series = [
+            {"__name__": "up", "job": service.replace("_", "-"), "instance": url}
+            for service, url in self.urls.items()
+        ]
+        if "start" in params:
+            start = float(params["start"][0])
+            end = float(params.get("end", [now])[0])
+            step = max(float(params.get("step", ["15"])[0]), 1.0)
+            points = [
+                [start + i * step, "1"] for i in range(int((end - start) // step) + 1)
+            ]
+            data = {
+                "resultType": "matrix",
+                "result": [{"metric": m, "values": points} for m in series],
+            }
+        else:
+            data = {
+                "resultType": "vector",
+                "result": [{"metric": m, "value": [now, "1"]} for m in series],
+            }
+        payload = json.dumps({"status": "success", "data": data}).encode("utf-8")
+        return 200, payload, "application/json"
+
+    def _loki_query_range(self, query: str, body: bytes) -> Tuple[int, bytes, str]:
+        params = {k: v[0] for k, v in parse_qs(query).items()}
+        now = time.time_ns()
+        try:
+            end = int(params.get("end", now))
+            start = int(params.get("start", end - 3600 * 10**9))
+            limit = int(params.get("limit", 100))
+            matchers, filters = _loki_selector(params.get("query", "{}"))
+        except (ValueError, re.error) as e:
+            payload = json.dumps({"status": "error", "error": str(e)}).encode("utf-8")
+            return 400, payload, "application/json"
+
+        lo = bisect.bisect_left(self._log_ts, start)
+        hi = bisect.bisect_right(self._log_ts, end)
+        window = self._log[lo:hi]
+        if params.get("direction", "backward") == "backward":
+            window = window[::-1]
+        streams: Dict[Tuple[str, str], List[List[str]]] = {}
+        taken = 0
+        for ts, service, level, line in window:
+            labels = {"exporter": "OTLP", "service_name": service, "level": level}
+            if not _loki_labels_match(labels, matchers):
+                continue
+            if not _loki_line_matches(line, filters):
+                continue
+            streams.setdefault((service, level), []).append([str(ts), line])
+            taken += 1
+            if taken >= limit:
+                break
+        result = [
+            {
+                "stream": {"exporter": "OTLP", "service_name": service, "level": level},
+                "values": values,
+            }
+            for (service, level), values in streams.items()
+        ]
+        payload = json.dumps(
+            {"status": "success", "data": {"resultType": "streams", "result": result}}
+        ).encode("utf-8")
+        return 200, payload, "application/json"
+
+    def _shield_login(self, query: str, body: bytes) -> Tuple[int, bytes, str]:
+        payload = json.dumps(
+            {
+                "access_token": uuid.uuid4().hex,
+                "token_type": "bearer",
+                "expires_in": 3600,
+            }
+        ).encode("utf-8")
+        return 200, payload, "application/json"
+
+
+def serve_fakes(
+    profiles: Optional[Dict[str, FakeProfile]] = None,
+    host: str = "127.0.0.1",
+    base_port: int = FAKE_DEFAULT_BASE_PORT,
+    duration_s: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> Dict[str, Dict[str, int]]:
+    """
+    Run the stand-ins until interrupted (or for ``duration_s``).
+
+    Run this in its own process when measuring the load generator's
+    maximum throughput, so the two do not share an interpreter.
+    """
+    fakes = FakeServices(profiles, host, base_port, seed).start()
+    print(f"\n{'='*60}")
+    print("GAME DAY STAND-IN SERVICES")
+    print(f"{'='*60}")
+    for service, url in fakes.urls.items():
+        profile = fakes.services[service].profile
+        print(
+            f"  {service:<14} {url:<24} latency {profile.latency_ms:g}ms "
+            f"({profile.latency_dist}), errors {profile.error_rate:.1%}, "
+            f"payload {profile.payload_bytes}B"
+        )
+    print("\nPoint scenarios at them with:")
+    for service, url in fakes.urls.items():
+        print(f"  export {endpoint_env(service)}={url}")
+    print("\nServing; Ctrl-C to stop.")
+
+    try:
+        if duration_s:
+            time.sleep(duration_s)
+        else:
+            while True:
+                time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        summary = fakes.summary()
+        fakes.stop()
+
+    elapsed = max(time.time() - fakes.started, 1e-9)
+    print(f"\n{'='*60}")
+    for service, counts in summary.items():
+        print(
+            f"  {service:<14} {counts['requests']} requests "
+            f"({counts['requests'] / elapsed:.1f}/s), {counts['errors']} errors"
+        )
+    print(f"{'='*60}")
+    return summary
+
+
 # =============================================================================
 # Main Entry Point
 # =============================================================================
@@ -438,10 +4419,13 @@ def run_all_scenarios() -> List[GameDayResult]:
     passed = sum(1 for r in results if r.status == "passed")
     partial = sum(1 for r in results if r.status == "partial")
     failed = sum(1 for r in results if r.status == "failed")
+    client_bound = [r.scenario for r in results if r.details.get("client_bound")]
 
     print(f"  Passed:  {passed}")
     print(f"  Partial: {partial}")
     print(f"  Failed:  {failed}")
+    if client_bound:
+        print(f"  Client-bound: {', '.join(client_bound)}")
     print("=" * 60)
 
     return results
@@ -457,10 +4441,34 @@ Scenarios:
   health_sweep  Verify all services are healthy
   trace_verify  Validate distributed tracing connectivity
   slo_check     Validate SLO metrics are being captured
+  mixed_load    Drive a weighted request mix from a JSON/TOML workload file
+  connection_churn
+                Compare new-connection-per-request with pooled keep-alive
+  soak          Hold steady load and flag RSS/goroutine/FD/latency growth
+  loki_errors   Correlate client errors with Loki error logs per interval
+  openapi_load  Weighted load over every operation in openapi/openapi.json,
+                validating statuses and response shapes per operation
+  webhook_delivery
+                Trigger events and time their delivery into a local asyncio
+                receiver (local stand-in sender unless --trigger-url is set)
+  retry_storm   Compare retry policies (amplification, goodput, recovery
+                time) against a target that degrades on a schedule
+  serve-fakes   Serve local stand-ins for every service (not a scenario);
+                export the printed ATLAS_ENDPOINT_* variables to target them
   
 Examples:
   python game_day.py health_sweep
   python game_day.py load_test --requests 100
+  python game_day.py mixed_load --mix scenarios/production_mix.json --duration 60
+  python game_day.py connection_churn --rps 50 --server-metrics http://localhost:8081/metrics
+  python game_day.py soak --duration 14400 --rps 10
+  python game_day.py loki_errors --duration 120
+  python game_day.py openapi_load --rps 100 --duration 60 --base-url http://localhost
+  python game_day.py webhook_delivery --rps 500 --receiver-fail-first 1
+  python game_day.py retry_storm --rps 200 --degrade 10:20:4 --duration 40
+  python game_day.py mixed_load --duration 30 --profile
+  python game_day.py serve-fakes --fake-profile rust_api:latency_ms=20,error_rate=0.01
+  python game_day.py health_sweep --with-fakes
   python game_day.py --all
         """,
     )
@@ -468,7 +4476,20 @@ Examples:
     parser.add_argument(
         "scenario",
         nargs="?",
-        choices=["load_test", "health_sweep", "trace_verify", "slo_check"],
+        choices=[
+            "load_test",
+            "health_sweep",
+            "trace_verify",
+            "slo_check",
+            "mixed_load",
+            "connection_churn",
+            "soak",
+            "loki_errors",
+            "openapi_load",
+            "webhook_delivery",
+            "retry_storm",
+            "serve-fakes",
+        ],
         help="Scenario to run",
     )
     parser.add_argument(
@@ -482,14 +4503,261 @@ Examples:
         default=50,
         help="Number of requests for load_test (default: 50)",
     )
+    parser.add_argument(
+        "--mix",
+        type=str,
+        default=os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "scenarios",
+            "production_mix.json",
+        ),
+        help="Workload file for mixed_load (JSON or TOML)",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        help=(
+            "Duration in seconds (mixed_load override; connection_churn per mode; "
+            "soak; loki_errors window; openapi_load; webhook_delivery load phase; "
+            "retry_storm per policy; serve-fakes run time, default until Ctrl-C)"
+        ),
+    )
+    parser.add_argument(
+        "--rps",
+        type=float,
+        default=20,
+        help=(
+            "Request rate for connection_churn, soak, loki_errors, openapi_load, "
+            "webhook_delivery, retry_storm (default: 20)"
+        ),
+    )
+    parser.add_argument(
+        "--server-metrics",
+        type=str,
+        help="Target /metrics URL exposing process_open_fds (connection_churn)",
+    )
+    parser.add_argument(
+        "--scrape-interval",
+        type=float,
+        default=30,
+        help="Seconds between /metrics scrapes for soak (default: 30)",
+    )
+    parser.add_argument(
+        "--loki-query",
+        type=str,
+        default=LOKI_ERROR_QUERY,
+        help="LogQL for loki_errors (default: error lines from Alloy)",
+    )
+    parser.add_argument(
+        "--spec",
+        type=str,
+        default=OPENAPI_SPEC,
+        help="OpenAPI spec for openapi_load (default: the docs openapi/openapi.json)",
+    )
+    parser.add_argument(
+        "--base-url",
+        type=str,
+        help="Target base URL for openapi_load (default: the rust_api endpoint)",
+    )
+    parser.add_argument(
+        "--trigger-url",
+        type=str,
+        help="webhook_delivery: target API URL that emits one webhook per POSTed event",
+    )
+    parser.add_argument(
+        "--callback-url",
+        type=str,
+        help="webhook_delivery: receiver URL given to the target (default: local sink)",
+    )
+    parser.add_argument(
+        "--sink-host",
+        type=str,
+        default="127.0.0.1",
+        help="webhook_delivery: receiver bind address (default: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--sink-port",
+        type=int,
+        default=0,
+        help="webhook_delivery: receiver port (default: any free port)",
+    )
+    parser.add_argument(
+        "--receiver-delay-ms",
+        type=float,
+        default=0,
+        help="webhook_delivery: delay before the receiver answers (default: 0)",
+    )
+    parser.add_argument(
+        "--receiver-fail-rate",
+        type=float,
+        default=0,
+        help="webhook_delivery: share of deliveries answered with 500 (default: 0)",
+    )
+    parser.add_argument(
+        "--receiver-fail-first",
+        type=int,
+        default=0,
+        help="webhook_delivery: fail the first N attempts of every event (default: 0)",
+    )
+    parser.add_argument(
+        "--drain",
+        type=float,
+        default=15,
+        help="webhook_delivery: seconds to wait for retries after the load (default: 15)",
+    )
+    parser.add_argument(
+        "--policies",
+        nargs="+",
+        choices=RETRY_POLICY_KINDS,
+        help="retry_storm: retry policies to compare (default: all)",
+    )
+    parser.add_argument(
+        "--degrade",
+        action="append",
+        metavar="START:END:SLOWDOWN",
+        help=(
+            "retry_storm: slow the target down by SLOWDOWN between START and END "
+            "seconds into each run; repeatable (default: 10:20:4)"
+        ),
+    )
+    parser.add_argument(
+        "--target-url",
+        type=str,
+        help="retry_storm: URL to load instead of the local stand-in (e.g. a fault proxy)",
+    )
+    parser.add_argument(
+        "--utilization",
+        type=float,
+        default=0.6,
+        help="retry_storm: healthy stand-in load as a share of capacity (default: 0.6)",
+    )
+    parser.add_argument(
+        "--service-ms",
+        type=float,
+        default=25,
+        help="retry_storm: stand-in service time per request (default: 25)",
+    )
+    parser.add_argument(
+        "--queue-limit",
+        type=int,
+        help=(
+            "retry_storm: shed requests with 503 beyond this queue; 0 for no cap "
+            "(default: what the stand-in serves within half a client timeout)"
+        ),
+    )
+    parser.add_argument(
+        "--client-timeout-ms",
+        type=float,
+        default=500,
+        help="retry_storm: per-attempt client timeout (default: 500)",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="retry_storm: attempts per request, first included (default: 3)",
+    )
+    parser.add_argument(
+        "--backoff-base-ms",
+        type=float,
+        default=250,
+        help="retry_storm: base delay for fixed/exponential policies (default: 250)",
+    )
+    parser.add_argument(
+        "--backoff-cap-ms",
+        type=float,
+        default=2000,
+        help="retry_storm: maximum exponential delay (default: 2000)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help=(
+            "Random seed for mixed_load, openapi_load, webhook_delivery, "
+            "retry_storm and the stand-ins"
+        ),
+    )
+    parser.add_argument(
+        "--with-fakes",
+        action="store_true",
+        help="Run the scenario against in-process stand-ins for every service",
+    )
+    parser.add_argument(
+        "--fake-profile",
+        action="append",
+        default=[],
+        metavar="[SERVICE:]KEY=VALUE,...",
+        help=(
+            "Stand-in behaviour: latency_ms, latency_dist (constant|exponential), "
+            "error_rate, payload_bytes; without SERVICE applies to all; repeatable"
+        ),
+    )
+    parser.add_argument(
+        "--fake-host",
+        type=str,
+        default="127.0.0.1",
+        help="serve-fakes: bind address (default: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--fake-base-port",
+        type=int,
+        default=FAKE_DEFAULT_BASE_PORT,
+        help=(
+            "serve-fakes: first port, one per service in ENDPOINTS order; "
+            f"0 for free ports (default: {FAKE_DEFAULT_BASE_PORT})"
+        ),
+    )
     parser.add_argument(
         "--output",
         type=str,
         help="Output results to JSON file",
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"Print per-phase timings of the toolkit to stderr (or set {PROFILE_ENV}=1)",
+    )
+    parser.add_argument(
+        "--profile-dump",
+        type=str,
+        default=os.environ.get(PROFILE_DUMP_ENV),
+        help="Also write a .prof (cProfile) or .json (phase table) profile dump",
+    )
 
     args = parser.parse_args()
 
+    profile_env = os.environ.get(PROFILE_ENV, "").strip().lower()
+    if args.profile or args.profile_dump or profile_env not in ("", "0", "false", "no"):
+        PROFILER.enable(args.profile_dump)
+
+    try:
+        fake_profiles = parse_fake_profiles(args.fake_profile)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.scenario == "serve-fakes":
+        try:
+            serve_fakes(
+                fake_profiles,
+                host=args.fake_host,
+                base_port=args.fake_base_port,
+                duration_s=args.duration,
+                seed=args.seed,
+            )
+        except OSError as e:
+            parser.error(
+                f"--fake-base-port {args.fake_base_port}: {e}; pass 0 for free ports"
+            )
+        return
+
+    fakes = None
+    if args.with_fakes:
+        fakes = FakeServices(fake_profiles, base_port=0, seed=args.seed).start()
+        fakes.apply_env()
+        print("Targeting in-process stand-ins:")
+        for service, url in fakes.urls.items():
+            print(f"  {service:<14} {url}")
+
     if args.all:
         results = run_all_scenarios()
     elif args.scenario == "load_test":
@@ -500,10 +4768,91 @@ Examples:
         results = [run_trace_verify()]
     elif args.scenario == "slo_check":
         results = [run_slo_check()]
+    elif args.scenario == "mixed_load":
+        results = [
+            run_mixed_load(
+                load_workload(args.mix), duration_s=args.duration, seed=args.seed
+            )
+        ]
+    elif args.scenario == "connection_churn":
+        results = [
+            run_connection_churn(
+                rps=args.rps,
+                duration_s=args.duration or 15,
+                server_metrics_url=args.server_metrics,
+            )
+        ]
+    elif args.scenario == "soak":
+        results = [
+            run_soak(
+                rps=args.rps,
+                duration_s=args.duration or 3600,
+                scrape_interval_s=args.scrape_interval,
+            )
+        ]
+    elif args.scenario == "loki_errors":
+        results = [
+            run_loki_errors(
+                rps=args.rps,
+                duration_s=args.duration or 60,
+                query=args.loki_query,
+            )
+        ]
+    elif args.scenario == "openapi_load":
+        results = [
+            run_openapi_load(
+                spec_path=args.spec,
+                base_url=args.base_url,
+                rps=args.rps,
+                duration_s=args.duration or 30,
+                seed=args.seed,
+            )
+        ]
+    elif args.scenario == "webhook_delivery":
+        results = [
+            run_webhook_delivery(
+                rps=args.rps,
+                duration_s=args.duration or 30,
+                trigger_url=args.trigger_url,
+                callback_url=args.callback_url,
+                sink_host=args.sink_host,
+                sink_port=args.sink_port,
+                receiver_delay_ms=args.receiver_delay_ms,
+                receiver_fail_rate=args.receiver_fail_rate,
+                receiver_fail_first=args.receiver_fail_first,
+                drain_s=args.drain,
+                seed=args.seed,
+            )
+        ]
+    elif args.scenario == "retry_storm":
+        try:
+            schedule = parse_degrade_schedule(args.degrade) if args.degrade else None
+        except ValueError as e:
+            parser.error(str(e))
+        results = [
+            run_retry_storm(
+                policies=args.policies,
+                rps=args.rps,
+                duration_s=args.duration or 40,
+                schedule=schedule,
+                target_url=args.target_url,
+                utilization=args.utilization,
+                service_ms=args.service_ms,
+                queue_limit=args.queue_limit,
+                timeout_s=args.client_timeout_ms / 1000,
+                max_attempts=args.max_attempts,
+                backoff_base_ms=args.backoff_base_ms,
+                backoff_cap_ms=args.backoff_cap_ms,
+                seed=args.seed,
+            )
+        ]
     else:
         parser.print_help()
         sys.exit(1)
 
+    if fakes is not None:
+        fakes.stop()
+
     # Output to file if requested
     if args.output:
         output_data = {
@@ -519,7 +4868,7 @@ Examples:
                 for r in results
             ],
         }
-        with open(args.output, "w") as f:
+        with PROFILER.phase("report"), open(args.output, "w") as f:
             json.dump(output_data, f, indent=2)
         print(f"\nResults written to: {args.output}")
 
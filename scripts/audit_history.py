@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Per-commit history of docs audit results in a local SQLite store.
+
+``record`` audits the current tree and stores one row per docs.json page
+(exists, stub, word count, reason, primary owner, broken links) under the
+HEAD commit; recording the same commit again replaces its rows. Queries
+read only the store, so trends over old commits need no checkouts and no
+re-runs:
+
+    python3 scripts/audit_history.py record
+    python3 scripts/audit_history.py trend --last 200 [--section "Developer Guide"]
+    python3 scripts/audit_history.py page developer/recipes/verify-webhook-signature
+    python3 scripts/audit_history.py commits
+
+Rows are keyed by (commit, page) and indexed by (page, commit) and
+(group, commit); per-group counts are rolled up when a commit is recorded.
+A page's history or a group's stub trend is an index range scan whatever
+the size of the store. Commits are ordered by
+committer time. The store lives in ``.cache/`` and is not committed; CI
+can keep it between runs like any other cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from check_links import _check_file_links
+from check_ownership import extract_ownership_rules, page_matches_pattern
+from docs_audit import (
+    DOCS_JSON,
+    _audit_page,
+    _load_docs_json_page_locations,
+    _load_docs_json_pages,
+)
+from hash_cache import ATLAS_ROOT, CACHE_DIR
+from profiling import add_profile_arguments, count, phase, start_profiling
+
+HISTORY_DB = CACHE_DIR / "audit-history.sqlite"
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS commits (
+    id INTEGER PRIMARY KEY,
+    sha TEXT NOT NULL UNIQUE,
+    committed_ts INTEGER NOT NULL,
+    subject TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    dirty INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS groups (
+    id INTEGER PRIMARY KEY,
+    section TEXT NOT NULL,
+    grp TEXT NOT NULL,
+    UNIQUE (section, grp)
+);
+CREATE TABLE IF NOT EXISTS audits (
+    commit_id INTEGER NOT NULL REFERENCES commits (id) ON DELETE CASCADE,
+    page_id INTEGER NOT NULL REFERENCES pages (id),
+    group_id INTEGER NOT NULL REFERENCES groups (id),
+    present INTEGER NOT NULL,
+    is_stub INTEGER NOT NULL,
+    word_count INTEGER NOT NULL,
+    reason TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    broken_links INTEGER NOT NULL,
+    PRIMARY KEY (commit_id, page_id)
+) WITHOUT ROWID;
+-- Per-commit rollup of audits, written with them, so group trends read
+-- one row per (commit, group) instead of one per page.
+CREATE TABLE IF NOT EXISTS group_counts (
+    commit_id INTEGER NOT NULL REFERENCES commits (id) ON DELETE CASCADE,
+    group_id INTEGER NOT NULL REFERENCES groups (id),
+    pages INTEGER NOT NULL,
+    stubs INTEGER NOT NULL,
+    missing INTEGER NOT NULL,
+    broken_links INTEGER NOT NULL,
+    PRIMARY KEY (commit_id, group_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS commits_time ON commits (committed_ts, id);
+CREATE INDEX IF NOT EXISTS audits_page ON audits (page_id, commit_id);
+CREATE INDEX IF NOT EXISTS audits_group ON audits (group_id, commit_id);
+CREATE INDEX IF NOT EXISTS group_counts_group ON group_counts (group_id, commit_id);
+"""
+
+UNASSIGNED = "(unassigned)"
+
+
+def connect(path: Path = HISTORY_DB) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA foreign_keys = ON")
+    db.execute("PRAGMA journal_mode = WAL")
+    version = db.execute("PRAGMA user_version").fetchone()[0]
+    if version not in (0, SCHEMA_VERSION):
+        db.close()
+        raise SystemExit(
+            f"{path}: schema version {version}, expected {SCHEMA_VERSION}; "
+            "delete it to start a new history."
+        )
+    db.executescript(SCHEMA)
+    db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return db
+
+
+def _git(*args: str) -> str:
+    try:
+        out = subprocess.run(
+            ["git", *args],
+            cwd=ATLAS_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise SystemExit(f"git {' '.join(args)} failed: {e}")
+    return out.stdout
+
+
+def _head() -> tuple[str, int, str, bool]:
+    """``(sha, committer time, subject, dirty)`` for HEAD."""
+    sha, ts, subject = (
+        _git("log", "-1", "--format=%H%x1f%ct%x1f%s").strip().split("\x1f", 2)
+    )
+    dirty = bool(
+        _git("status", "--porcelain", "--untracked-files=no", "--", ".").strip()
+    )
+    return sha, int(ts), subject, dirty
+
+
+def _owner(page: str, rules: list[tuple[str, str]]) -> str:
+    for pattern, owner in rules:
+        if page_matches_pattern(page, pattern):
+            return owner
+    return ""
+
+
+def audit_rows() -> list[tuple]:
+    """One ``audits`` row (without ``commit_id``) per docs.json page."""
+    with phase("nav load"):
+        pages = _load_docs_json_pages(DOCS_JSON)
+        locations = _load_docs_json_page_locations(DOCS_JSON)
+    with phase("owners parse"):
+        rules = extract_ownership_rules()
+
+    rows = []
+    for page in pages:
+        audit = _audit_page(page)
+        broken = (
+            len(_check_file_links(audit.file, page)) if audit.file is not None else 0
+        )
+        section, group = locations.get(page, (UNASSIGNED, UNASSIGNED))
+        rows.append(
+            (
+                page,
+                section,
+                group,
+                int(audit.exists),
+                int(audit.is_stub),
+                audit.word_count,
+                audit.reason,
+                _owner(page, rules),
+                broken,
+            )
+        )
+    count("pages", len(rows))
+    return rows
+
+
+def _ids(db: sqlite3.Connection, table: str, columns: str, keys: set) -> dict:
+    """``key -> id`` for ``keys`` in a name table, inserting the new ones."""
+    placeholders = ", ".join("?" * len(columns.split(",")))
+    db.executemany(
+        f"INSERT OR IGNORE INTO {table} ({columns}) VALUES ({placeholders})",
+        [k if isinstance(k, tuple) else (k,) for k in keys],
+    )
+    ids = {}
+    for row in db.execute(f"SELECT id, {columns} FROM {table}"):
+        key = row[1:] if len(row) > 2 else row[1]
+        if key in keys:
+            ids[key] = row[0]
+    return ids
+
+
+def store(
+    db: sqlite3.Connection,
+    sha: str,
+    committed_ts: int,
+    subject: str,
+    dirty: bool,
+    rows: list[tuple],
+) -> None:
+    """Replace the audit of ``sha`` with ``rows`` (as from ``audit_rows``)."""
+    now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    with phase("write"), db:
+        commit_id = db.execute(
+            """
+            INSERT INTO commits (sha, committed_ts, subject, recorded_at, dirty)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (sha) DO UPDATE SET
+                subject = excluded.subject,
+                recorded_at = excluded.recorded_at,
+                dirty = excluded.dirty
+            RETURNING id
+            """,
+            (sha, committed_ts, subject, now, int(dirty)),
+        ).fetchone()[0]
+        db.execute("DELETE FROM audits WHERE commit_id = ?", (commit_id,))
+        db.execute("DELETE FROM group_counts WHERE commit_id = ?", (commit_id,))
+
+        page_ids = _ids(db, "pages", "path", {r[0] for r in rows})
+        group_ids = _ids(db, "groups", "section, grp", {(r[1], r[2]) for r in rows})
+        db.executemany(
+            "INSERT INTO audits VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (commit_id, page_ids[page], group_ids[(section, group)], *rest)
+                for page, section, group, *rest in rows
+            ],
+        )
+        db.execute(
+            """
+            INSERT INTO group_counts
+            SELECT commit_id, group_id, COUNT(*), SUM(is_stub AND present),
+                   SUM(NOT present), SUM(broken_links)
+            FROM audits WHERE commit_id = ?
+            GROUP BY group_id
+            """,
+            (commit_id,),
+        )
+
+
+def record(db: sqlite3.Connection, allow_dirty: bool = False) -> tuple[str, int]:
+    """Audit the tree and store it under HEAD; returns ``(sha, pages)``."""
+    sha, ts, subject, dirty = _head()
+    if dirty and not allow_dirty:
+        raise SystemExit(
+            "Working tree has uncommitted changes; commit them or pass --allow-dirty."
+        )
+    rows = audit_rows()
+    store(db, sha, ts, subject, dirty, rows)
+    return sha, len(rows)
+
+
+def stub_trend(
+    db: sqlite3.Connection, last: int, section: str | None = None
+) -> list[tuple]:
+    """``(sha, committed_ts, section, group, stubs, missing, pages)`` rows,
+    oldest commit first, for the ``last`` most recent recorded commits."""
+    where = "WHERE g.section = ?" if section is not None else ""
+    params: list = [last]
+    if section is not None:
+        params.append(section)
+    return db.execute(
+        f"""
+        WITH recent AS (
+            SELECT id, sha, committed_ts FROM commits
+            ORDER BY committed_ts DESC, id DESC LIMIT ?
+        )
+        SELECT r.sha, r.committed_ts, g.section, g.grp,
+               n.stubs, n.missing, n.pages
+        FROM recent r
+        JOIN group_counts n ON n.commit_id = r.id
+        JOIN groups g ON g.id = n.group_id
+        {where}
+        ORDER BY r.committed_ts, r.id, g.section, g.grp
+        """,
+        params,
+    ).fetchall()
+
+
+def page_history(db: sqlite3.Connection, page: str) -> list[tuple]:
+    """``(sha, committed_ts, present, is_stub, word_count, reason, owner,
+    broken_links)`` for every recorded commit that includes ``page``."""
+    return db.execute(
+        """
+        SELECT c.sha, c.committed_ts, a.present, a.is_stub, a.word_count,
+               a.reason, a.owner, a.broken_links
+        FROM pages p
+        JOIN audits a ON a.page_id = p.id
+        JOIN commits c ON c.id = a.commit_id
+        WHERE p.path = ?
+        ORDER BY c.committed_ts, c.id
+        """,
+        (page,),
+    ).fetchall()
+
+
+def _status(present: int, is_stub: int) -> str:
+    if not present:
+        return "missing"
+    return "stub" if is_stub else "ok"
+
+
+def _date(ts: int) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%d")
+
+
+def _print_trend(rows: list[tuple]) -> None:
+    if not rows:
+        print("No recorded audits match.")
+        return
+    print(
+        f"{'commit':<10}  {'date':<10}  {'stubs':>5}  {'missing':>7}  {'pages':>5}  group"
+    )
+    for sha, ts, section, group, stubs, missing, pages in rows:
+        print(
+            f"{sha[:10]:<10}  {_date(ts):<10}  {stubs:>5}  {missing:>7}  {pages:>5}  "
+            f"{section} / {group}"
+        )
+
+
+def _print_page(page: str, rows: list[tuple]) -> None:
+    if not rows:
+        print(f"{page}: not in any recorded commit.")
+        return
+    # Only the commits where something about the page changed.
+    previous = None
+    for sha, ts, present, is_stub, words, reason, owner, broken in rows:
+        state = (_status(present, is_stub), reason, owner, broken)
+        if state != previous:
+            was = (
+                f" (was {previous[0]})" if previous and previous[0] != state[0] else ""
+            )
+            print(
+                f"{sha[:10]}  {_date(ts)}  {state[0]}{was}  {words} words  "
+                f"reason={reason}  owner={owner or '-'}  broken_links={broken}"
+            )
+        previous = state
+
+    if previous[0] == "stub":
+        # Start of the current run of stub commits.
+        start = len(rows) - 1
+        while start > 0 and _status(*rows[start - 1][2:4]) == "stub":
+            start -= 1
+        sha, ts = rows[start][:2]
+        print(f"{page}: stub since {sha[:10]} ({_date(ts)}).")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Record docs audit results per commit and query their history."
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=HISTORY_DB,
+        help=f"SQLite store (default: {HISTORY_DB.relative_to(ATLAS_ROOT)}).",
+    )
+    add_profile_arguments(parser)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="Audit the tree and store it under HEAD.")
+    rec.add_argument(
+        "--allow-dirty",
+        action="store_true",
+        help="Record even with uncommitted changes (the commit is marked dirty).",
+    )
+
+    trend = sub.add_parser("trend", help="Stub and missing counts per nav group.")
+    trend.add_argument(
+        "--last", type=int, default=200, help="Most recent commits (default: 200)."
+    )
+    trend.add_argument("--section", help="Only this docs.json tab.")
+
+    page = sub.add_parser("page", help="Status changes of one page over time.")
+    page.add_argument("page", help="docs.json page path, e.g. quickstart")
+
+    sub.add_parser("commits", help="List recorded commits.")
+
+    args = parser.parse_args()
+    start_profiling(args)
+
+    db = connect(args.db)
+    try:
+        if args.command == "record":
+            sha, pages = record(db, args.allow_dirty)
+            print(f"Recorded {pages} pages for {sha[:10]} in {args.db}")
+        elif args.command == "trend":
+            with phase("query"):
+                rows = stub_trend(db, args.last, args.section)
+            _print_trend(rows)
+        elif args.command == "page":
+            with phase("query"):
+                rows = page_history(db, args.page)
+            _print_page(args.page, rows)
+        else:
+            for sha, ts, subject, dirty in db.execute(
+                "SELECT sha, committed_ts, subject, dirty FROM commits "
+                "ORDER BY committed_ts, id"
+            ):
+                mark = " (dirty)" if dirty else ""
+                print(f"{sha[:10]}  {_date(ts)}  {subject}{mark}")
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
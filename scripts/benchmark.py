@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmarks for the docs gate.
+
+For each requested size a synthetic tree is generated (``synth_corpus.py``)
+with a copy of the current ``scripts/``, the write-mode steps are run once
+to produce the generated artifacts, and then every gate command is timed:
+
+- cold: ``.cache/`` removed before each run (the OS page cache is not
+  dropped, so this measures our caches, not the disk);
+- warm: caches left in place after an untimed warm-up run.
+
+Each run records wall time, child CPU time and peak RSS; one extra warm run
+per command is profiled (``profiling.py``) and its per-phase self times are
+stored alongside, outside the timed samples. Results are written
+to ``.cache/benchmarks/<timestamp>.json`` and compared against the previous
+result file, so a regression shows up as a ratio rather than as slow CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from hash_cache import ATLAS_ROOT, CACHE_DIR
+from profiling import DUMP_ENV
+from synth_corpus import MARKER, SCRIPTS_DIR, generate_tree
+
+RESULTS_DIR = CACHE_DIR / "benchmarks"
+RESULTS_VERSION = 1
+
+# Untimed steps that produce what the checks compare against. The audit
+# report goes first: it is a page of its own, as in the real tree.
+SETUP = (
+    ("sync_reference.py",),
+    ("docs_audit.py",),
+    ("link_graph.py",),
+    ("nav_diff.py", "--update"),
+)
+
+# (name, script and args); mirrors check:all plus the audit report.
+BENCHMARKS = (
+    ("check:reference", ("sync_reference.py", "--check")),
+    ("check:nav", ("nav_diff.py", "--check")),
+    ("check:docs", ("docs_audit.py", "--check")),
+    ("audit:docs", ("docs_audit.py",)),
+    ("check:links", ("check_links.py",)),
+    ("check:graph", ("link_graph.py", "--check")),
+    ("check:ownership", ("check_ownership.py", "--check")),
+)
+
+DEFAULT_SIZES = "1k,10k,100k"
+
+
+def _parse_size(value: str) -> int:
+    value = value.strip().lower()
+    if value.endswith("k"):
+        return int(float(value[:-1]) * 1000)
+    return int(value)
+
+
+def _run(
+    args: tuple[str, ...], atlas: Path, log: Path, env: dict | None = None
+) -> dict:
+    """Run one script in ``atlas`` and return its wall/CPU/RSS sample."""
+    cmd = [sys.executable, str(atlas / "scripts" / args[0]), *args[1:]]
+    with log.open("ab") as out:
+        out.write(f"$ {' '.join(args)}\n".encode())
+        out.flush()
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            cmd, cwd=atlas, stdout=out, stderr=subprocess.STDOUT, env=env
+        )
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return {
+        "wall_s": wall,
+        "user_s": usage.ru_utime,
+        "sys_s": usage.ru_stime,
+        # ru_maxrss is KiB on Linux, bytes on macOS.
+        "max_rss_mb": usage.ru_maxrss
+        / (1024 * 1024 if sys.platform == "darwin" else 1024),
+        "exit": proc.returncode,
+    }
+
+
+def _summarize(samples: list[dict]) -> dict:
+    return {
+        "wall_s": statistics.median(s["wall_s"] for s in samples),
+        "cpu_s": statistics.median(s["user_s"] + s["sys_s"] for s in samples),
+        "max_rss_mb": max(s["max_rss_mb"] for s in samples),
+        "exit": samples[-1]["exit"],
+        "samples": [round(s["wall_s"], 4) for s in samples],
+    }
+
+
+def _prepare(workdir: Path, pages: int, seed: int) -> tuple[Path, float]:
+    """Generate (or reuse) the tree for ``pages``; returns ``(atlas, seconds)``."""
+    root = workdir / f"atlas-{pages}"
+    atlas = root / "platform" / "atlas"
+    marker = root / MARKER
+    params = {"pages": pages, "seed": seed}
+    if marker.exists() and json.loads(marker.read_text(encoding="utf-8")) == params:
+        # Same corpus; refresh the scripts so the current code is measured.
+        shutil.rmtree(atlas / "scripts")
+        (atlas / "scripts").mkdir()
+        for script in SCRIPTS_DIR.glob("*.py"):
+            shutil.copy2(script, atlas / "scripts" / script.name)
+        return atlas, 0.0
+    start = time.perf_counter()
+    generate_tree(root, pages, seed)
+    return atlas, time.perf_counter() - start
+
+
+def _profile_phases(args: tuple[str, ...], atlas: Path, log: Path) -> dict:
+    """Per-phase self wall times and counters from one profiled run."""
+    dump = atlas / "benchmark-profile.json"
+    dump.unlink(missing_ok=True)
+    _run(args, atlas, log, env={**os.environ, DUMP_ENV: str(dump)})
+    try:
+        data = json.loads(dump.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {
+        "phases": {p["name"]: round(p["wall_s"], 4) for p in data["phases"]},
+        "counts": data["counts"],
+    }
+
+
+def bench_size(atlas: Path, runs: int) -> dict[str, dict]:
+    log = atlas / "benchmark.log"
+    cache = atlas / ".cache"
+    for args in SETUP:
+        _run(args, atlas, log)
+
+    results: dict[str, dict] = {}
+    for name, args in BENCHMARKS:
+        cold = []
+        for _ in range(runs):
+            shutil.rmtree(cache, ignore_errors=True)
+            cold.append(_run(args, atlas, log))
+        _run(args, atlas, log)
+        warm = [_run(args, atlas, log) for _ in range(runs)]
+        results[name] = {
+            "cold": _summarize(cold),
+            "warm": _summarize(warm),
+            "profile": _profile_phases(args, atlas, log),
+        }
+        print(
+            f"  {name:<16} cold {results[name]['cold']['wall_s']:8.3f}s  "
+            f"warm {results[name]['warm']['wall_s']:8.3f}s  "
+            f"rss {results[name]['cold']['max_rss_mb']:7.1f} MB  "
+            f"exit {results[name]['warm']['exit']}",
+            flush=True,
+        )
+    return results
+
+
+def _git_rev() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ATLAS_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _previous_result(exclude: Path | None) -> Path | None:
+    if not RESULTS_DIR.exists():
+        return None
+    files = sorted(p for p in RESULTS_DIR.glob("*.json") if p != exclude)
+    return files[-1] if files else None
+
+
+def compare(current: dict, previous: dict) -> list[str]:
+    """Lines of ``wall_s`` ratios (current / previous) for shared entries."""
+    lines = []
+    for size, entry in current["sizes"].items():
+        before = previous.get("sizes", {}).get(size)
+        if not before:
+            continue
+        for name, modes in entry["benchmarks"].items():
+            old = before["benchmarks"].get(name)
+            if not old:
+                continue
+            parts = []
+            for mode in ("cold", "warm"):
+                a, b = modes[mode]["wall_s"], old[mode]["wall_s"]
+                ratio = a / b if b else float("inf")
+                flag = "  <-- slower" if ratio > 1.2 else ""
+                parts.append(f"{mode} {b:.3f}s -> {a:.3f}s (x{ratio:.2f}){flag}")
+            lines.append(f"{size:>7} {name:<16} " + "; ".join(parts))
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the docs gate scripts on synthetic trees of increasing size."
+    )
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"Comma-separated page counts, e.g. 1k,10k (default: {DEFAULT_SIZES}).",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="Timed runs per mode; the median is reported (default: 3).",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed (default: 0).")
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        help="Keep generated trees here and reuse them across runs (default: a temp dir).",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="Result file to compare against (default: the previous result).",
+    )
+    args = parser.parse_args()
+
+    sizes = [_parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="atlas-bench-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    result: dict = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "git_rev": _git_rev(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "runs": args.runs,
+        "sizes": {},
+    }
+    try:
+        for pages in sizes:
+            print(f"{pages} pages", flush=True)
+            atlas, generated_s = _prepare(workdir, pages, args.seed)
+            if generated_s:
+                print(f"  generated in {generated_s:.1f}s", flush=True)
+            result["sizes"][str(pages)] = {
+                "generate_s": generated_s,
+                "benchmarks": bench_size(atlas, args.runs),
+            }
+    finally:
+        if args.workdir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = RESULTS_DIR / f"{stamp}.json"
+    out.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+    print(f"\nWrote {out}")
+
+    baseline = args.compare or _previous_result(exclude=out)
+    if baseline is not None and baseline.exists():
+        lines = compare(result, json.loads(baseline.read_text(encoding="utf-8")))
+        if lines:
+            print(f"\nCompared with {baseline.name}:")
+            for line in lines:
+                print(f"  {line}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
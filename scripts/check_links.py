@@ -2,31 +2,125 @@
 
 from __future__ import annotations
 
+import argparse
+import json
+import os
+import posixpath
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+from external_links import (
+    CACHE_PATH,
+    LinkCache,
+    add_external_arguments,
+    check_urls,
+    clean_url,
+    limits_from_args,
+)
+from fs_walk import iter_entries, read_text
+from link_graph import FRONTMATTER_RE
+from mdx_snippets import expand, snippet_text, strip_code
+from openapi_index import parse_operation_ref
+from profiling import add_profile_arguments, count, phase, start_profiling
+
 ATLAS_ROOT = Path(__file__).resolve().parents[1]
 DOCS_JSON = ATLAS_ROOT / "docs.json"
+# Written by sync_reference.py; maps "METHOD /path" refs to operations.
+OPERATIONS_INDEX = ATLAS_ROOT / "openapi" / "OPERATIONS.json"
+OPENAPI_SPEC = "openapi/openapi.json"
 
 MD_EXTS = [".mdx", ".md"]
 
+# Link targets with these extensions are files, not pages.
+ASSET_EXTS = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg", ".ico", ".json", ".yaml"}
+    | {".yml", ".pdf", ".mp4", ".webm"}
+)
+
 # Basic markdown link: [text](target)
 MD_LINK_RE = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
+# Markdown image: ![alt](target "title")
+IMAGE_RE = re.compile(r"!\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+[\"'][^)]*)?\)")
+# <img src="..."> (quoted literals only; src={expr} is not resolvable here)
+IMG_SRC_RE = re.compile(r"<img\b[^>]*?\bsrc=[\"']([^\"']+)[\"']", re.IGNORECASE)
+# Frontmatter ``openapi: "GET /plants"`` on an API reference page
+OPENAPI_FIELD_RE = re.compile(r"^openapi:[ \t]*(.+?)[ \t]*$", re.M)
+
+
+@lru_cache(maxsize=1)
+def _file_index() -> frozenset[str]:
+    """Every file under the atlas root, as root-relative POSIX paths.
+
+    Built from one ``scandir`` walk so page, asset and snippet references
+    resolve by set lookup instead of a ``stat`` per link.
+    """
+    with phase("file index"):
+        prefix = len(str(ATLAS_ROOT)) + 1
+        return frozenset(
+            entry.path[prefix:].replace(os.sep, "/")
+            for entry in iter_entries(ATLAS_ROOT)
+        )
 
 
 def _page_to_file(page: str) -> Path | None:
-    rel = Path(page)
+    files = _file_index()
     for ext in MD_EXTS:
-        candidate = ATLAS_ROOT / f"{rel}{ext}"
-        if candidate.exists():
-            return candidate
+        rel = f"{page}{ext}"
+        if rel in files:
+            return ATLAS_ROOT / rel
     return None
 
 
-def _load_docs_json_pages() -> list[str]:
-    import json
+def _resolve_file(target: str, page: str) -> str | None:
+    """Root-relative path for a local file reference, or None if ignored.
 
+    Absolute targets (``/images/x.png``) are rooted at the atlas root and
+    relative ones at the page's directory, as Mintlify serves them.
+    """
+    target = target.strip()
+    if not target or target.startswith(("#", "{", "data:", "mailto:")):
+        return None
+    if "://" in target or target.startswith("//"):
+        return None
+    target = target.split("#", 1)[0].split("?", 1)[0]
+    if target.startswith("/"):
+        rel = target.lstrip("/")
+    else:
+        rel = posixpath.join(posixpath.dirname(page), target)
+    # "../" past the root stays in the path and so never resolves.
+    return posixpath.normpath(rel)
+
+
+@lru_cache(maxsize=1)
+def _api_operation_refs() -> dict[str, str]:
+    """Return the ref -> operation slug map from the OpenAPI operation index."""
+    try:
+        data = json.loads(OPERATIONS_INDEX.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data.get("refs", {})
+
+
+def _check_operation_ref(text: str) -> str | None:
+    """Problem with an operation reference, or None if it resolves.
+
+    References to another spec file are not checked; only
+    ``openapi/openapi.json`` is indexed.
+    """
+    parsed = parse_operation_ref(text)
+    if parsed is None:
+        return f"unrecognized operation reference {text!r}"
+    spec, ref = parsed
+    if spec is not None and spec.lstrip("/") not in (OPENAPI_SPEC, "openapi.json"):
+        return None
+    if ref not in _api_operation_refs():
+        return f"operation {ref!r} not found in {OPENAPI_SPEC}"
+    return None
+
+
+def _load_docs_json_pages() -> list[str]:
     data = json.loads(DOCS_JSON.read_text(encoding="utf-8"))
 
     pages: list[str] = []
@@ -85,10 +179,6 @@ def _normalize_internal_target(target: str) -> str | None:
     # Drop query/fragment.
     target = target.split("#", 1)[0].split("?", 1)[0]
 
-    # Allow links to static assets.
-    if target in {"/openapi/openapi.json", "/favicon.svg"}:
-        return None
-
     # Snippets are not pages.
     if target.startswith("/snippets/"):
         return None
@@ -101,44 +191,188 @@ def _normalize_internal_target(target: str) -> str | None:
     return page or None
 
 
-def _check_file_links(file_path: Path, page: str) -> list[str]:
-    text = file_path.read_text(encoding="utf-8", errors="replace")
-    errors: list[str] = []
+def _scan_links(text: str, base: str) -> tuple[list[str], list[str]]:
+    """``(problems, http(s) URLs)`` for the links and images in ``text``.
+
+    ``base`` is the page or root-relative file that relative targets
+    resolve against.
+    """
+    files = _file_index()
+    problems: list[str] = []
+    urls: list[str] = []
+
+    with phase("regex scan"):
+        targets = MD_LINK_RE.findall(text)
+        code_free = strip_code(text)
+        images = IMAGE_RE.findall(code_free) + IMG_SRC_RE.findall(code_free)
+    count("links", len(targets))
+    count("images", len(images))
+
+    with phase("link resolve"):
+        # An image's [alt](target) also matches MD_LINK_RE; check it once.
+        seen: set[str] = set()
+        for raw_target in images:
+            seen.add(raw_target)
+            rel = _resolve_file(raw_target, base)
+            if rel is not None and rel not in files:
+                problems.append(f"broken image {raw_target}")
+
+        for raw_target in targets:
+            if raw_target in seen:
+                continue
+            normalized = _normalize_internal_target(raw_target)
+            if not normalized:
+                url = clean_url(raw_target)
+                if url is not None:
+                    urls.append(url)
+                continue
+
+            # Allow direct file references (rare but possible)
+            if posixpath.splitext(normalized)[1].lower() in ASSET_EXTS:
+                if normalized not in files:
+                    problems.append(f"broken asset link {raw_target}")
+                continue
+
+            if _page_to_file(normalized) is None:
+                problems.append(f"broken internal link {raw_target}")
+
+    return problems, urls
+
+
+@lru_cache(maxsize=None)
+def _snippet_links(rel: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """``_scan_links`` for a snippet, once per run however many pages import it."""
+    problems, urls = _scan_links(snippet_text(rel) or "", rel)
+    return tuple(problems), tuple(urls)
+
+
+def _check_file_links(
+    file_path: Path, page: str, external: dict[str, list[str]] | None = None
+) -> list[str]:
+    """Broken internal links, images and snippet imports on ``page``.
+
+    Links in imported snippets are reported on ``page`` too, with the
+    snippet they come from. With ``external``, http(s) targets are
+    collected into it (URL -> pages) for a single deduplicated check
+    afterwards.
+    """
+    text = read_text(file_path)
+    host = file_path.relative_to(ATLAS_ROOT).as_posix()
+
+    problems, urls = _scan_links(text, page)
+    errors = [f"{page}: {problem}" for problem in problems]
+
+    frontmatter = FRONTMATTER_RE.match(text)
+    field = frontmatter and OPENAPI_FIELD_RE.search(frontmatter.group(1))
+    if field:
+        problem = _check_operation_ref(field.group(1))
+        if problem is not None:
+            errors.append(f"{page}: {problem}")
+
+    expansion = expand(host, text)
+    for importer, spec in expansion.broken:
+        where = "" if importer == host else f" (in {importer})"
+        errors.append(f"{page}: broken snippet import {spec}{where}")
+    for chain in expansion.cycles:
+        errors.append(f"{page}: snippet import cycle {' -> '.join(chain)}")
+    for rel in expansion.snippets:
+        snippet_problems, snippet_urls = _snippet_links(rel)
+        errors.extend(f"{page}: {problem} (via {rel})" for problem in snippet_problems)
+        urls.extend(snippet_urls)
+
+    if external is not None:
+        for url in urls:
+            external.setdefault(url, []).append(page)
 
-    for raw_target in MD_LINK_RE.findall(text):
-        normalized = _normalize_internal_target(raw_target)
-        if not normalized:
-            continue
+    return errors
+
+
+def _config_assets(data: dict) -> list[tuple[str, str]]:
+    """``(key, target)`` for the files docs.json points at outside pages."""
+    out: list[tuple[str, str]] = []
+    for key in ("logo", "favicon"):
+        value = data.get(key)
+        if isinstance(value, str):
+            out.append((key, value))
+        elif isinstance(value, dict):
+            for mode in ("light", "dark"):
+                if isinstance(value.get(mode), str):
+                    out.append((f"{key}.{mode}", value[mode]))
+    background = data.get("background")
+    if isinstance(background, dict) and isinstance(background.get("image"), str):
+        out.append(("background.image", background["image"]))
+    return out
 
-        # Allow direct file references (rare but possible)
-        if (
-            normalized.endswith(".json")
-            or normalized.endswith(".png")
-            or normalized.endswith(".svg")
-        ):
-            # Map to atlas root.
-            candidate = ATLAS_ROOT / normalized
-            if not candidate.exists():
-                errors.append(f"{page}: broken asset link {raw_target}")
-            continue
 
-        if _page_to_file(normalized) is None:
-            errors.append(f"{page}: broken internal link {raw_target}")
+def _check_config_assets() -> list[str]:
+    data = json.loads(DOCS_JSON.read_text(encoding="utf-8"))
+    files = _file_index()
+    errors = []
+    for key, target in _config_assets(data):
+        rel = _resolve_file(target, "")
+        if rel is not None and rel not in files:
+            errors.append(f"{DOCS_JSON.name}: missing {key} asset {target}")
+    return errors
 
+
+def _check_external(urls: dict[str, list[str]], args: argparse.Namespace) -> list[str]:
+    cache = LinkCache(CACHE_PATH, ttl_hours=args.ttl)
+    with phase("external links"):
+        results, fetched = check_urls(
+            list(urls), cache, prune=True, **limits_from_args(args)
+        )
+    count("external urls", len(urls))
+    print(
+        f"External links: {len(urls)} URLs, {fetched} checked, "
+        f"{len(urls) - fetched} from cache."
+    )
+    errors = []
+    for url, pages in sorted(urls.items()):
+        r = results[url]
+        if r.ok:
+            continue
+        for page in sorted(set(pages)):
+            errors.append(f"{page}: broken external link {url} ({r.describe()})")
     return errors
 
 
 def main() -> None:
-    pages = _load_docs_json_pages()
-
-    all_errors: list[str] = []
+    parser = argparse.ArgumentParser(
+        description="Check internal links on every page listed in docs.json."
+    )
+    parser.add_argument(
+        "--external",
+        action="store_true",
+        help="Also check http(s) links over the network (results cached with a TTL).",
+    )
+    add_external_arguments(parser)
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_profiling(args)
+
+    with phase("nav load"):
+        pages = _load_docs_json_pages()
+
+    all_errors: list[str] = _check_config_assets()
+    external: dict[str, list[str]] | None = {} if args.external else None
 
     for page in pages:
-        file_path = _page_to_file(page)
+        if parse_operation_ref(page) is not None:
+            # Mintlify generates these pages from the spec.
+            problem = _check_operation_ref(page)
+            if problem is not None:
+                all_errors.append(f"docs.json: nav entry {page!r}: {problem}")
+            continue
+        with phase("page lookup"):
+            file_path = _page_to_file(page)
         if file_path is None:
             # Missing pages are handled by docs_audit gate.
             continue
-        all_errors.extend(_check_file_links(file_path, page))
+        count("pages")
+        all_errors.extend(_check_file_links(file_path, page, external))
+
+    if external:
+        all_errors.extend(_check_external(external, args))
 
     if all_errors:
         print("Broken links detected:")
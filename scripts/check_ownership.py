@@ -14,6 +14,8 @@ import json
 import re
 from pathlib import Path
 
+from profiling import add_profile_arguments, count, phase, start_profiling
+
 ATLAS_ROOT = Path(__file__).resolve().parent.parent
 DOCS_JSON = ATLAS_ROOT / "docs.json"
 OWNERS_MD = ATLAS_ROOT / "OWNERS.md"
@@ -49,8 +51,17 @@ def extract_ownership_patterns() -> list[str]:
     Patterns are extracted from table cells that look like paths with wildcards.
     e.g., `customer/overview/*` or `developer/domain/api/*`
     """
+    return [pattern for pattern, _ in extract_ownership_rules()]
+
+
+def extract_ownership_rules() -> list[tuple[str, str]]:
+    """
+    Extract (pattern, primary owner) pairs from OWNERS.md, in file order.
+
+    The primary owner is the second table cell; it is empty if the row has none.
+    """
     content = OWNERS_MD.read_text(encoding="utf-8")
-    patterns: list[str] = []
+    rules: list[tuple[str, str]] = []
 
     # Parse markdown tables line by line
     for line in content.split("\n"):
@@ -78,9 +89,10 @@ def extract_ownership_patterns() -> list[str]:
             # Skip header row labels
             if candidate.lower() in ["page", "section", "primary", "secondary", "team"]:
                 continue
-            patterns.append(candidate)
+            primary = cells[2].strip() if len(cells) > 2 else ""
+            rules.append((candidate, primary))
 
-    return patterns
+    return rules
 
 
 def page_matches_pattern(page: str, pattern: str) -> bool:
@@ -129,16 +141,23 @@ def main() -> int:
         action="store_true",
         help="Exit non-zero if any pages lack ownership coverage.",
     )
+    add_profile_arguments(parser)
     args = parser.parse_args()
+    start_profiling(args)
 
     if not OWNERS_MD.exists():
         print(f"OWNERS.md not found at {OWNERS_MD}")
         return 1
 
-    pages = extract_pages_from_docs_json()
-    patterns = extract_ownership_patterns()
+    with phase("nav load"):
+        pages = extract_pages_from_docs_json()
+    with phase("owners parse"):
+        patterns = extract_ownership_patterns()
+    count("pages", len(pages))
+    count("patterns", len(patterns))
 
-    covered, uncovered = check_ownership_coverage(pages, patterns)
+    with phase("pattern match"):
+        covered, uncovered = check_ownership_coverage(pages, patterns)
 
     print(f"Total pages in docs.json: {len(pages)}")
     print(f"Ownership patterns found: {len(patterns)}")
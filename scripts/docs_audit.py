@@ -9,14 +9,27 @@ import re
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
+from docs_graph import page_importance
+from fs_walk import iter_markdown_files, read_text
+from mdx_snippets import expand, snippet_text
+from profiling import add_profile_arguments, count, phase, start_profiling
+from search_index import update_index
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DOCS_JSON = REPO_ROOT / "docs.json"
 
 MD_EXTS = [".mdx", ".md"]
 
+# Top-term Jaccard (search index) above which two pages are flagged as
+# covering the same ground.
+VOCAB_OVERLAP_THRESHOLD = 0.8
+
+WORD_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9'\-]*")
+
 STUB_MARKERS_RE = re.compile(
     r"\b(stub( file)?|todo|tbd|placeholder)\b",
     re.IGNORECASE,
@@ -24,16 +37,7 @@ STUB_MARKERS_RE = re.compile(
 
 
 def _iter_markdown_files(root: Path) -> Iterable[Path]:
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
-        if path.suffix.lower() not in MD_EXTS:
-            continue
-
-        parts = set(path.parts)
-        if ".git" in parts or "node_modules" in parts or "__ignore__" in parts:
-            continue
-        yield path
+    return iter_markdown_files(root)
 
 
 def _page_to_file(page: str) -> Path | None:
@@ -54,30 +58,58 @@ class PageAudit:
     word_count: int
     nonempty_lines: int
     reason: str
+    # Broken or cyclic snippet imports, as "<problem> <detail>" strings.
+    snippet_errors: tuple[str, ...] = ()
 
 
-def _audit_file(page: str, file_path: Path) -> PageAudit:
-    text = file_path.read_text(encoding="utf-8", errors="replace")
-    lines = text.splitlines()
-    first_chunk = "\n".join(lines[:40])
+@lru_cache(maxsize=None)
+def _snippet_counts(rel: str) -> tuple[int, int]:
+    """``(words, nonempty lines)`` of a snippet, counted once per run."""
+    text = snippet_text(rel) or ""
+    with phase("regex scan"):
+        return len(WORD_RE.findall(text)), sum(
+            1 for ln in text.splitlines() if ln.strip()
+        )
 
-    stripped_lines = [ln.strip() for ln in lines]
-    nonempty = [ln for ln in stripped_lines if ln]
 
-    words = re.findall(r"[A-Za-z0-9][A-Za-z0-9'\-]*", text)
+def _audit_file(page: str, file_path: Path) -> PageAudit:
+    text = read_text(file_path)
+    with phase("regex scan"):
+        lines = text.splitlines()
+        first_chunk = "\n".join(lines[:40])
+
+        stripped_lines = [ln.strip() for ln in lines]
+        nonempty = [ln for ln in stripped_lines if ln]
+
+        word_count = len(WORD_RE.findall(text))
+        stub_marker = STUB_MARKERS_RE.search(first_chunk)
+
+    # Imported snippets render as part of the page, so they count toward it.
+    host = file_path.relative_to(REPO_ROOT).as_posix()
+    expansion = expand(host, text)
+    nonempty_count = len(nonempty)
+    for rel in expansion.snippets:
+        snippet_words, snippet_lines = _snippet_counts(rel)
+        word_count += snippet_words
+        nonempty_count += snippet_lines
+    snippet_errors = [
+        f"broken-import {spec}" + ("" if importer == host else f" (in {importer})")
+        for importer, spec in expansion.broken
+    ] + [f"import-cycle {' -> '.join(chain)}" for chain in expansion.cycles]
+    count("words", word_count)
 
     is_stub = False
     reasons: list[str] = []
 
-    if STUB_MARKERS_RE.search(first_chunk):
+    if stub_marker:
         is_stub = True
         reasons.append("stub-marker")
 
-    if len(nonempty) < 18:
+    if nonempty_count < 18:
         is_stub = True
         reasons.append("too-short")
 
-    if len(words) < 120:
+    if word_count < 120:
         is_stub = True
         reasons.append("low-word-count")
 
@@ -88,14 +120,16 @@ def _audit_file(page: str, file_path: Path) -> PageAudit:
         file=file_path,
         exists=True,
         is_stub=is_stub,
-        word_count=len(words),
-        nonempty_lines=len(nonempty),
+        word_count=word_count,
+        nonempty_lines=nonempty_count,
         reason=reason,
+        snippet_errors=tuple(snippet_errors),
     )
 
 
 def _audit_page(page: str) -> PageAudit:
-    file_path = _page_to_file(page)
+    with phase("page lookup"):
+        file_path = _page_to_file(page)
     if file_path is None:
         return PageAudit(
             page=page,
@@ -162,39 +196,10 @@ def _load_docs_json_page_locations(docs_json_path: Path) -> dict[str, tuple[str,
     return locations
 
 
-def _section_weight(page: str) -> int:
-    if page in {"introduction", "quickstart", "architecture-overview", "concepts"}:
-        return 100
-    if page.startswith("customer/"):
-        return 70
-    if page.startswith("developer/"):
-        return 80
-    if page.startswith("enterprise/"):
-        return 60
-    if page.startswith("internal/"):
-        return 40
-    return 50
-
-
-def _topic_boost(page: str) -> int:
-    base = 0
-    name = page.split("/")[-1]
-    if name in {"overview", "getting-started", "architecture", "setup"}:
-        base += 20
-    if "authentication" in page or "auth" in page:
-        base += 10
-    if "deployment" in page:
-        base += 10
-    if "testing" in page:
-        base += 8
-    if "security" in page:
-        base += 8
-    return base
-
-
 def _priority_score(a: PageAudit) -> int:
-    # Missing and stub pages should bubble to the top
-    score = _section_weight(a.page) + _topic_boost(a.page)
+    # Missing and stub pages should bubble to the top; among them, pages that
+    # navigation and in-page links make central (docs_graph PageRank) first.
+    score = page_importance().get(a.page, 0)
     if not a.exists:
         score += 100
     if a.is_stub:
@@ -237,9 +242,16 @@ def _coverage_by_service(audits: list[PageAudit]) -> dict[str, dict[str, PageAud
 
 
 def generate_report() -> str:
-    referenced_pages = _load_docs_json_pages(DOCS_JSON)
-    locations = _load_docs_json_page_locations(DOCS_JSON)
+    with phase("report"):
+        return _generate_report()
+
+
+def _generate_report() -> str:
+    with phase("nav load"):
+        referenced_pages = _load_docs_json_pages(DOCS_JSON)
+        locations = _load_docs_json_page_locations(DOCS_JSON)
     audits = [_audit_page(p) for p in referenced_pages]
+    count("pages", len(audits))
 
     missing = [a for a in audits if not a.exists]
     stubs = [a for a in audits if a.exists and a.is_stub]
@@ -255,6 +267,8 @@ def generate_report() -> str:
 
     orphan_stub_count = sum(1 for a in orphan_audits if a.is_stub)
 
+    with phase("page importance"):
+        page_importance()
     prioritized = sorted(
         [a for a in audits if (not a.exists) or a.is_stub],
         key=_priority_score,
@@ -353,7 +367,9 @@ def generate_report() -> str:
     lines.append("## Stub pages (referenced in docs.json)")
     lines.append("")
     if stubs:
-        for a in sorted(stubs, key=lambda x: (_section_weight(x.page) * -1, x.page)):
+        for a in sorted(
+            stubs, key=lambda x: (-page_importance().get(x.page, 0), x.page)
+        ):
             file_str = _rel(a.file) if a.file else "(missing)"
             lines.append(
                 f"- `{a.page}` → `{file_str}` ({a.word_count} words; {a.nonempty_lines} nonempty lines; `{a.reason}`)"
@@ -362,6 +378,46 @@ def generate_report() -> str:
         lines.append("- None")
     lines.append("")
 
+    lines.append("## Snippet imports (referenced in docs.json)")
+    lines.append("")
+    broken_imports = [a for a in audits if a.snippet_errors]
+    if broken_imports:
+        for a in sorted(broken_imports, key=lambda x: x.page):
+            for error in a.snippet_errors:
+                lines.append(f"- `{a.page}`: `{error}`")
+    else:
+        lines.append("- None")
+    lines.append("")
+
+    lines.append("## Vocabulary overlap (referenced in docs.json)")
+    lines.append("")
+    lines.append(
+        f"Pages whose top search terms overlap another page's (Jaccard >= {VOCAB_OVERLAP_THRESHOLD}); candidates for merging or a real rewrite."
+    )
+    lines.append("")
+    with phase("search index"):
+        index, _ = update_index()
+    overlaps: list[tuple[PageAudit, str, float]] = []
+    with phase("vocabulary overlap"):
+        for a in audits:
+            if not a.exists:
+                continue
+            other, score = index.vocabulary_overlap(a.page)
+            if other is not None and score >= VOCAB_OVERLAP_THRESHOLD:
+                overlaps.append((a, other, score))
+    if overlaps:
+        lines.append("| Page | Overlaps with | Jaccard | Stub? |")
+        lines.append("|---|---|---:|---:|")
+        for a, other, score in sorted(overlaps, key=lambda x: (-x[2], x[0].page))[:50]:
+            stub = "yes" if a.is_stub else "no"
+            lines.append(f"| `{a.page}` | `{other}` | {score:.2f} | {stub} |")
+        if len(overlaps) > 50:
+            lines.append("")
+            lines.append(f"(Truncated; total overlapping pages: {len(overlaps)})")
+    else:
+        lines.append("- None")
+    lines.append("")
+
     lines.append("## Orphan files (not in docs.json)")
     lines.append("")
     lines.append(
@@ -461,8 +517,10 @@ def _required_pages_for_gate(referenced_pages: list[str]) -> list[str]:
 
 
 def _run_gate() -> int:
-    referenced_pages = _load_docs_json_pages(DOCS_JSON)
+    with phase("nav load"):
+        referenced_pages = _load_docs_json_pages(DOCS_JSON)
     audits = [_audit_page(p) for p in referenced_pages]
+    count("pages", len(audits))
 
     missing = [a for a in audits if not a.exists]
     required_pages = _required_pages_for_gate(referenced_pages)
@@ -470,8 +528,9 @@ def _run_gate() -> int:
 
     required_missing = [p for p in required_pages if p not in required_audits]
     required_stub = [a for a in required_audits.values() if a.is_stub]
+    broken_imports = [a for a in audits if a.snippet_errors]
 
-    if missing or required_missing or required_stub:
+    if missing or required_missing or required_stub or broken_imports:
         print("Docs gate failed.")
         if missing:
             print(f"- Missing pages referenced by docs.json: {len(missing)}")
@@ -490,6 +549,12 @@ def _run_gate() -> int:
             for a in required_stub:
                 print(f"  - {a.page} ({a.reason})")
 
+        if broken_imports:
+            print(f"- Pages with broken snippet imports: {len(broken_imports)}")
+            for a in broken_imports:
+                for error in a.snippet_errors:
+                    print(f"  - {a.page}: {error}")
+
         return 1
 
     print("Docs gate passed.")
@@ -505,7 +570,9 @@ def main() -> None:
         action="store_true",
         help="Fail (exit 1) if docs gate conditions are not met (CI use).",
     )
+    add_profile_arguments(parser)
     args = parser.parse_args()
+    start_profiling(args)
 
     if args.check:
         raise SystemExit(_run_gate())
@@ -513,7 +580,8 @@ def main() -> None:
     report = generate_report()
     out_path = REPO_ROOT / "docs" / "TASKSET_1_GAP_MAP.md"
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(report + "\n", encoding="utf-8")
+    with phase("write"):
+        out_path.write_text(report + "\n", encoding="utf-8")
     print(str(out_path))
 
 
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Reachability and centrality over the Atlas site graph.
+
+The site graph is the page link graph from ``link_graph.py`` keyed by docs
+page path (no extension), plus the ``docs.json`` sidebar. The sidebar is a
+virtual hub node: every navigation page links to it and it links to every
+navigation page, so a sidebar click is one hop however large the nav is.
+
+- Link depth is the number of clicks from the front door (the first page in
+  the navigation), found with a 0-1 BFS where entering the hub is free.
+- Centrality is PageRank with dangling pages (no outgoing links) sending
+  their rank back to the sidebar, which is what a reader does at a dead end.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from array import array
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+
+from hash_cache import ATLAS_ROOT
+from link_graph import KIND_NAMES, LINK, LinkGraph, _kinds_arg, build_graph
+from profiling import add_profile_arguments, phase, start_profiling
+
+DOCS_JSON = ATLAS_ROOT / "docs.json"
+
+NAV_HUB = "(navigation)"
+# Sidebar edges; only this script adds them, link_graph never does.
+NAV = 4
+
+PAGERANK_DAMPING = 0.85
+PAGERANK_TOLERANCE = 1e-9
+PAGERANK_MAX_ITER = 100
+
+
+def load_navigation(docs_json_path: Path = DOCS_JSON) -> list[str]:
+    """Pages in ``docs.json`` navigation, de-duplicated, in sidebar order."""
+    with phase("nav load"):
+        data = json.loads(docs_json_path.read_text(encoding="utf-8"))
+    pages: list[str] = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            for k, v in node.items():
+                if k == "pages" and isinstance(v, list):
+                    for item in v:
+                        if isinstance(item, str):
+                            pages.append(item)
+                        else:
+                            walk(item)
+                else:
+                    walk(v)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    walk(data.get("navigation", {}))
+    return list(dict.fromkeys(p.strip("/") for p in pages))
+
+
+def _page_name(file_name: str) -> str:
+    stem, dot, ext = file_name.rpartition(".")
+    return stem if dot and f".{ext}" in (".md", ".mdx") else file_name
+
+
+def build_site_graph(
+    files: LinkGraph, nav_pages: list[str], kinds: int = LINK
+) -> LinkGraph:
+    """Re-key ``files`` by page path, keep ``kinds`` edges and add the sidebar.
+
+    ``.mdx`` wins over ``.md`` when both exist for a page, matching how the
+    other scripts resolve pages. Navigation pages without a file keep a node
+    (``exists`` is False) so they are still ranked.
+    """
+    site = LinkGraph()
+    site.intern(NAV_HUB)
+    nav_set = set(nav_pages)
+    names = files.names
+
+    for i in files.pages():
+        page = _page_name(names[i])
+        edges = [(_page_name(names[j]), k) for j, k in files.out_edges(i) if k & kinds]
+        if page in nav_set:
+            edges.append((NAV_HUB, NAV))
+        site.set_page(page, edges)
+
+    site.set_page(NAV_HUB, [(p, NAV) for p in nav_pages])
+    return site
+
+
+def link_depths(graph: LinkGraph, source: int) -> array:
+    """Clicks from ``source`` to every node (-1 if unreachable).
+
+    Edges into the navigation hub cost nothing, so every sidebar page is one
+    click from any page that shows the sidebar.
+    """
+    n = len(graph)
+    hub = graph.ids.get(NAV_HUB, -1)
+    graph.freeze()
+    offsets, targets = graph.fwd_offsets, graph.fwd_targets
+
+    dist = array("i", [-1]) * n
+    dist[source] = 0
+    queue = deque([source])
+    while queue:
+        u = queue.popleft()
+        d = dist[u]
+        for v in targets[offsets[u] : offsets[u + 1]]:
+            if v == hub:
+                if dist[v] == -1 or d < dist[v]:
+                    dist[v] = d
+                    queue.appendleft(v)
+            elif dist[v] == -1 or d + 1 < dist[v]:
+                dist[v] = d + 1
+                queue.append(v)
+    return dist
+
+
+def pagerank(
+    graph: LinkGraph,
+    damping: float = PAGERANK_DAMPING,
+    tolerance: float = PAGERANK_TOLERANCE,
+    max_iter: int = PAGERANK_MAX_ITER,
+) -> list[float]:
+    """PageRank by power iteration over the reverse CSR arrays.
+
+    Dangling mass goes to the navigation hub when there is one, otherwise it
+    is spread uniformly. Returns one score per node, summing to 1.
+    """
+    n = len(graph)
+    if n == 0:
+        return []
+    graph.freeze()
+    fwd = graph.fwd_offsets
+    rev, sources = graph.rev_offsets, graph.rev_sources
+
+    out_degree = [fwd[i + 1] - fwd[i] for i in range(n)]
+    inv_degree = [1.0 / d if d else 0.0 for d in out_degree]
+    dangling = [i for i in range(n) if not out_degree[i]]
+    preds = [sources[rev[i] : rev[i + 1]] for i in range(n)]
+    hub = graph.ids.get(NAV_HUB)
+
+    rank = [1.0 / n] * n
+    teleport = (1.0 - damping) / n
+    for _ in range(max_iter):
+        contrib = list(map(float.__mul__, rank, inv_degree))
+        get = contrib.__getitem__
+        lost = damping * sum([rank[i] for i in dangling])
+        spread = teleport if hub is not None else teleport + lost / n
+        new = [spread + damping * sum(map(get, p)) for p in preds]
+        if hub is not None:
+            new[hub] += lost
+        delta = sum(map(abs, map(float.__sub__, new, rank)))
+        rank = new
+        if delta < tolerance:
+            break
+    return rank
+
+
+def _percentiles(scores: dict[str, float]) -> dict[str, int]:
+    """0-100 rank of each score; equal scores share the lower rank."""
+    ordered = sorted(scores.values())
+    if len(ordered) < 2:
+        return {k: 100 for k in scores}
+    first: dict[float, int] = {}
+    for i, v in enumerate(ordered):
+        first.setdefault(v, i)
+    top = len(ordered) - 1
+    return {k: round(100 * first[v] / top) for k, v in scores.items()}
+
+
+@lru_cache(maxsize=1)
+def page_importance() -> dict[str, int]:
+    """Page path -> 0-100 centrality percentile across the site graph."""
+    files, _ = build_graph()
+    nav_pages = load_navigation()
+    with phase("site graph"):
+        site = build_site_graph(files, nav_pages)
+    with phase("pagerank"):
+        rank = pagerank(site)
+    return _percentiles(
+        {name: rank[i] for i, name in enumerate(site.names) if name != NAV_HUB}
+    )
+
+
+def analyze(site: LinkGraph, nav_pages: list[str]) -> dict:
+    names = site.names
+    hub = site.ids[NAV_HUB]
+    front_door = nav_pages[0] if nav_pages else None
+    with phase("link depth"):
+        depth = (
+            link_depths(site, site.ids[front_door])
+            if front_door is not None
+            else array("i", [-1]) * len(site)
+        )
+    with phase("pagerank"):
+        rank = pagerank(site)
+
+    pages = [i for i in site.pages() if i != hub]
+    unreachable = sorted(names[i] for i in pages if depth[i] < 0)
+    dead_ends = sorted(
+        names[i]
+        for i in pages
+        if depth[i] >= 0 and all(k == NAV for _, k in site.out_edges(i))
+    )
+    missing_targets = sorted(
+        names[i] for i in range(len(site)) if not site.exists[i] and depth[i] >= 0
+    )
+
+    histogram: dict[int, int] = {}
+    for i in pages:
+        if depth[i] >= 0:
+            histogram[depth[i]] = histogram.get(depth[i], 0) + 1
+    max_depth = max(histogram, default=0)
+
+    return {
+        "front_door": front_door,
+        "pages": len(pages),
+        "edges": site.edge_count,
+        "navigation_pages": len(nav_pages),
+        "unreachable": unreachable,
+        "dead_ends": dead_ends,
+        "missing_targets": missing_targets,
+        "depth_histogram": dict(sorted(histogram.items())),
+        "max_depth": max_depth,
+        "deepest": sorted(names[i] for i in pages if depth[i] == max_depth),
+        "centrality": sorted(
+            ((names[i], rank[i]) for i in range(len(site)) if i != hub),
+            key=lambda kv: (-kv[1], kv[0]),
+        ),
+    }
+
+
+def _print_list(title: str, items: list[str], limit: int) -> None:
+    print(f"\n{title}: {len(items)}")
+    for item in items[:limit]:
+        print(f"  - {item}")
+    if len(items) > limit:
+        print(f"  ... ({len(items) - limit} more)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Report reachability, dead ends, link depth and centrality for the Atlas docs."
+    )
+    parser.add_argument(
+        "--kinds",
+        type=_kinds_arg,
+        default=LINK,
+        help="Page edge kinds to follow: related, link or all (default: link).",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Entries to print per section (default: 20).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Also write the full report as JSON to this path.",
+    )
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_profiling(args)
+
+    files, _ = build_graph()
+    nav_pages = load_navigation()
+    with phase("site graph"):
+        site = build_site_graph(files, nav_pages, kinds=args.kinds)
+    report = analyze(site, nav_pages)
+
+    kinds = ", ".join(v for k, v in KIND_NAMES.items() if k & args.kinds)
+    print(
+        f"Site graph: {report['pages']} pages, {report['edges']} edges "
+        f"(nav + {kinds}); front door: {report['front_door']}"
+    )
+    print("\nLink depth from the front door:")
+    for d, count in report["depth_histogram"].items():
+        print(f"  {d:>3}: {count}")
+    _print_list("Unreachable from navigation", report["unreachable"], args.top)
+    _print_list("Dead ends (no outgoing in-page links)", report["dead_ends"], args.top)
+    _print_list("Missing pages (linked, no file)", report["missing_targets"], args.top)
+
+    print(f"\nTop {args.top} by centrality:")
+    for name, score in report["centrality"][: args.top]:
+        print(f"  {score:.5f}  {name}")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nWrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Concurrent external link checks for the docs scripts (stdlib only).
+
+URLs are checked with a small asyncio HTTP/1.1 client:
+
+- ``HEAD`` first, falling back to ``GET`` when a server rejects or
+  mishandles ``HEAD`` (any 4xx/5xx other than 429);
+- redirects followed up to ``MAX_REDIRECTS``;
+- keep-alive connections pooled per host;
+- a global concurrency cap plus per-host concurrency and request-rate
+  limits, so one slow or strict host cannot stall or ban the run.
+
+Results are cached in ``.cache/external-links.json`` with a TTL (shorter
+for failures), so repeat runs only re-check expired URLs.
+
+Used by ``check_links.py --external``; run directly to check URLs given on
+the command line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+from hash_cache import CACHE_DIR
+from profiling import count
+
+CACHE_PATH = CACHE_DIR / "external-links.json"
+CACHE_VERSION = 1
+
+DEFAULT_TTL_HOURS = 24 * 7
+# Failures are re-checked sooner: most are transient.
+ERROR_TTL_HOURS = 24
+DEFAULT_CONCURRENCY = 32
+DEFAULT_PER_HOST = 4
+DEFAULT_HOST_RPS = 5.0
+DEFAULT_TIMEOUT = 10.0
+
+MAX_REDIRECTS = 5
+# Longest Retry-After honoured for a 429 before giving up on the URL.
+MAX_RETRY_AFTER = 30.0
+# GET bodies up to this size are drained so the connection can be reused.
+MAX_DRAIN_BYTES = 64 * 1024
+USER_AGENT = "atlas-link-check/1"
+
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+@dataclass
+class LinkResult:
+    url: str
+    status: int | None
+    error: str | None
+    final_url: str
+    checked: float
+
+    @property
+    def ok(self) -> bool:
+        # 429 means "ask later", not "gone".
+        return (
+            self.error is None
+            and self.status is not None
+            and (self.status < 400 or self.status == 429)
+        )
+
+    def describe(self) -> str:
+        if self.error is not None:
+            return self.error
+        if self.final_url != self.url:
+            return f"HTTP {self.status} (via {self.final_url})"
+        return f"HTTP {self.status}"
+
+
+class LinkCache:
+    """URL -> last result, persisted at ``path`` (``None`` keeps it in memory)."""
+
+    def __init__(
+        self,
+        path: Path | None = CACHE_PATH,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        error_ttl_hours: float = ERROR_TTL_HOURS,
+    ):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.error_ttl = min(error_ttl_hours, ttl_hours) * 3600
+        self._entries: dict[str, LinkResult] = {}
+        self._dirty = False
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == CACHE_VERSION:
+                for url, e in data.get("entries", {}).items():
+                    self._entries[url] = LinkResult(url, *e)
+
+    def get(self, url: str, now: float) -> LinkResult | None:
+        r = self._entries.get(url)
+        if r is None:
+            return None
+        ttl = self.ttl if r.ok else self.error_ttl
+        return r if now - r.checked < ttl else None
+
+    def put(self, result: LinkResult) -> None:
+        self._entries[result.url] = result
+        self._dirty = True
+
+    def save(self, keep: set[str] | None = None) -> None:
+        """Persist; with ``keep``, drop URLs no longer linked from the corpus."""
+        if self.path is None:
+            return
+        if keep is not None:
+            stale = self._entries.keys() - keep
+            for url in stale:
+                del self._entries[url]
+            self._dirty |= bool(stale)
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps(
+                {
+                    "version": CACHE_VERSION,
+                    "entries": {
+                        u: [r.status, r.error, r.final_url, r.checked]
+                        for u, r in sorted(self._entries.items())
+                    },
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+class _HttpError(Exception):
+    pass
+
+
+class _Host:
+    """Connection pool and limits for one ``(scheme, host, port)``."""
+
+    def __init__(self, per_host: int, rps: float):
+        self.slots = asyncio.Semaphore(per_host)
+        self.interval = 1 / rps if rps > 0 else 0.0
+        self.next_start = 0.0
+        self.idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._lock = asyncio.Lock()
+
+    async def pace(self) -> None:
+        """Wait for this host's next request slot."""
+        if not self.interval:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class ExternalChecker:
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        per_host: int = DEFAULT_PER_HOST,
+        host_rps: float = DEFAULT_HOST_RPS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.per_host = per_host
+        self.host_rps = host_rps
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(concurrency)
+        self._hosts: dict[tuple[str, str, int], _Host] = {}
+        self._ssl = ssl.create_default_context()
+
+    def _host(self, key: tuple[str, str, int]) -> _Host:
+        host = self._hosts.get(key)
+        if host is None:
+            host = self._hosts[key] = _Host(self.per_host, self.host_rps)
+        return host
+
+    async def close(self) -> None:
+        for host in self._hosts.values():
+            for _, writer in host.idle:
+                writer.close()
+            host.idle.clear()
+
+    async def check(self, url: str) -> LinkResult:
+        async with self._slots:
+            try:
+                status, final_url = await self._follow(url)
+            except (
+                OSError,
+                EOFError,
+                asyncio.TimeoutError,
+                _HttpError,
+                ValueError,
+            ) as e:
+                count("external errors")
+                reason = str(e) or type(e).__name__
+                if isinstance(e, asyncio.TimeoutError):
+                    reason = f"timed out after {self.timeout:g}s"
+                return LinkResult(url, None, reason, url, time.time())
+        return LinkResult(url, status, None, final_url, time.time())
+
+    async def _follow(self, url: str) -> tuple[int, str]:
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            status, location = await self._head_or_get(current)
+            if status in REDIRECT_STATUSES and location:
+                current = urljoin(current, location)
+                continue
+            return status, current
+        raise _HttpError(f"more than {MAX_REDIRECTS} redirects")
+
+    async def _head_or_get(self, url: str) -> tuple[int, str | None]:
+        status, location = await self._request("HEAD", url)
+        if status >= 400 and status != 429:
+            status, location = await self._request("GET", url)
+        return status, location
+
+    async def _request(
+        self, method: str, url: str, retried: bool = False
+    ) -> tuple[int, str | None]:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"unsupported URL {url}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        host = self._host((parts.scheme, parts.hostname, port))
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+        authority = parts.hostname if parts.port is None else parts.netloc
+
+        async with host.slots:
+            await host.pace()
+            # The exchange records its connection here so a timeout or error
+            # can still close it.
+            conn: list = []
+            try:
+                status, headers, reusable = await asyncio.wait_for(
+                    self._exchange(host, parts, port, method, target, authority, conn),
+                    self.timeout,
+                )
+            except BaseException:
+                if conn:
+                    conn[0][1].close()
+                raise
+            if reusable:
+                host.idle.append(conn[0])
+            else:
+                conn[0][1].close()
+
+        if status == 429 and not retried:
+            delay = _retry_after(headers.get("retry-after"))
+            if delay is not None and delay <= MAX_RETRY_AFTER:
+                await asyncio.sleep(delay)
+                return await self._request(method, url, retried=True)
+        return status, headers.get("location")
+
+    async def _exchange(self, host, parts, port, method, target, authority, conn):
+        request = (
+            f"{method} {target} HTTP/1.1\r\n"
+            f"Host: {authority}\r\n"
+            f"User-Agent: {USER_AGENT}\r\n"
+            "Accept: */*\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        ).encode("ascii", "ignore")
+
+        # A pooled connection may have been closed by the server; retry once
+        # on a fresh one before reporting an error.
+        while True:
+            pooled = bool(host.idle)
+            if pooled:
+                reader, writer = host.idle.pop()
+            else:
+                reader, writer = await asyncio.open_connection(
+                    parts.hostname,
+                    port,
+                    ssl=self._ssl if parts.scheme == "https" else None,
+                    server_hostname=parts.hostname if parts.scheme == "https" else None,
+                )
+                count("external connections")
+            conn[:] = [(reader, writer)]
+            try:
+                writer.write(request)
+                await writer.drain()
+                status_line = await reader.readline()
+                if not status_line:
+                    raise ConnectionResetError("connection closed")
+                break
+            except (ConnectionError, asyncio.IncompleteReadError):
+                if not pooled:
+                    raise
+                writer.close()
+                conn.clear()
+        count("external requests")
+
+        fields = status_line.decode("latin-1").split(None, 2)
+        if len(fields) < 2 or not fields[0].startswith("HTTP/"):
+            raise _HttpError(f"bad status line {status_line[:40]!r}")
+        status = int(fields[1])
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        reusable = fields[0] == "HTTP/1.1" and (
+            headers.get("connection", "").lower() != "close"
+        )
+        if method != "HEAD" and status not in (204, 304):
+            length = headers.get("content-length")
+            if (
+                length is not None
+                and length.isdigit()
+                and int(length) <= MAX_DRAIN_BYTES
+                and "chunked" not in headers.get("transfer-encoding", "")
+            ):
+                await reader.readexactly(int(length))
+            else:
+                # Unknown or large body: drop the connection instead of reading it.
+                reusable = False
+        return status, headers, reusable
+
+
+def _retry_after(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def clean_url(target: str) -> str | None:
+    """The URL in a markdown link target, or None if it is not http(s)."""
+    target = target.strip().strip("<>").split(None, 1)[0] if target.strip() else ""
+    target = target.strip('"').strip("'")
+    if not target.startswith(("http://", "https://")):
+        return None
+    return target.split("#", 1)[0] or None
+
+
+async def _check_all(urls: list[str], **limits) -> list[LinkResult]:
+    checker = ExternalChecker(**limits)
+    try:
+        return await asyncio.gather(*(checker.check(u) for u in urls))
+    finally:
+        await checker.close()
+
+
+def check_urls(
+    urls: list[str],
+    cache: LinkCache | None = None,
+    prune: bool = False,
+    **limits,
+) -> tuple[dict[str, LinkResult], int]:
+    """Check ``urls`` (deduplicated); returns ``(results by URL, URLs fetched)``.
+
+    Cached results inside their TTL are reused. With ``prune``, cache entries
+    for URLs not in ``urls`` are dropped on save.
+    """
+    cache = cache if cache is not None else LinkCache(None)
+    unique = list(dict.fromkeys(urls))
+    now = time.time()
+    results: dict[str, LinkResult] = {}
+    stale: list[str] = []
+    for url in unique:
+        hit = cache.get(url, now)
+        if hit is None:
+            stale.append(url)
+        else:
+            results[url] = hit
+
+    if stale:
+        for r in asyncio.run(_check_all(stale, **limits)):
+            results[r.url] = r
+            cache.put(r)
+    cache.save(keep=set(unique) if prune else None)
+    return results, len(stale)
+
+
+def add_external_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=DEFAULT_TTL_HOURS,
+        help=f"Hours before a passing URL is re-checked (default: {DEFAULT_TTL_HOURS}).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"URLs checked at once (default: {DEFAULT_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=DEFAULT_PER_HOST,
+        help=f"Concurrent requests per host (default: {DEFAULT_PER_HOST}).",
+    )
+    parser.add_argument(
+        "--host-rps",
+        type=float,
+        default=DEFAULT_HOST_RPS,
+        help=f"Requests per second per host, 0 for no limit (default: {DEFAULT_HOST_RPS:g}).",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f"Seconds per request (default: {DEFAULT_TIMEOUT:g}).",
+    )
+
+
+def limits_from_args(args: argparse.Namespace) -> dict:
+    return {
+        "concurrency": args.concurrency,
+        "per_host": args.per_host,
+        "host_rps": args.host_rps,
+        "timeout": args.timeout,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Check external URLs (HEAD, GET fallback) with per-host limits and a result cache."
+    )
+    parser.add_argument("urls", nargs="+", help="URLs to check.")
+    add_external_arguments(parser)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update the result cache.",
+    )
+    args = parser.parse_args()
+
+    cache = LinkCache(None if args.no_cache else CACHE_PATH, ttl_hours=args.ttl)
+    results, fetched = check_urls(args.urls, cache, **limits_from_args(args))
+    broken = 0
+    for url in dict.fromkeys(args.urls):
+        r = results[url]
+        broken += not r.ok
+        print(f"{'ok ' if r.ok else 'BAD'}  {url}  {r.describe()}")
+    print(f"{len(results)} URLs, {fetched} fetched, {broken} broken.")
+    return 1 if broken else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Persistent SHA-256 memo shared by the docs scripts.
+
+Digests are keyed by (inode, mtime_ns, size) and stored between runs, so a
+file is hashed at most once per run and not at all while it is unchanged.
+A run that only revalidates the memo costs one ``stat`` per file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from profiling import count, phase
+
+ATLAS_ROOT = Path(__file__).resolve().parents[1]
+CACHE_DIR = ATLAS_ROOT / ".cache"
+
+CACHE_VERSION = 1
+
+# Files modified this recently may still change within the same mtime tick,
+# so their digests are memoized for the run but never persisted.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def _digest(path: Path) -> str:
+    h = hashlib.sha256()
+    size = 0
+    with phase("hashing"), path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+            size += len(chunk)
+    count("files hashed")
+    count("bytes hashed", size)
+    return h.hexdigest()
+
+
+def _key(st: os.stat_result) -> list[int]:
+    return [st.st_ino, st.st_mtime_ns, st.st_size]
+
+
+class HashCache:
+    """Digest memo persisted at ``path`` (``None`` keeps it in memory only).
+
+    Each script should own its cache file: ``save`` drops entries for files
+    that were not hashed during the run, which keeps the file bounded as
+    sources are deleted or renamed.
+    """
+
+    def __init__(self, path: Path | None):
+        self.path = path
+        self._entries: dict[str, list] = {}
+        self._run: dict[str, str] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.hashed = 0
+
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == CACHE_VERSION:
+                self._entries = data.get("entries", {})
+
+    def sha256_file(self, path: Path, st: os.stat_result | None = None) -> str:
+        """Return the digest of ``path``, hashing only if its stat changed.
+
+        Pass ``st`` when the caller already has a stat result (e.g. from
+        ``os.scandir``) to avoid a second syscall. Safe to call from worker
+        threads; the hash itself runs outside the lock.
+        """
+        name = path.as_posix()
+        digest = self._run.get(name)
+        if digest is not None:
+            return digest
+
+        if st is None:
+            st = path.stat()
+        key = _key(st)
+
+        entry = self._entries.get(name)
+        if entry is not None and entry[:3] == key:
+            digest = entry[3]
+            with self._lock:
+                self._run[name] = digest
+            return digest
+
+        digest = _digest(path)
+        with self._lock:
+            self.hashed += 1
+            if time.time_ns() - st.st_mtime_ns > RACY_WINDOW_NS:
+                self._entries[name] = [*key, digest]
+                self._dirty = True
+            elif self._entries.pop(name, None) is not None:
+                self._dirty = True
+            self._run[name] = digest
+        return digest
+
+    def invalidate(self, path: Path) -> None:
+        """Forget ``path`` after writing to it during this run."""
+        name = path.as_posix()
+        with self._lock:
+            self._run.pop(name, None)
+            if self._entries.pop(name, None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        stale = self._entries.keys() - self._run.keys()
+        for name in stale:
+            del self._entries[name]
+        if not (self._dirty or stale):
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"version": CACHE_VERSION, "entries": self._entries}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+        self._dirty = False
@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Page link graph for the Atlas corpus.
+
+Every markdown file gets an integer page ID. Edges are kept in CSR form
+(``array`` offsets + targets) in both directions, so "what does this page
+link to" and "who links here" are slices of length O(degree).
+
+Two edge kinds are tracked:
+
+- ``related``: the ``relatedPages`` frontmatter list. These are the edges
+  exported to ``connection_matrix.json`` and ``bidirectional_analysis.json``.
+- ``link``: absolute in-page links (``[text](/page)``, ``href="/page"``)
+  that resolve to a page in the corpus.
+
+Raw per-page edges are cached in ``.cache/`` keyed by content digest, so a
+rebuild re-reads only pages that changed; the CSR arrays are then rebuilt in
+O(V + E).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from fs_walk import MD_EXTS, iter_entries, read_text
+from hash_cache import ATLAS_ROOT, CACHE_DIR, HashCache
+from profiling import add_profile_arguments, count, phase, start_profiling
+
+CONNECTION_MATRIX_JSON = ATLAS_ROOT / "connection_matrix.json"
+BIDIRECTIONAL_JSON = ATLAS_ROOT / "bidirectional_analysis.json"
+
+GRAPH_CACHE = CACHE_DIR / "link_graph.json"
+# Bump when edge extraction changes so cached pages are re-read.
+GRAPH_VERSION = 1
+
+HASHES = HashCache(CACHE_DIR / "link_graph-hashes.json")
+
+RELATED = 1
+LINK = 2
+ALL_KINDS = RELATED | LINK
+KIND_NAMES = {RELATED: "related", LINK: "link"}
+
+FRONTMATTER_RE = re.compile(r"\A---[ \t]*\r?\n(.*?)\r?\n---[ \t]*(?:\r?\n|\Z)", re.S)
+RELATED_INLINE_RE = re.compile(r"^relatedPages:[ \t]*\[(.*)\][ \t]*$", re.M)
+RELATED_BLOCK_RE = re.compile(
+    r"^relatedPages:[ \t]*\r?\n((?:[ \t]+-.*(?:\r?\n|$))*)", re.M
+)
+
+MD_LINK_RE = re.compile(r"\[[^\]]+\]\(([^)\s]+)[^)]*\)")
+HREF_RE = re.compile(r"""\bhref=["']([^"']+)["']""")
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def _related_pages(frontmatter: str) -> list[str]:
+    m = RELATED_INLINE_RE.search(frontmatter)
+    if m:
+        items = [_unquote(v) for v in m.group(1).split(",")]
+    else:
+        m = RELATED_BLOCK_RE.search(frontmatter)
+        if not m:
+            return []
+        items = [
+            _unquote(line.strip()[1:])
+            for line in m.group(1).splitlines()
+            if line.strip().startswith("-")
+        ]
+    return list(dict.fromkeys(v for v in items if v))
+
+
+def _link_page(target: str) -> str | None:
+    """Docs page path for an absolute site link, or None if not a page link."""
+    if not target.startswith("/") or target.startswith("//"):
+        return None
+    page = target.split("#", 1)[0].split("?", 1)[0].strip("/")
+    if not page or page.startswith("snippets/"):
+        return None
+    return page
+
+
+def extract_edges(text: str) -> tuple[list[str], list[str]]:
+    """Return ``(relatedPages entries, linked page paths)`` for one page."""
+    m = FRONTMATTER_RE.match(text)
+    related = _related_pages(m.group(1)) if m else []
+    body = text[m.end() :] if m else text
+
+    links: dict[str, None] = {}
+    for regex in (MD_LINK_RE, HREF_RE):
+        for target in regex.findall(body):
+            page = _link_page(target.strip())
+            if page:
+                links[page] = None
+    return related, list(links)
+
+
+class LinkGraph:
+    """Directed page graph with integer IDs and CSR adjacency.
+
+    Pages are added or replaced with :meth:`set_page`; the CSR arrays are
+    rebuilt lazily on the next query after a change. Targets that are not
+    pages in the corpus still get an ID (``exists`` is False for them) so
+    dangling ``relatedPages`` entries stay visible.
+    """
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.ids: dict[str, int] = {}
+        self.exists = bytearray()
+        self._out: list[list[tuple[int, int]] | None] = []
+        self._dirty = True
+
+        self.fwd_offsets = array("i", [0])
+        self.fwd_targets = array("i")
+        self.fwd_kinds = array("b")
+        self.rev_offsets = array("i", [0])
+        self.rev_sources = array("i")
+        self.rev_kinds = array("b")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def intern(self, name: str) -> int:
+        page_id = self.ids.get(name)
+        if page_id is None:
+            page_id = len(self.names)
+            self.ids[name] = page_id
+            self.names.append(name)
+            self.exists.append(0)
+            self._out.append(None)
+        return page_id
+
+    def set_page(self, name: str, edges: Iterable[tuple[str, int]]) -> int:
+        """Add ``name`` as a corpus page with ``(target, kind)`` out-edges.
+
+        Replaces any edges previously set for the page. Edge order is kept,
+        which is the order exported to the JSON snapshots.
+        """
+        page_id = self.intern(name)
+        out: list[tuple[int, int]] = []
+        seen: set[tuple[int, int]] = set()
+        for target, kind in edges:
+            edge = (self.intern(target), kind)
+            if edge not in seen:
+                seen.add(edge)
+                out.append(edge)
+        self.exists[page_id] = 1
+        self._out[page_id] = out
+        self._dirty = True
+        return page_id
+
+    def remove_page(self, name: str) -> None:
+        page_id = self.ids.get(name)
+        if page_id is not None and self.exists[page_id]:
+            self.exists[page_id] = 0
+            self._out[page_id] = None
+            self._dirty = True
+
+    def freeze(self) -> None:
+        """Rebuild the CSR arrays if pages changed since the last build."""
+        if not self._dirty:
+            return
+        n = len(self.names)
+
+        fwd_offsets = array("i", bytes(4 * (n + 1)))
+        fwd_targets = array("i")
+        fwd_kinds = array("b")
+        in_degree = [0] * (n + 1)
+        for src, out in enumerate(self._out):
+            if out:
+                for dst, kind in out:
+                    fwd_targets.append(dst)
+                    fwd_kinds.append(kind)
+                    in_degree[dst + 1] += 1
+            fwd_offsets[src + 1] = len(fwd_targets)
+
+        # Counting sort by target; sources stay ascending within each slice.
+        for i in range(n):
+            in_degree[i + 1] += in_degree[i]
+        rev_offsets = array("i", in_degree)
+        cursor = in_degree[:n]
+        m = len(fwd_targets)
+        rev_sources = array("i", bytes(4 * m))
+        rev_kinds = array("b", bytes(m))
+        for src in range(n):
+            for e in range(fwd_offsets[src], fwd_offsets[src + 1]):
+                dst = fwd_targets[e]
+                slot = cursor[dst]
+                rev_sources[slot] = src
+                rev_kinds[slot] = fwd_kinds[e]
+                cursor[dst] = slot + 1
+
+        self.fwd_offsets, self.fwd_targets, self.fwd_kinds = (
+            fwd_offsets,
+            fwd_targets,
+            fwd_kinds,
+        )
+        self.rev_offsets, self.rev_sources, self.rev_kinds = (
+            rev_offsets,
+            rev_sources,
+            rev_kinds,
+        )
+        self._dirty = False
+
+    @property
+    def edge_count(self) -> int:
+        self.freeze()
+        return len(self.fwd_targets)
+
+    def out_edges(self, page_id: int) -> Iterator[tuple[int, int]]:
+        """``(target, kind)`` pairs for the out-edges of ``page_id``."""
+        self.freeze()
+        lo, hi = self.fwd_offsets[page_id], self.fwd_offsets[page_id + 1]
+        return zip(self.fwd_targets[lo:hi], self.fwd_kinds[lo:hi])
+
+    def successor_ids(self, page_id: int, kinds: int = ALL_KINDS) -> Iterator[int]:
+        self.freeze()
+        for e in range(self.fwd_offsets[page_id], self.fwd_offsets[page_id + 1]):
+            if self.fwd_kinds[e] & kinds:
+                yield self.fwd_targets[e]
+
+    def predecessor_ids(self, page_id: int, kinds: int = ALL_KINDS) -> Iterator[int]:
+        self.freeze()
+        for e in range(self.rev_offsets[page_id], self.rev_offsets[page_id + 1]):
+            if self.rev_kinds[e] & kinds:
+                yield self.rev_sources[e]
+
+    def successors(self, name: str, kinds: int = ALL_KINDS) -> list[str]:
+        page_id = self.ids.get(name)
+        if page_id is None:
+            return []
+        return [self.names[i] for i in self.successor_ids(page_id, kinds)]
+
+    def predecessors(self, name: str, kinds: int = ALL_KINDS) -> list[str]:
+        """Pages linking to ``name`` ("who links here")."""
+        page_id = self.ids.get(name)
+        if page_id is None:
+            return []
+        return [self.names[i] for i in self.predecessor_ids(page_id, kinds)]
+
+    def pages(self) -> Iterator[int]:
+        """IDs of corpus pages, in the order they were added."""
+        return (i for i in range(len(self.names)) if self.exists[i])
+
+    def to_connection_matrix(self) -> dict[str, list[str]]:
+        """``relatedPages`` adjacency for every corpus page."""
+        names = self.names
+        return {
+            names[i]: [names[j] for j in self.successor_ids(i, RELATED)]
+            for i in self.pages()
+        }
+
+    def to_bidirectional(self, timestamp: str) -> dict:
+        names = self.names
+        forward = self.to_connection_matrix()
+        backward: dict[str, list[str]] = {}
+        pairs: list[list[str]] = []
+        for i in range(len(names)):
+            sources = list(self.predecessor_ids(i, RELATED))
+            if not sources:
+                continue
+            backward[names[i]] = [names[j] for j in sources]
+            outgoing = set(self.successor_ids(i, RELATED))
+            for j in sources:
+                if j > i and j in outgoing:
+                    pairs.append([names[i], names[j]])
+        return {
+            "forward_map": forward,
+            "backward_map": backward,
+            "reciprocal_pairs": pairs,
+            "timestamp": timestamp,
+        }
+
+
+def _load_cache() -> dict[str, dict]:
+    if not GRAPH_CACHE.exists():
+        return {}
+    try:
+        with phase("json"):
+            data = json.loads(GRAPH_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != GRAPH_VERSION:
+        return {}
+    return data.get("pages", {})
+
+
+def _save_cache(pages: dict[str, dict]) -> None:
+    GRAPH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = GRAPH_CACHE.with_suffix(".tmp")
+    with phase("json"):
+        tmp.write_text(
+            json.dumps({"version": GRAPH_VERSION, "pages": pages}), encoding="utf-8"
+        )
+    os.replace(tmp, GRAPH_CACHE)
+
+
+def _resolve_link(page: str, files: set[str]) -> str | None:
+    if page in files:
+        return page
+    for ext in MD_EXTS:
+        if f"{page}{ext}" in files:
+            return f"{page}{ext}"
+    return None
+
+
+def build_graph(root: Path = ATLAS_ROOT) -> tuple[LinkGraph, int]:
+    """Build the graph for ``root``; returns ``(graph, pages re-read)``.
+
+    Unchanged pages reuse their cached edges. In-page links are resolved
+    against the current file set on every build, so adding or removing a
+    page fixes up links from pages that did not change.
+    """
+    cached = _load_cache()
+    records: dict[str, dict] = {}
+    reread = 0
+
+    for entry in iter_entries(root, MD_EXTS):
+        path = Path(entry.path)
+        name = path.relative_to(root).as_posix()
+        digest = HASHES.sha256_file(path, entry.stat())
+        record = cached.get(name)
+        if record is None or record.get("sha256") != digest:
+            text = read_text(path)
+            with phase("regex scan"):
+                related, links = extract_edges(text)
+            count("links", len(related) + len(links))
+            record = {"sha256": digest, "related": related, "links": links}
+            reread += 1
+        records[name] = record
+
+    with phase("cache save"):
+        if reread or records.keys() != cached.keys():
+            _save_cache(records)
+        HASHES.save()
+
+    files = set(records)
+    graph = LinkGraph()
+    with phase("graph build"):
+        for name, record in records.items():
+            edges = [(t, RELATED) for t in record["related"]]
+            for page in record["links"]:
+                target = _resolve_link(page, files)
+                if target is not None and target != name:
+                    edges.append((target, LINK))
+            graph.set_page(name, edges)
+    count("pages", len(records))
+    return graph, reread
+
+
+def _read_json(path: Path) -> dict | None:
+    try:
+        with phase("json"):
+            return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _dump(data: dict) -> str:
+    return json.dumps(data, indent=2) + "\n"
+
+
+def export_snapshots(graph: LinkGraph, check: bool) -> list[Path]:
+    """Write (or, with ``check``, verify) both JSON snapshots.
+
+    Returns the snapshots that were out of date. The bidirectional
+    ``timestamp`` only moves when its content changes, so regenerating an
+    unchanged corpus leaves the files untouched.
+    """
+    with phase("snapshots"):
+        return _export_snapshots(graph, check)
+
+
+def _export_snapshots(graph: LinkGraph, check: bool) -> list[Path]:
+    outdated: list[Path] = []
+
+    matrix = graph.to_connection_matrix()
+    if _read_json(CONNECTION_MATRIX_JSON) != matrix:
+        outdated.append(CONNECTION_MATRIX_JSON)
+        if not check:
+            with phase("json"):
+                CONNECTION_MATRIX_JSON.write_text(_dump(matrix), encoding="utf-8")
+
+    current = _read_json(BIDIRECTIONAL_JSON) or {}
+    expected = graph.to_bidirectional(current.get("timestamp", ""))
+    if current != expected:
+        outdated.append(BIDIRECTIONAL_JSON)
+        if not check:
+            expected["timestamp"] = (
+                datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+            )
+            with phase("json"):
+                BIDIRECTIONAL_JSON.write_text(_dump(expected), encoding="utf-8")
+
+    return outdated
+
+
+def _kinds_arg(value: str) -> int:
+    names = {v: k for k, v in KIND_NAMES.items()}
+    kinds = 0
+    for part in value.split(","):
+        if part == "all":
+            kinds |= ALL_KINDS
+        elif part in names:
+            kinds |= names[part]
+        else:
+            raise argparse.ArgumentTypeError(f"unknown edge kind: {part}")
+    return kinds
+
+
+def _lookup(graph: LinkGraph, page: str) -> str | None:
+    """Accept a file path or a docs page path (without extension)."""
+    page = page.lstrip("/")
+    if page in graph.ids:
+        return page
+    for ext in MD_EXTS:
+        if f"{page}{ext}" in graph.ids:
+            return f"{page}{ext}"
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Build the Atlas page link graph and export the connection matrix snapshots."
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Do not modify files; exit non-zero if the snapshots are out of date.",
+    )
+    parser.add_argument(
+        "--who-links-here",
+        metavar="PAGE",
+        help="Print pages linking to PAGE and exit.",
+    )
+    parser.add_argument(
+        "--links-from",
+        metavar="PAGE",
+        help="Print pages PAGE links to and exit.",
+    )
+    parser.add_argument(
+        "--kinds",
+        type=_kinds_arg,
+        default=ALL_KINDS,
+        help="Edge kinds for queries: related, link or all (default: all).",
+    )
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_profiling(args)
+
+    graph, reread = build_graph()
+
+    query = args.who_links_here or args.links_from
+    if query:
+        name = _lookup(graph, query)
+        if name is None:
+            print(f"Unknown page: {query}", file=sys.stderr)
+            return 2
+        page_id = graph.ids[name]
+        if args.who_links_here:
+            ids = graph.predecessor_ids(page_id, args.kinds)
+        else:
+            ids = graph.successor_ids(page_id, args.kinds)
+        for i in ids:
+            print(graph.names[i])
+        return 0
+
+    outdated = export_snapshots(graph, check=args.check)
+    print(
+        f"Link graph: {sum(1 for _ in graph.pages())} pages, "
+        f"{graph.edge_count} edges ({reread} pages re-read)."
+    )
+
+    if args.check:
+        if outdated:
+            print("Link graph snapshots are out of date:")
+            for path in outdated:
+                print(f"- {path.relative_to(ATLAS_ROOT).as_posix()}")
+            print("Run: npm run sync:graph")
+            return 1
+        print("Link graph snapshots are in sync.")
+        return 0
+
+    for path in outdated:
+        print(f"Updated {path.relative_to(ATLAS_ROOT).as_posix()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
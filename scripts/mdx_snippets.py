@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+MDX snippet import resolution shared by the docs scripts.
+
+Pages pull in content with ``import X from '/snippets/...mdx'``. Resolving
+those imports lets ``docs_audit.py`` count a page's snippet words and
+``check_links.py`` check a page's snippet links, both attributed to the
+including page.
+
+Each snippet file is read and parsed once per run (snippets are shared by
+hundreds of pages), and its transitive expansion is memoized too. Imports
+inside fenced code blocks are example code and are ignored, as are package
+imports (``react``, ``@materi/sdk``). Absolute specifiers are rooted at the
+atlas root; relative ones at the importing file's directory.
+"""
+
+from __future__ import annotations
+
+import os
+import posixpath
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from fs_walk import read_text
+from profiling import count, phase
+
+ATLAS_ROOT = Path(__file__).resolve().parents[1]
+
+# Imports of these are inlined; anything else local is only checked to exist.
+SNIPPET_EXTS = (".mdx", ".md")
+
+# MDX import at the start of a line: import X from '/snippets/x.mdx'
+IMPORT_RE = re.compile(r"^import\s+[^;\n]*?\s+from\s+[\"']([^\"']+)[\"']", re.MULTILINE)
+# Fenced code blocks; images and imports inside them are example code.
+FENCE_RE = re.compile(
+    r"^[ \t]*(`{3,}|~{3,})[^\n]*\n.*?^[ \t]*\1[ \t]*$", re.MULTILINE | re.DOTALL
+)
+
+
+@dataclass(frozen=True)
+class Expansion:
+    """What a file pulls in through its imports, transitively.
+
+    ``snippets`` are root-relative paths, depth-first and each listed once;
+    ``broken`` holds ``(importing file, specifier)`` pairs; ``cycles`` holds
+    import chains that loop back on themselves.
+    """
+
+    snippets: tuple[str, ...] = ()
+    broken: tuple[tuple[str, str], ...] = ()
+    cycles: tuple[tuple[str, ...], ...] = ()
+
+
+EMPTY = Expansion()
+
+
+def strip_code(text: str) -> str:
+    """``text`` without fenced code blocks."""
+    if "```" not in text and "~~~" not in text:
+        return text
+    return FENCE_RE.sub("", text)
+
+
+def local_imports(text: str) -> list[str]:
+    """Specifiers of the file imports in ``text`` (``/``, ``./`` or ``../``)."""
+    # Most pages import nothing; skip the fence strip for them.
+    if "import" not in text or not IMPORT_RE.search(text):
+        return []
+    return [
+        spec
+        for spec in IMPORT_RE.findall(strip_code(text))
+        if spec.startswith(("/", "./", "../"))
+    ]
+
+
+def resolve(spec: str, importer: str) -> str:
+    """Root-relative path for ``spec`` imported from ``importer``.
+
+    A ``../`` past the root stays in the result and so never resolves.
+    """
+    if spec.startswith("/"):
+        return posixpath.normpath(spec.lstrip("/"))
+    return posixpath.normpath(posixpath.join(posixpath.dirname(importer), spec))
+
+
+@lru_cache(maxsize=None)
+def _is_file(rel: str) -> bool:
+    return os.path.isfile(ATLAS_ROOT / rel)
+
+
+@lru_cache(maxsize=None)
+def snippet_text(rel: str) -> str | None:
+    """Text of the snippet at ``rel``, read once; None if it does not exist."""
+    try:
+        text = read_text(ATLAS_ROOT / rel)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+    count("snippets read")
+    return text
+
+
+@lru_cache(maxsize=None)
+def _snippet_imports(rel: str) -> tuple[str, ...]:
+    text = snippet_text(rel)
+    if text is None:
+        return ()
+    with phase("snippet parse"):
+        return tuple(local_imports(text))
+
+
+def _merge(parts: list[Expansion]) -> Expansion:
+    snippets: dict[str, None] = {}
+    broken: dict[tuple[str, str], None] = {}
+    cycles: dict[tuple[str, ...], None] = {}
+    for part in parts:
+        snippets.update(dict.fromkeys(part.snippets))
+        broken.update(dict.fromkeys(part.broken))
+        cycles.update(dict.fromkeys(part.cycles))
+    return Expansion(tuple(snippets), tuple(broken), tuple(cycles))
+
+
+def _expand_imports(
+    importer: str, specs: tuple[str, ...] | list[str], stack: list[str]
+) -> Expansion:
+    parts: list[Expansion] = []
+    for spec in specs:
+        rel = resolve(spec, importer)
+        if not rel.endswith(SNIPPET_EXTS):
+            if not _is_file(rel):
+                parts.append(Expansion(broken=((importer, spec),)))
+            continue
+        if rel in stack:
+            chain = (*stack[stack.index(rel) :], rel)
+            parts.append(Expansion(cycles=(chain,)))
+            continue
+        if snippet_text(rel) is None:
+            parts.append(Expansion(broken=((importer, spec),)))
+            continue
+        parts.append(_expand_snippet(rel, stack))
+    return _merge(parts)
+
+
+_EXPANDED: dict[str, Expansion] = {}
+
+
+def _expand_snippet(rel: str, stack: list[str]) -> Expansion:
+    done = _EXPANDED.get(rel)
+    if done is not None:
+        return done
+    stack.append(rel)
+    try:
+        inner = _expand_imports(rel, _snippet_imports(rel), stack)
+    finally:
+        stack.pop()
+    expansion = Expansion(
+        (rel, *(s for s in inner.snippets if s != rel)), inner.broken, inner.cycles
+    )
+    # A snippet inside a cycle still on the stack would memoize a partial
+    # expansion; only cache once the walk has left every file it loops through.
+    if not any(f in stack for chain in inner.cycles for f in chain):
+        _EXPANDED[rel] = expansion
+    return expansion
+
+
+def expand(rel: str, text: str) -> Expansion:
+    """Snippets ``text`` (the file at root-relative ``rel``) pulls in."""
+    with phase("snippet parse"):
+        specs = local_imports(text)
+    if not specs:
+        return EMPTY
+    count("imports", len(specs))
+    with phase("snippet expand"):
+        return _expand_imports(rel, specs, [rel])
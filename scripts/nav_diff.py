@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Structural diff between Mintlify navigation files.
+
+Both navigation objects are canonicalized into trees of tabs, anchors,
+groups and pages (cosmetic keys such as ``icon`` are dropped) and every
+subtree gets a content hash. The diff walks the two trees top-down and skips
+any pair of subtrees whose hashes match, so only changed branches are
+visited. Differences are reported per page (added, removed, moved between
+groups/tabs) and per container (added, removed, reordered).
+
+``docs.json`` is what the site and every other script read; ``mint.json``
+is kept for older tooling. Their current differences are recorded in
+``nav_drift.json`` and ``--check`` fails when the drift changes, so it can
+no longer grow silently.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from pathlib import Path
+from typing import NamedTuple
+
+from hash_cache import ATLAS_ROOT
+from profiling import add_profile_arguments, phase, start_profiling
+
+DOCS_JSON = ATLAS_ROOT / "docs.json"
+MINT_JSON = ATLAS_ROOT / "mint.json"
+DRIFT_BASELINE = ATLAS_ROOT / "nav_drift.json"
+
+# (container key, label key) in the order children are canonicalized.
+CONTAINERS = (
+    ("global", None),
+    ("versions", "version"),
+    ("languages", "language"),
+    ("dropdowns", "dropdown"),
+    ("anchors", "anchor"),
+    ("tabs", "tab"),
+    ("groups", "group"),
+    ("pages", "group"),
+)
+
+
+class Node(NamedTuple):
+    kind: str
+    label: str
+    children: tuple[Node, ...]
+    digest: bytes
+    size: int
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.kind, self.label)
+
+
+def _node(kind: str, label: str, children: tuple[Node, ...] = ()) -> Node:
+    blob = f"{kind}\0{label}\0".encode("utf-8")
+    size = 1
+    if children:
+        blob += b"".join([c.digest for c in children])
+        size += sum([c.size for c in children])
+    return Node(kind, label, children, blake2b(blob, digest_size=16).digest(), size)
+
+
+def canonicalize(node, kind: str = "navigation", label: str = "") -> Node:
+    """Canonical tree for a navigation object (or any nested container)."""
+    children: list[Node] = []
+    if isinstance(node, dict):
+        if isinstance(node.get("href"), str):
+            children.append(_node("link", node["href"]))
+        for key, label_key in CONTAINERS:
+            items = node.get(key)
+            if items is None:
+                continue
+            if key == "global":
+                children.append(canonicalize(items, "global", "global"))
+                continue
+            for item in items if isinstance(items, list) else [items]:
+                if isinstance(item, str):
+                    children.append(_node("page", item.strip("/")))
+                elif isinstance(item, dict):
+                    child_kind = next(
+                        (k for _, k in CONTAINERS if k and k in item), label_key
+                    )
+                    children.append(
+                        canonicalize(item, child_kind, str(item.get(child_kind, "")))
+                    )
+    return _node(kind, label, tuple(children))
+
+
+def load_navigation_tree(path: Path) -> Node:
+    with phase("nav load"):
+        data = json.loads(path.read_text(encoding="utf-8"))
+    with phase("canonicalize"):
+        return canonicalize(data.get("navigation", {}))
+
+
+def _where(path: tuple[str, ...]) -> str:
+    return " > ".join(path) if path else "(root)"
+
+
+@dataclass
+class NavDiff:
+    added: dict[str, list[str]] = field(default_factory=dict)
+    removed: dict[str, list[str]] = field(default_factory=dict)
+    moved: dict[str, tuple[list[str], list[str]]] = field(default_factory=dict)
+    containers_added: list[str] = field(default_factory=list)
+    containers_removed: list[str] = field(default_factory=list)
+    reordered: list[str] = field(default_factory=list)
+    visited: int = 0
+    skipped: int = 0
+
+    @property
+    def identical(self) -> bool:
+        return not self.entries()
+
+    def entries(self) -> list[str]:
+        """One stable line per difference, used for the drift baseline."""
+        out = []
+        for page, locs in self.added.items():
+            out.extend(f"+ page {page} @ {loc}" for loc in locs)
+        for page, locs in self.removed.items():
+            out.extend(f"- page {page} @ {loc}" for loc in locs)
+        for page, (src, dst) in self.moved.items():
+            out.append(f"~ page {page} @ {' | '.join(src)} -> {' | '.join(dst)}")
+        out.extend(f"+ {c}" for c in self.containers_added)
+        out.extend(f"- {c}" for c in self.containers_removed)
+        out.extend(f"= reordered {r}" for r in self.reordered)
+        return sorted(out)
+
+
+def _pair_children(
+    left: tuple[Node, ...], right: tuple[Node, ...]
+) -> tuple[list[tuple[Node, Node]], list[Node], list[Node]]:
+    """Match children by (kind, label, occurrence); return pairs and leftovers."""
+
+    def keyed(nodes):
+        seen: dict[tuple[str, str], int] = {}
+        out = {}
+        for n in nodes:
+            k = n.key
+            i = seen.get(k, 0)
+            seen[k] = i + 1
+            out[(k, i)] = n
+        return out
+
+    lk, rk = keyed(left), keyed(right)
+    pairs = [(lk[k], rk[k]) for k in lk if k in rk]
+    only_left = [n for k, n in lk.items() if k not in rk]
+    only_right = [n for k, n in rk.items() if k not in lk]
+    return pairs, only_left, only_right
+
+
+def _collect_pages(node: Node, path: tuple[str, ...], out: dict[str, list[str]]):
+    if node.kind == "page":
+        out.setdefault(node.label, []).append(_where(path))
+        return
+    sub = path + (node.label,) if node.label else path
+    for child in node.children:
+        _collect_pages(child, sub, out)
+
+
+def diff_trees(left: Node, right: Node) -> NavDiff:
+    """Diff two canonical trees, descending only into differing subtrees."""
+    result = NavDiff()
+    lost: dict[str, list[str]] = {}
+    gained: dict[str, list[str]] = {}
+
+    stack: list[tuple[Node, Node, tuple[str, ...]]] = [(left, right, ())]
+    while stack:
+        a, b, path = stack.pop()
+        result.visited += 1
+        if a.digest == b.digest:
+            result.skipped += a.size
+            continue
+
+        pairs, only_a, only_b = _pair_children(a.children, b.children)
+        sub = path + (a.label,) if a.label else path
+
+        order_a = [p[0].key for p in pairs]
+        matched_b = {id(p[1]) for p in pairs}
+        order_b = [n.key for n in b.children if id(n) in matched_b]
+        if order_a != order_b:
+            result.reordered.append(_where(sub))
+
+        for n in only_a:
+            if n.kind == "page":
+                lost.setdefault(n.label, []).append(_where(sub))
+            elif n.kind == "link":
+                result.containers_removed.append(f"link {n.label} @ {_where(sub)}")
+            else:
+                result.containers_removed.append(f"{n.kind} {_where(sub + (n.label,))}")
+                _collect_pages(n, sub, lost)
+        for n in only_b:
+            if n.kind == "page":
+                gained.setdefault(n.label, []).append(_where(sub))
+            elif n.kind == "link":
+                result.containers_added.append(f"link {n.label} @ {_where(sub)}")
+            else:
+                result.containers_added.append(f"{n.kind} {_where(sub + (n.label,))}")
+                _collect_pages(n, sub, gained)
+        for pa, pb in reversed(pairs):
+            stack.append((pa, pb, sub))
+
+    for page in sorted(lost.keys() | gained.keys()):
+        src, dst = lost.get(page), gained.get(page)
+        if src and dst:
+            result.moved[page] = (sorted(src), sorted(dst))
+        elif src:
+            result.removed[page] = sorted(src)
+        else:
+            result.added[page] = sorted(dst)
+    result.containers_added.sort()
+    result.containers_removed.sort()
+    result.reordered.sort()
+    return result
+
+
+def diff_files(left: Path, right: Path) -> NavDiff:
+    trees = load_navigation_tree(left), load_navigation_tree(right)
+    with phase("diff"):
+        return diff_trees(*trees)
+
+
+def _print_diff(d: NavDiff, left: str, right: str, limit: int) -> None:
+    print(
+        f"{left} -> {right}: {len(d.added)} added, {len(d.removed)} removed, "
+        f"{len(d.moved)} moved pages; {len(d.containers_added)} containers added, "
+        f"{len(d.containers_removed)} removed, {len(d.reordered)} reordered "
+        f"({d.visited} subtrees visited, {d.skipped} nodes skipped as identical)"
+    )
+    entries = d.entries()
+    for line in entries[:limit]:
+        print(f"  {line}")
+    if len(entries) > limit:
+        print(f"  ... ({len(entries) - limit} more)")
+
+
+def _rel(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(ATLAS_ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Diff navigation between docs.json and mint.json (or any two Mintlify configs)."
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        type=Path,
+        help="Two config files to diff (default: docs.json mint.json).",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero if docs.json/mint.json drift differs from nav_drift.json.",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Record the current docs.json/mint.json drift in nav_drift.json.",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=50,
+        help="Differences to print (default: 50).",
+    )
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_profiling(args)
+
+    if args.files and len(args.files) != 2:
+        parser.error("expected exactly two files")
+    left, right = args.files or [DOCS_JSON, MINT_JSON]
+    d = diff_files(left, right)
+
+    if not (args.check or args.update):
+        _print_diff(d, _rel(left), _rel(right), args.limit)
+        return 0
+
+    if args.files and [p.resolve() for p in args.files] != [DOCS_JSON, MINT_JSON]:
+        parser.error("--check/--update only apply to docs.json and mint.json")
+
+    current = d.entries()
+    if args.update:
+        DRIFT_BASELINE.write_text(
+            json.dumps(
+                {"left": "docs.json", "right": "mint.json", "entries": current},
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        print(f"Recorded {len(current)} differences in {_rel(DRIFT_BASELINE)}")
+        return 0
+
+    try:
+        baseline = set(
+            json.loads(DRIFT_BASELINE.read_text(encoding="utf-8"))["entries"]
+        )
+    except (OSError, ValueError, KeyError):
+        baseline = set()
+    new = [e for e in current if e not in baseline]
+    resolved = sorted(baseline - set(current))
+    if not (new or resolved):
+        print(
+            f"Navigation drift matches {_rel(DRIFT_BASELINE)} ({len(current)} known)."
+        )
+        return 0
+
+    print("Navigation drift between docs.json and mint.json changed:")
+    for line in new[: args.limit]:
+        print(f"  new: {line}")
+    for line in resolved[: args.limit]:
+        print(f"  resolved: {line}")
+    print("Fix the navigation, or accept the drift with: npm run sync:nav")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate page detection with MinHash and LSH.
+
+Each markdown file is reduced to a set of hashed word shingles. Signatures
+use one-permutation MinHash (one hash per shingle, split into bins, empty
+bins filled by rotation), so building a signature is a single pass over the
+shingles rather than one pass per permutation. Signatures are banded into an
+LSH index; only pages that share a band bucket are compared, and candidate
+pairs are confirmed with exact Jaccard similarity before clustering.
+
+Pages with identical shingle sets are grouped up front so template copies do
+not blow up the candidate lists.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from fs_walk import iter_markdown_files, read_text
+from hash_cache import ATLAS_ROOT
+from link_graph import FRONTMATTER_RE
+from profiling import add_profile_arguments, count, phase, start_profiling
+
+WORD_RE = re.compile(r"[a-z0-9][a-z0-9'\-]*")
+
+NUM_BINS = 128
+SHINGLE_SIZE = 5
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_MIN_WORDS = 30
+
+# Shingle hashes are already well mixed; keeping 30 bits makes them
+# single-digit CPython ints, which sort and compare faster than 64-bit ones.
+_MASK30 = (1 << 30) - 1
+_EMPTY = 1 << 30
+
+
+def shingles(text: str, k: int = SHINGLE_SIZE) -> frozenset[int]:
+    """Hashed ``k``-word shingles of ``text`` with frontmatter removed.
+
+    Words are hashed once (CRC-32) and each shingle is the hash of a tuple of
+    word hashes. Tuple and int hashing are not salted per process, so the
+    values are stable between runs.
+    """
+    m = FRONTMATTER_RE.match(text)
+    if m:
+        text = text[m.end() :]
+    words = list(map(zlib.crc32, map(str.encode, WORD_RE.findall(text.lower()))))
+    if not words:
+        return frozenset()
+    if len(words) < k:
+        return frozenset([hash(tuple(words))])
+    return frozenset(map(hash, zip(*(words[i:] for i in range(k)))))
+
+
+def signature(hashes: frozenset[int], bins: int = NUM_BINS) -> list[int]:
+    """One-permutation MinHash signature with rotation densification."""
+    shift = bins.bit_length() - 1
+    low = bins - 1
+    mixed = sorted(map(_MASK30.__and__, hashes), reverse=True)
+    # Later keys win in dict(); with values descending, each bin ends up
+    # holding its minimum.
+    mins = dict(zip(map(low.__and__, mixed), mixed))
+    sig = [mins[b] >> shift if b in mins else _EMPTY for b in range(bins)]
+
+    if not mins or len(mins) == bins:
+        return sig
+    # Borrow from the next non-empty bin to the right, offset by distance so
+    # borrowed values cannot collide with genuine ones.
+    nxt = min(mins) + bins
+    for i in range(bins - 1, -1, -1):
+        if sig[i] != _EMPTY:
+            nxt = i
+        else:
+            sig[i] = sig[nxt % bins] + (nxt - i) * _EMPTY
+    return sig
+
+
+def choose_bands(threshold: float, bins: int = NUM_BINS) -> tuple[int, int]:
+    """Pick ``(bands, rows)`` whose LSH threshold sits just below ``threshold``.
+
+    The S-curve midpoint ``(1/b)^(1/r)`` should be under the target so that
+    pairs at the threshold are caught with high probability; exact Jaccard
+    filters the extra candidates.
+    """
+    best = (bins, 1)
+    for rows in range(1, bins + 1):
+        if bins % rows:
+            continue
+        bands = bins // rows
+        if (1 / bands) ** (1 / rows) <= threshold - 0.1:
+            best = (bands, rows)
+    return best
+
+
+def jaccard(a: frozenset[int], b: frozenset[int]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class Cluster:
+    pages: list[str]
+    min_similarity: float
+    max_similarity: float
+    words: int
+
+
+class _UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def find_near_duplicates(
+    root: Path = ATLAS_ROOT,
+    threshold: float = DEFAULT_THRESHOLD,
+    shingle_size: int = SHINGLE_SIZE,
+    min_words: int = DEFAULT_MIN_WORDS,
+) -> tuple[list[Cluster], dict]:
+    """Return near-duplicate clusters under ``root`` and run statistics."""
+    # Identical shingle sets collapse to one representative.
+    groups: dict[frozenset[int], list[str]] = {}
+    words: dict[frozenset[int], int] = {}
+    scanned = 0
+    for path in iter_markdown_files(root):
+        scanned += 1
+        text = read_text(path)
+        with phase("shingling"):
+            sh = shingles(text, shingle_size)
+        if len(sh) + shingle_size - 1 < min_words:
+            continue
+        groups.setdefault(sh, []).append(path.relative_to(root).as_posix())
+        words[sh] = len(sh) + shingle_size - 1
+
+    reps = list(groups)
+    bands, rows = choose_bands(threshold)
+    buckets: dict[tuple, list[int]] = {}
+    with phase("minhash"):
+        for idx, sh in enumerate(reps):
+            sig = signature(sh)
+            for band in range(bands):
+                key = (band, *sig[band * rows : (band + 1) * rows])
+                buckets.setdefault(key, []).append(idx)
+
+    uf = _UnionFind(len(reps))
+    similarity: dict[tuple[int, int], float] = {}
+    candidates = 0
+    with phase("verify"):
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for i, a in enumerate(members):
+                for b in members[i + 1 :]:
+                    pair = (a, b)
+                    if pair in similarity:
+                        continue
+                    candidates += 1
+                    s = jaccard(reps[a], reps[b])
+                    similarity[pair] = s
+                    if s >= threshold:
+                        uf.union(a, b)
+    count("candidate pairs", candidates)
+
+    by_root: dict[int, list[int]] = {}
+    for idx in range(len(reps)):
+        by_root.setdefault(uf.find(idx), []).append(idx)
+
+    clusters: list[Cluster] = []
+    for members in by_root.values():
+        pages = sorted(p for idx in members for p in groups[reps[idx]])
+        if len(pages) < 2:
+            continue
+        member_set = set(members)
+        sims = [
+            s
+            for (a, b), s in similarity.items()
+            if s >= threshold and a in member_set and b in member_set
+        ]
+        if any(len(groups[reps[idx]]) > 1 for idx in members):
+            sims.append(1.0)
+        clusters.append(
+            Cluster(
+                pages=pages,
+                min_similarity=min(sims),
+                max_similarity=max(sims),
+                words=max(words[reps[idx]] for idx in members),
+            )
+        )
+
+    clusters.sort(key=lambda c: (-len(c.pages), -c.max_similarity, c.pages[0]))
+    stats = {
+        "scanned": scanned,
+        "compared": len(reps),
+        "bands": bands,
+        "rows": rows,
+        "candidate_pairs": candidates,
+    }
+    return clusters, stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Report clusters of near-duplicate markdown pages (MinHash + LSH)."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Minimum Jaccard similarity of shingle sets (default: {DEFAULT_THRESHOLD}).",
+    )
+    parser.add_argument(
+        "--shingle-size",
+        type=int,
+        default=SHINGLE_SIZE,
+        help=f"Words per shingle (default: {SHINGLE_SIZE}).",
+    )
+    parser.add_argument(
+        "--min-words",
+        type=int,
+        default=DEFAULT_MIN_WORDS,
+        help=f"Skip pages shorter than this (default: {DEFAULT_MIN_WORDS}).",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=30,
+        help="Clusters to print (default: 30).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Also write every cluster as JSON to this path.",
+    )
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_profiling(args)
+
+    clusters, stats = find_near_duplicates(
+        threshold=args.threshold,
+        shingle_size=args.shingle_size,
+        min_words=args.min_words,
+    )
+
+    print(
+        f"Scanned {stats['scanned']} files; {stats['compared']} distinct pages "
+        f"indexed ({stats['bands']} bands x {stats['rows']} rows), "
+        f"{stats['candidate_pairs']} candidate pairs checked."
+    )
+    print(f"Near-duplicate clusters (Jaccard >= {args.threshold}): {len(clusters)}")
+    for c in clusters[: args.top]:
+        if c.min_similarity == c.max_similarity:
+            sim = f"{c.max_similarity:.2f}"
+        else:
+            sim = f"{c.min_similarity:.2f}-{c.max_similarity:.2f}"
+        print(f"\n- {len(c.pages)} pages, similarity {sim}, ~{c.words} words")
+        for page in c.pages:
+            print(f"  - {page}")
+    if len(clusters) > args.top:
+        print(f"\n... ({len(clusters) - args.top} more)")
+
+    if args.output:
+        args.output.write_text(
+            json.dumps(
+                {"stats": stats, "clusters": [c.__dict__ for c in clusters]},
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        print(f"\nWrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
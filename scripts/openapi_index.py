@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Operation index for an OpenAPI 3.x document.
+
+Parses the spec once into one entry per operation (path + method, and
+webhooks) with path/operation parameters merged and every local ``$ref``
+resolved. Recursive schemas are cut at the first repeat with an
+``x-circular`` marker. Each operation carries a content hash so callers can
+regenerate only what changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+INDEX_VERSION = 2
+
+# How Mintlify pages and nav entries name an operation: an optional spec
+# file, then "METHOD /path" or "webhook <name>".
+OPERATION_REF_RE = re.compile(
+    r"^(?:(\S+\.(?:json|ya?ml))\s+)?"
+    r"(get|put|post|delete|options|head|patch|trace|webhook)\s+(\S+)$",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class Operation:
+    slug: str
+    method: str
+    path: str
+    operation_id: str | None
+    summary: str
+    description: str
+    tags: tuple[str, ...]
+    deprecated: bool
+    webhook: bool
+    parameters: list[dict] = field(default_factory=list)
+    request_body: dict | None = None
+    responses: dict[str, dict] = field(default_factory=dict)
+    sha256: str = ""
+
+    @property
+    def ref(self) -> str:
+        """Mintlify reference to this operation, e.g. ``GET /plants``."""
+        return f"{'WEBHOOK' if self.webhook else self.method} {self.path}"
+
+
+def parse_operation_ref(text: str) -> tuple[str | None, str] | None:
+    """``(spec file or None, normalized ref)`` if ``text`` names an operation."""
+    m = OPERATION_REF_RE.match(text.strip().strip("\"'"))
+    if m is None:
+        return None
+    return m.group(1), f"{m.group(2).upper()} {m.group(3)}"
+
+
+def slugify(text: str) -> str:
+    text = re.sub(r"([a-z0-9])([A-Z])", r"\1-\2", text)
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-") or "root"
+
+
+class RefResolver:
+    """Resolve local ``#/...`` references with cycle protection.
+
+    Expansions that never hit a cycle are memoized per ref, so shared
+    component schemas are resolved once however often they are referenced.
+    """
+
+    def __init__(self, spec: dict):
+        self.spec = spec
+        self._memo: dict[str, Any] = {}
+
+    def _lookup(self, ref: str) -> Any:
+        node: Any = self.spec
+        for part in ref[2:].split("/"):
+            part = part.replace("~1", "/").replace("~0", "~")
+            if isinstance(node, list):
+                node = node[int(part)]
+            else:
+                node = node[part]
+        return node
+
+    def resolve(self, node: Any) -> Any:
+        return self._resolve(node, ())[0]
+
+    def _resolve(self, node: Any, stack: tuple[str, ...]) -> tuple[Any, bool]:
+        if isinstance(node, list):
+            out = []
+            cyclic = False
+            for item in node:
+                value, c = self._resolve(item, stack)
+                out.append(value)
+                cyclic = cyclic or c
+            return out, cyclic
+
+        if not isinstance(node, dict):
+            return node, False
+
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/"):
+            if ref in stack:
+                return {"$ref": ref, "x-circular": True}, True
+            if ref in self._memo:
+                return self._memo[ref], False
+            try:
+                target = self._lookup(ref)
+            except (KeyError, IndexError, ValueError):
+                return {"$ref": ref, "x-unresolved": True}, False
+            value, cyclic = self._resolve(target, stack + (ref,))
+            if not cyclic:
+                self._memo[ref] = value
+            return value, cyclic
+
+        out = {}
+        cyclic = False
+        for key, item in node.items():
+            value, c = self._resolve(item, stack)
+            out[key] = value
+            cyclic = cyclic or c
+        return out, cyclic
+
+
+def _content_hash(value: Any) -> str:
+    blob = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _merge_parameters(path_params: list, op_params: list) -> list[dict]:
+    merged: dict[tuple[str, str], dict] = {}
+    for p in [*path_params, *op_params]:
+        if isinstance(p, dict):
+            merged[(p.get("name", ""), p.get("in", ""))] = p
+    return list(merged.values())
+
+
+def build_operation_index(spec: dict) -> list[Operation]:
+    """Return every operation in ``paths`` and ``webhooks``, in spec order."""
+    resolver = RefResolver(spec)
+    ops: list[Operation] = []
+    used_slugs: set[str] = set()
+
+    sections = [(False, spec.get("paths") or {}), (True, spec.get("webhooks") or {})]
+    for webhook, paths in sections:
+        for path, item in paths.items():
+            item = resolver.resolve(item)
+            if not isinstance(item, dict):
+                continue
+            path_params = item.get("parameters") or []
+            for method in HTTP_METHODS:
+                op = item.get(method)
+                if not isinstance(op, dict):
+                    continue
+
+                operation_id = op.get("operationId")
+                base = (
+                    slugify(operation_id)
+                    if operation_id
+                    else slugify(f"{method} {path}")
+                )
+                if webhook:
+                    base = f"webhook-{base}"
+                slug = base
+                n = 2
+                while slug in used_slugs:
+                    slug = f"{base}-{n}"
+                    n += 1
+                used_slugs.add(slug)
+
+                body = {
+                    "method": method.upper(),
+                    "path": path,
+                    "operation_id": operation_id,
+                    "summary": op.get("summary", ""),
+                    "description": op.get("description", ""),
+                    "tags": list(op.get("tags") or []),
+                    "deprecated": bool(op.get("deprecated", False)),
+                    "webhook": webhook,
+                    "parameters": _merge_parameters(
+                        path_params, op.get("parameters") or []
+                    ),
+                    "request_body": op.get("requestBody"),
+                    "responses": op.get("responses") or {},
+                }
+                ops.append(
+                    Operation(
+                        slug=slug,
+                        method=body["method"],
+                        path=path,
+                        operation_id=operation_id,
+                        summary=body["summary"],
+                        description=body["description"],
+                        tags=tuple(body["tags"]),
+                        deprecated=body["deprecated"],
+                        webhook=webhook,
+                        parameters=body["parameters"],
+                        request_body=body["request_body"],
+                        responses=body["responses"],
+                        sha256=_content_hash(body),
+                    )
+                )
+
+    return ops
+
+
+def index_to_json(ops: list[Operation], spec_sha256: str) -> dict:
+    """Serializable index: operations by slug plus a ref -> slug map."""
+    return {
+        "version": INDEX_VERSION,
+        "spec_sha256": spec_sha256,
+        "operations": {
+            op.slug: {
+                "method": op.method,
+                "path": op.path,
+                "operationId": op.operation_id,
+                "tags": list(op.tags),
+                "webhook": op.webhook,
+                "sha256": op.sha256,
+            }
+            for op in ops
+        },
+        "refs": {op.ref: op.slug for op in ops},
+    }
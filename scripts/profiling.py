@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Per-phase timing shared by the docs scripts.
+
+Scripts wrap their work in named phases (``nav load``, ``file discovery``,
+``file read``, ``regex scan``, ``hashing``, ``report``...) and bump counters
+for files, bytes and links. Phases nest; each one is charged its *self*
+time, so the table adds up to the run and shows whether a run went to I/O,
+regex or JSON. Phases entered on worker threads (``sync_reference.py
+--jobs``) are timed per thread and overlap the main thread's.
+
+Off by default, where ``phase()`` returns a shared no-op context. Enable it
+with ``--profile`` or ``ATLAS_PROFILE=1``; the table goes to stderr at exit.
+``--profile-dump`` / ``ATLAS_PROFILE_DUMP`` also writes, by suffix:
+
+- ``.prof``: a cProfile dump of the main thread (``python -m pstats``,
+  snakeviz);
+- ``.speedscope.json``: the phase timeline per thread for speedscope.app;
+- any other ``.json``: the phase table and counters as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+PROFILE_ENV = "ATLAS_PROFILE"
+DUMP_ENV = "ATLAS_PROFILE_DUMP"
+
+# Timeline events kept for a speedscope dump; past this the dump is cut off
+# (the table stays exact).
+MAX_EVENTS = 2_000_000
+
+_NULL = contextlib.nullcontext()
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "parent", "wall", "cpu", "child_wall", "child_cpu")
+
+    def __init__(self, profiler: Profiler, name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> _Phase:
+        stack = self.profiler._stack()
+        self.parent = stack[-1] if stack else None
+        stack.append(self)
+        self.child_wall = self.child_cpu = 0.0
+        self.cpu = time.thread_time()
+        self.wall = time.perf_counter()
+        self.profiler._event("O", self.name, self.wall)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        end = time.perf_counter()
+        wall = end - self.wall
+        cpu = time.thread_time() - self.cpu
+        self.profiler._stack().pop()
+        self.profiler._event("C", self.name, end)
+        if self.parent is not None:
+            self.parent.child_wall += wall
+            self.parent.child_cpu += cpu
+        self.profiler._record(self.name, wall - self.child_wall, cpu - self.child_cpu)
+
+
+class Profiler:
+    """Phase and counter registry; use the module-level ``PROFILER``."""
+
+    def __init__(self):
+        self.enabled = False
+        self.dump: Path | None = None
+        self.label = Path(sys.argv[0]).name if sys.argv and sys.argv[0] else "python"
+        # name -> [calls, self wall, self cpu], in first-seen order.
+        self.phases: dict[str, list] = {}
+        self.counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._events: dict[str, list] = {}
+        self._n_events = 0
+        self._cprofile = None
+        self._wall0 = self._cpu0 = 0.0
+
+    def enable(self, dump: Path | None = None) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        self.dump = dump
+        self._wall0 = time.perf_counter()
+        self._cpu0 = time.process_time()
+        if dump is not None and dump.suffix == ".prof":
+            import cProfile
+
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        atexit.register(self.finish)
+
+    # -- recording ------------------------------------------------------------
+
+    def phase(self, name: str):
+        """Context manager timing ``name`` (a no-op while disabled)."""
+        if not self.enabled:
+            return _NULL
+        return _Phase(self, name)
+
+    def count(self, name: str, n: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, name: str, wall: float, cpu: float) -> None:
+        with self._lock:
+            row = self.phases.get(name)
+            if row is None:
+                self.phases[name] = [1, wall, cpu]
+            else:
+                row[0] += 1
+                row[1] += wall
+                row[2] += cpu
+
+    def _event(self, kind: str, name: str, at: float) -> None:
+        if self.dump is None or not self.dump.name.endswith(".speedscope.json"):
+            return
+        if self._n_events >= MAX_EVENTS:
+            return
+        events = getattr(self._local, "events", None)
+        if events is None:
+            events = self._local.events = []
+            with self._lock:
+                self._events[threading.current_thread().name] = events
+        self._n_events += 1
+        events.append((kind, name, at))
+
+    # -- reporting ------------------------------------------------------------
+
+    def summary(self) -> dict:
+        wall = time.perf_counter() - self._wall0
+        cpu = time.process_time() - self._cpu0
+        with self._lock:
+            phases = [
+                {"name": name, "calls": c, "wall_s": w, "cpu_s": u}
+                for name, (c, w, u) in self.phases.items()
+            ]
+            counts = dict(self.counts)
+        return {
+            "script": self.label,
+            "wall_s": wall,
+            "cpu_s": cpu,
+            "phases": phases,
+            "counts": counts,
+        }
+
+    def format_table(self, summary: dict | None = None) -> str:
+        s = summary or self.summary()
+        total = s["wall_s"] or 1e-9
+        width = max([len(p["name"]) for p in s["phases"]] + [len("(other)")])
+        lines = [
+            f"profile: {s['script']}  wall {s['wall_s']:.3f}s  cpu {s['cpu_s']:.3f}s",
+            f"  {'phase':<{width}}  {'calls':>8}  {'wall s':>8}  {'cpu s':>8}  {'wall %':>6}",
+        ]
+        attributed = 0.0
+        for p in sorted(s["phases"], key=lambda p: -p["wall_s"]):
+            attributed += p["wall_s"]
+            lines.append(
+                f"  {p['name']:<{width}}  {p['calls']:>8}  {p['wall_s']:>8.3f}  "
+                f"{p['cpu_s']:>8.3f}  {100 * p['wall_s'] / total:>5.1f}%"
+            )
+        other = s["wall_s"] - attributed
+        if other > 0:
+            lines.append(
+                f"  {'(other)':<{width}}  {'':>8}  {other:>8.3f}  {'':>8}  "
+                f"{100 * other / total:>5.1f}%"
+            )
+        if s["counts"]:
+            lines.append(
+                "  counts: "
+                + ", ".join(f"{k} {v:,}" for k, v in sorted(s["counts"].items()))
+            )
+        return "\n".join(lines)
+
+    def _speedscope(self) -> dict:
+        frames: dict[str, int] = {}
+        profiles = []
+        with self._lock:
+            threads = list(self._events.items())
+        for thread, events in threads:
+            if not events:
+                continue
+            out = []
+            open_frames: list[int] = []
+            for kind, name, at in events:
+                frame = frames.setdefault(name, len(frames))
+                if kind == "O":
+                    open_frames.append(frame)
+                else:
+                    open_frames.pop()
+                out.append(
+                    {"type": kind, "frame": frame, "at": (at - self._wall0) * 1000}
+                )
+            # Close phases still open when MAX_EVENTS cut the timeline off.
+            end = out[-1]["at"]
+            for frame in reversed(open_frames):
+                out.append({"type": "C", "frame": frame, "at": end})
+            profiles.append(
+                {
+                    "type": "evented",
+                    "name": thread,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": end,
+                    "events": out,
+                }
+            )
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": self.label,
+            "exporter": "atlas scripts/profiling.py",
+            "shared": {"frames": [{"name": n} for n in frames]},
+            "profiles": profiles,
+        }
+
+    def finish(self) -> None:
+        """Print the table and write the dump; runs once, at exit."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        summary = self.summary()
+        print(self.format_table(summary), file=sys.stderr)
+
+        dump = self.dump
+        if dump is None:
+            return
+        dump.parent.mkdir(parents=True, exist_ok=True)
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(dump)
+        elif dump.name.endswith(".speedscope.json"):
+            dump.write_text(json.dumps(self._speedscope()), encoding="utf-8")
+        else:
+            dump.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+        print(f"profile: wrote {dump}", file=sys.stderr)
+
+
+PROFILER = Profiler()
+phase = PROFILER.phase
+count = PROFILER.count
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"Print per-phase timings to stderr (or set {PROFILE_ENV}=1).",
+    )
+    parser.add_argument(
+        "--profile-dump",
+        type=Path,
+        help="Also write a .prof (cProfile), .speedscope.json or .json (phase table) dump.",
+    )
+
+
+def start_profiling(args: argparse.Namespace | None = None) -> None:
+    """Enable profiling from ``--profile``/``--profile-dump`` or the environment."""
+    dump = getattr(args, "profile_dump", None)
+    if dump is None and os.environ.get(DUMP_ENV):
+        dump = Path(os.environ[DUMP_ENV])
+    env = os.environ.get(PROFILE_ENV, "").strip().lower() not in (
+        "",
+        "0",
+        "false",
+        "no",
+    )
+    if getattr(args, "profile", False) or env or dump is not None:
+        PROFILER.enable(dump)
@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+"""
+Tokenizer-based parser for protobuf (proto2/proto3) schema files.
+
+Produces a schema model of the package, imports, messages (with nested
+messages and enums), fields with numbers/types/labels, oneofs, enums and
+services. Option values are skipped except for ``deprecated``; the model is
+meant for reference docs, not code generation.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import NamedTuple
+
+TOKEN_RE = re.compile(
+    r"""
+    (?P<ws>\s+)
+    |(?P<ident>\.?[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)
+    |(?P<symbol>[{}\[\]()<>;,=:])
+    |(?P<number>[-+]?(?:0[xX][0-9a-fA-F]+|\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)\b)
+    |(?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    |(?P<line_comment>//[^\n]*)
+    |(?P<block_comment>/\*.*?\*/)
+    |(?P<punct>[.\-+])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+LABELS = {"optional", "required", "repeated"}
+
+
+class ProtoParseError(ValueError):
+    pass
+
+
+class Token(NamedTuple):
+    kind: str
+    value: str
+    line: int
+    comment: str
+
+
+@dataclass
+class Field:
+    name: str
+    number: int
+    type: str
+    label: str = ""
+    oneof: str | None = None
+    deprecated: bool = False
+    comment: str = ""
+
+
+@dataclass
+class EnumValue:
+    name: str
+    number: int
+    comment: str = ""
+
+
+@dataclass
+class Enum:
+    name: str
+    full_name: str
+    values: list[EnumValue] = field(default_factory=list)
+    comment: str = ""
+
+
+@dataclass
+class Message:
+    name: str
+    full_name: str
+    fields: list[Field] = field(default_factory=list)
+    oneofs: list[str] = field(default_factory=list)
+    messages: list[Message] = field(default_factory=list)
+    enums: list[Enum] = field(default_factory=list)
+    reserved: list[str] = field(default_factory=list)
+    comment: str = ""
+
+
+@dataclass
+class Rpc:
+    name: str
+    request: str
+    response: str
+    client_streaming: bool = False
+    server_streaming: bool = False
+    comment: str = ""
+
+
+@dataclass
+class Service:
+    name: str
+    rpcs: list[Rpc] = field(default_factory=list)
+    comment: str = ""
+
+
+@dataclass
+class ProtoFile:
+    syntax: str = "proto2"
+    package: str = ""
+    imports: list[str] = field(default_factory=list)
+    messages: list[Message] = field(default_factory=list)
+    enums: list[Enum] = field(default_factory=list)
+    services: list[Service] = field(default_factory=list)
+
+    def iter_messages(self):
+        """Yield every message, nested ones right after their parent."""
+
+        def walk(messages: list[Message]):
+            for m in messages:
+                yield m
+                yield from walk(m.messages)
+
+        yield from walk(self.messages)
+
+    def iter_enums(self):
+        yield from self.enums
+        for m in self.iter_messages():
+            yield from m.enums
+
+
+def tokenize(text: str) -> list[Token]:
+    tokens: list[Token] = []
+    comments: list[str] = []
+    line = 1
+    pos = 0
+    # First token of the statement being read, and of the one that ended
+    # on ``ended_line`` (with ";" or "{"), which takes trailing comments.
+    start = 0
+    ended: int | None = None
+    ended_line = 0
+
+    def trailing(parts: list[str]) -> None:
+        tok = tokens[ended]
+        joined = " ".join(c for c in [tok.comment, *parts] if c)
+        tokens[ended] = tok._replace(comment=joined)
+
+    for m in TOKEN_RE.finditer(text):
+        if m.start() != pos:
+            raise ProtoParseError(f"line {line}: unexpected character {text[pos]!r}")
+        pos = m.end()
+        kind = m.lastgroup
+        value = m.group()
+
+        if kind == "ws":
+            newlines = value.count("\n")
+            # A blank line detaches a comment from the next declaration.
+            if newlines > 1:
+                comments.clear()
+            line += newlines
+            continue
+        if kind in ("line_comment", "block_comment"):
+            if kind == "line_comment":
+                parts = [value[2:].strip()]
+            else:
+                body = value[2:-2].strip("*").strip()
+                parts = [ln.strip().lstrip("*").strip() for ln in body.splitlines()]
+            if line == ended_line:
+                # "int64 ts = 2; // timestamp" documents ts, not the next field.
+                if ended is not None:
+                    trailing(parts)
+            else:
+                comments.extend(parts)
+            line += value.count("\n")
+            continue
+
+        if comments:
+            tokens.append(Token(kind, value, line, " ".join(c for c in comments if c)))
+            comments.clear()
+        else:
+            tokens.append(Token(kind, value, line, ""))
+        if kind == "symbol" and value in ";{}":
+            # A comment on a closing "}" line is dropped, not carried on.
+            ended = start if value != "}" else None
+            ended_line = line
+            start = len(tokens)
+
+    if pos != len(text):
+        raise ProtoParseError(f"line {line}: unexpected character {text[pos]!r}")
+    return tokens
+
+
+class _Parser:
+    def __init__(self, tokens: list[Token]):
+        self.tokens = tokens
+        self.i = 0
+
+    # -- token helpers --------------------------------------------------------
+
+    def peek(self, offset: int = 0) -> Token | None:
+        j = self.i + offset
+        return self.tokens[j] if j < len(self.tokens) else None
+
+    def next(self) -> Token:
+        tok = self.peek()
+        if tok is None:
+            raise ProtoParseError("unexpected end of file")
+        self.i += 1
+        return tok
+
+    def accept(self, value: str) -> bool:
+        tok = self.peek()
+        if tok is not None and tok.value == value and tok.kind != "string":
+            self.i += 1
+            return True
+        return False
+
+    def expect(self, value: str) -> Token:
+        tok = self.next()
+        if tok.value != value:
+            raise ProtoParseError(
+                f"line {tok.line}: expected {value!r}, got {tok.value!r}"
+            )
+        return tok
+
+    def ident(self) -> Token:
+        tok = self.next()
+        if tok.kind != "ident":
+            raise ProtoParseError(
+                f"line {tok.line}: expected identifier, got {tok.value!r}"
+            )
+        return tok
+
+    def integer(self) -> int:
+        tok = self.next()
+        if tok.kind != "number":
+            raise ProtoParseError(
+                f"line {tok.line}: expected number, got {tok.value!r}"
+            )
+        # intLit is decimal, 0x hex or leading-0 octal; Python's base 0
+        # rejects the octal form.
+        digits = tok.value.lstrip("+-")
+        try:
+            if digits[:2] in ("0x", "0X"):
+                value = int(digits[2:], 16)
+            elif len(digits) > 1 and digits.startswith("0"):
+                value = int(digits, 8)
+            else:
+                value = int(digits, 10)
+        except ValueError:
+            raise ProtoParseError(
+                f"line {tok.line}: expected integer, got {tok.value!r}"
+            ) from None
+        return -value if tok.value.startswith("-") else value
+
+    def string(self) -> str:
+        tok = self.next()
+        if tok.kind != "string":
+            raise ProtoParseError(
+                f"line {tok.line}: expected string, got {tok.value!r}"
+            )
+        return tok.value[1:-1]
+
+    def skip_statement(self) -> None:
+        """Skip to the end of the current statement or balanced block."""
+        depth = 0
+        while True:
+            tok = self.next()
+            if tok.kind == "string":
+                continue
+            if tok.value == "{":
+                depth += 1
+            elif tok.value == "}":
+                depth -= 1
+                if depth == 0:
+                    return
+            elif tok.value == ";" and depth == 0:
+                return
+
+    def field_options(self) -> bool:
+        """Consume ``[ ... ]`` after a field; return whether deprecated=true."""
+        deprecated = False
+        if not self.accept("["):
+            return deprecated
+        depth = 1
+        while depth:
+            tok = self.next()
+            if tok.kind == "string":
+                continue
+            if tok.value == "[":
+                depth += 1
+            elif tok.value == "]":
+                depth -= 1
+            elif tok.value == "deprecated" and self.accept("="):
+                deprecated = self.next().value == "true"
+        return deprecated
+
+    # -- grammar --------------------------------------------------------------
+
+    def parse_file(self) -> ProtoFile:
+        pf = ProtoFile()
+        while self.peek() is not None:
+            tok = self.peek()
+            if self.accept(";"):
+                continue
+            if tok.value in {"syntax", "edition"}:
+                self.next()
+                self.expect("=")
+                pf.syntax = self.string() if tok.value == "syntax" else "editions"
+                self.expect(";")
+            elif tok.value == "package":
+                self.next()
+                pf.package = self.ident().value
+                self.expect(";")
+            elif tok.value == "import":
+                self.next()
+                if self.peek().value in {"public", "weak"}:
+                    self.next()
+                pf.imports.append(self.string())
+                self.expect(";")
+            elif tok.value == "message":
+                pf.messages.append(self.parse_message(pf.package))
+            elif tok.value == "enum":
+                pf.enums.append(self.parse_enum(pf.package))
+            elif tok.value == "service":
+                pf.services.append(self.parse_service())
+            elif tok.value in {"option", "extend"}:
+                self.skip_statement()
+            else:
+                raise ProtoParseError(f"line {tok.line}: unexpected {tok.value!r}")
+        return pf
+
+    def parse_message(self, scope: str) -> Message:
+        comment = self.expect("message").comment
+        name = self.ident().value
+        msg = Message(name=name, full_name=_join(scope, name), comment=comment)
+        self.expect("{")
+        self.parse_message_body(msg, oneof=None)
+        return msg
+
+    def parse_message_body(self, msg: Message, oneof: str | None) -> None:
+        while not self.accept("}"):
+            tok = self.peek()
+            if tok is None:
+                raise ProtoParseError(f"unterminated message {msg.full_name}")
+            if self.accept(";"):
+                continue
+            if oneof is None and tok.value == "message":
+                msg.messages.append(self.parse_message(msg.full_name))
+            elif oneof is None and tok.value == "enum":
+                msg.enums.append(self.parse_enum(msg.full_name))
+            elif oneof is None and tok.value == "oneof":
+                self.next()
+                group = self.ident().value
+                msg.oneofs.append(group)
+                self.expect("{")
+                self.parse_message_body(msg, oneof=group)
+            elif tok.value == "reserved":
+                self.next()
+                msg.reserved.append(self.parse_reserved())
+            elif tok.value in {"option", "extensions", "extend"}:
+                self.skip_statement()
+            elif tok.value == "map" and self.peek(1) and self.peek(1).value == "<":
+                msg.fields.append(self.parse_map_field(oneof))
+            else:
+                msg.fields.append(self.parse_field(oneof))
+
+    def parse_field(self, oneof: str | None) -> Field:
+        first = self.peek()
+        label = ""
+        if first.value in LABELS:
+            label = self.next().value
+        type_tok = self.ident()
+        if type_tok.value == "group":
+            raise ProtoParseError(
+                f"line {type_tok.line}: proto2 groups are not supported"
+            )
+        name = self.ident().value
+        self.expect("=")
+        number = self.integer()
+        deprecated = self.field_options()
+        self.expect(";")
+        return Field(
+            name=name,
+            number=number,
+            type=type_tok.value,
+            label=label,
+            oneof=oneof,
+            deprecated=deprecated,
+            comment=first.comment,
+        )
+
+    def parse_map_field(self, oneof: str | None) -> Field:
+        first = self.expect("map")
+        self.expect("<")
+        key = self.ident().value
+        self.expect(",")
+        value = self.ident().value
+        self.expect(">")
+        name = self.ident().value
+        self.expect("=")
+        number = self.integer()
+        deprecated = self.field_options()
+        self.expect(";")
+        return Field(
+            name=name,
+            number=number,
+            type=f"map<{key}, {value}>",
+            oneof=oneof,
+            deprecated=deprecated,
+            comment=first.comment,
+        )
+
+    def parse_reserved(self) -> str:
+        parts: list[str] = []
+        while not self.accept(";"):
+            tok = self.next()
+            if tok.value == ",":
+                parts.append(", ")
+            elif tok.value == "to":
+                parts.append(" to ")
+            elif tok.kind == "string":
+                parts.append(f'"{tok.value[1:-1]}"')
+            else:
+                parts.append(tok.value)
+        return "".join(parts)
+
+    def parse_enum(self, scope: str) -> Enum:
+        comment = self.expect("enum").comment
+        name = self.ident().value
+        enum = Enum(name=name, full_name=_join(scope, name), comment=comment)
+        self.expect("{")
+        while not self.accept("}"):
+            tok = self.peek()
+            if tok is None:
+                raise ProtoParseError(f"unterminated enum {enum.full_name}")
+            if self.accept(";"):
+                continue
+            if tok.value in {"option", "reserved"}:
+                self.skip_statement()
+                continue
+            value_name = self.ident()
+            self.expect("=")
+            number = self.integer()
+            self.field_options()
+            self.expect(";")
+            enum.values.append(
+                EnumValue(value_name.value, number, comment=value_name.comment)
+            )
+        return enum
+
+    def parse_service(self) -> Service:
+        comment = self.expect("service").comment
+        service = Service(name=self.ident().value, comment=comment)
+        self.expect("{")
+        while not self.accept("}"):
+            tok = self.peek()
+            if tok is None:
+                raise ProtoParseError(f"unterminated service {service.name}")
+            if self.accept(";"):
+                continue
+            if tok.value != "rpc":
+                self.skip_statement()
+                continue
+            self.next()
+            name = self.ident().value
+            self.expect("(")
+            client_streaming = self.accept("stream")
+            request = self.ident().value
+            self.expect(")")
+            self.expect("returns")
+            self.expect("(")
+            server_streaming = self.accept("stream")
+            response = self.ident().value
+            self.expect(")")
+            if self.peek() is not None and self.peek().value == "{":
+                self.skip_statement()
+            else:
+                self.expect(";")
+            service.rpcs.append(
+                Rpc(
+                    name=name,
+                    request=request,
+                    response=response,
+                    client_streaming=client_streaming,
+                    server_streaming=server_streaming,
+                    comment=tok.comment,
+                )
+            )
+        return service
+
+
+def _join(scope: str, name: str) -> str:
+    return f"{scope}.{name}" if scope else name
+
+
+def parse_proto(text: str) -> ProtoFile:
+    return _Parser(tokenize(text)).parse_file()
+
+
+def parse_proto_file(path: Path) -> ProtoFile:
+    try:
+        return parse_proto(path.read_text(encoding="utf-8", errors="replace"))
+    except ProtoParseError as e:
+        raise ProtoParseError(f"{path}: {e}") from None
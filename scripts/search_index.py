@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Local full-text search over the pages in ``docs.json`` navigation.
+
+The index keeps two CSR tables of ``array`` columns:
+
+- forward: page -> (term id, term frequency), the per-page source of truth;
+- inverted: term -> (page id, term frequency), derived from the forward
+  table by a counting sort and used for BM25 scoring.
+
+Pages are re-tokenized only when their content digest changes; the inverted
+table is then rebuilt in O(postings). Both tables are stored in one binary
+file under ``.cache/`` (a JSON header followed by the raw arrays), so a query
+loads the index without re-reading the corpus.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import math
+import os
+import re
+import sys
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from docs_graph import load_navigation
+from fs_walk import MD_EXTS, read_text
+from hash_cache import ATLAS_ROOT, CACHE_DIR, HashCache
+from link_graph import FRONTMATTER_RE
+from profiling import add_profile_arguments, phase, start_profiling
+
+INDEX_PATH = CACHE_DIR / "search-index.bin"
+# Bump when tokenization or the file layout changes.
+INDEX_VERSION = 1
+
+HASHES = HashCache(CACHE_DIR / "search_index-hashes.json")
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+TITLE_RE = re.compile(r"^title:[ \t]*(.+?)[ \t]*$", re.M)
+# Title terms count this many times toward a page's term frequencies.
+TITLE_BOOST = 3
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_MAGIC = b"ATLASIDX"
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def page_terms(text: str) -> Counter[str]:
+    """Term frequencies for one page: body plus boosted frontmatter title."""
+    m = FRONTMATTER_RE.match(text)
+    counts = Counter(tokenize(text[m.end() :] if m else text))
+    if m:
+        title = TITLE_RE.search(m.group(1))
+        if title:
+            for term in tokenize(title.group(1).strip("\"'")):
+                counts[term] += TITLE_BOOST
+    return counts
+
+
+def _page_to_file(page: str) -> Path | None:
+    for ext in MD_EXTS:
+        candidate = ATLAS_ROOT / f"{page}{ext}"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+@dataclass
+class Hit:
+    page: str
+    score: float
+
+
+class SearchIndex:
+    def __init__(self) -> None:
+        self.pages: list[str] = []
+        self.page_ids: dict[str, int] = {}
+        self.digests: list[str] = []
+        self.terms: list[str] = []
+        self.term_ids: dict[str, int] = {}
+        self._top_terms: dict[tuple[int, int], list[str]] = {}
+
+        self.doc_offsets = array("I", [0])
+        self.doc_terms = array("I")
+        self.doc_tfs = array("I")
+
+        self.term_offsets = array("I", [0])
+        self.post_docs = array("I")
+        self.post_tfs = array("I")
+        self.doc_lengths = array("I")
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    @property
+    def average_length(self) -> float:
+        return sum(self.doc_lengths) / len(self.doc_lengths) if self.pages else 0.0
+
+    def _row(self, doc: int) -> tuple[array, array]:
+        lo, hi = self.doc_offsets[doc], self.doc_offsets[doc + 1]
+        return self.doc_terms[lo:hi], self.doc_tfs[lo:hi]
+
+    def postings(self, term: str) -> tuple[array, array]:
+        tid = self.term_ids.get(term)
+        if tid is None:
+            return array("I"), array("I")
+        lo, hi = self.term_offsets[tid], self.term_offsets[tid + 1]
+        return self.post_docs[lo:hi], self.post_tfs[lo:hi]
+
+    @classmethod
+    def build(
+        cls,
+        pages: list[tuple[str, Path]],
+        previous: SearchIndex | None = None,
+    ) -> tuple[SearchIndex, int]:
+        """Index ``(page, file)`` pairs; returns ``(index, pages re-read)``.
+
+        Rows from ``previous`` are reused for pages whose digest is
+        unchanged. Term IDs are reassigned, so terms that no page uses any
+        more are dropped.
+        """
+        reuse: dict[str, tuple[str, int]] = {}
+        if previous is not None:
+            reuse = {
+                page: (digest, doc)
+                for doc, (page, digest) in enumerate(
+                    zip(previous.pages, previous.digests)
+                )
+            }
+
+        index = cls()
+        reread = 0
+        for page, path in pages:
+            digest = HASHES.sha256_file(path)
+            old = reuse.get(page)
+            if old is not None and old[0] == digest:
+                terms, tfs = previous._row(old[1])
+                counts = {previous.terms[t]: f for t, f in zip(terms, tfs)}
+            else:
+                text = read_text(path)
+                with phase("tokenize"):
+                    counts = page_terms(text)
+                reread += 1
+            with phase("index build"):
+                index._add(page, digest, counts)
+
+        with phase("index build"):
+            index._invert()
+        return index, reread
+
+    def _add(self, page: str, digest: str, counts: dict[str, int]) -> None:
+        term_ids = self.term_ids
+        for term, tf in sorted(counts.items()):
+            tid = term_ids.get(term)
+            if tid is None:
+                tid = term_ids[term] = len(self.terms)
+                self.terms.append(term)
+            self.doc_terms.append(tid)
+            self.doc_tfs.append(tf)
+        self.doc_offsets.append(len(self.doc_terms))
+        self.doc_lengths.append(sum(counts.values()))
+        self.page_ids[page] = len(self.pages)
+        self.pages.append(page)
+        self.digests.append(digest)
+
+    def _invert(self) -> None:
+        n_terms = len(self.terms)
+        df = [0] * (n_terms + 1)
+        for tid in self.doc_terms:
+            df[tid + 1] += 1
+        for i in range(n_terms):
+            df[i + 1] += df[i]
+        self.term_offsets = array("I", df)
+
+        cursor = df[:n_terms]
+        m = len(self.doc_terms)
+        post_docs = array("I", bytes(4 * m))
+        post_tfs = array("I", bytes(4 * m))
+        offsets, terms, tfs = self.doc_offsets, self.doc_terms, self.doc_tfs
+        for doc in range(len(self.pages)):
+            for e in range(offsets[doc], offsets[doc + 1]):
+                tid = terms[e]
+                slot = cursor[tid]
+                post_docs[slot] = doc
+                post_tfs[slot] = tfs[e]
+                cursor[tid] = slot + 1
+        self.post_docs, self.post_tfs = post_docs, post_tfs
+
+    def idf(self, term: str) -> float:
+        tid = self.term_ids.get(term)
+        if tid is None:
+            return 0.0
+        df = self.term_offsets[tid + 1] - self.term_offsets[tid]
+        n = len(self.pages)
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, limit: int = 10) -> list[Hit]:
+        """BM25 over the postings of each distinct query term."""
+        avg = self.average_length or 1.0
+        lengths = self.doc_lengths
+        scores: dict[int, float] = {}
+        for term in dict.fromkeys(tokenize(query)):
+            idf = self.idf(term)
+            if not idf:
+                continue
+            docs, tfs = self.postings(term)
+            for doc, tf in zip(docs, tfs):
+                norm = BM25_K1 * (1.0 - BM25_B + BM25_B * lengths[doc] / avg)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (BM25_K1 + 1) / (
+                    tf + norm
+                )
+        best = heapq.nlargest(limit, scores.items(), key=lambda kv: (kv[1], -kv[0]))
+        return [Hit(self.pages[doc], score) for doc, score in best]
+
+    def top_terms(self, page: str, limit: int = 20) -> list[str]:
+        """The page's ``limit`` highest tf-idf terms (memoized per page)."""
+        doc = self.page_ids.get(page)
+        if doc is None:
+            return []
+        key = (doc, limit)
+        top = self._top_terms.get(key)
+        if top is None:
+            terms, tfs = self._row(doc)
+            weighted = (
+                (tf * self.idf(self.terms[t]), self.terms[t])
+                for t, tf in zip(terms, tfs)
+            )
+            top = [term for _, term in heapq.nlargest(limit, weighted)]
+            self._top_terms[key] = top
+        return top
+
+    def vocabulary_overlap(
+        self, page: str, limit: int = 20
+    ) -> tuple[str | None, float]:
+        """Page whose top terms overlap ``page``'s most, with their Jaccard.
+
+        Candidates come from the postings of ``page``'s own top terms, and
+        only those sharing at least half of them are compared in full, so
+        this is cheap enough to run for every page in an audit.
+        """
+        top = self.top_terms(page, limit)
+        if not top:
+            return None, 0.0
+        doc = self.page_ids[page]
+        shared: Counter[int] = Counter()
+        for term in top:
+            docs, _ = self.postings(term)
+            shared.update(docs)
+        shared.pop(doc, None)
+
+        mine = set(top)
+        best: tuple[str | None, float] = (None, 0.0)
+        for other, count in sorted(shared.items()):
+            if 2 * count < len(top):
+                continue
+            theirs = set(self.top_terms(self.pages[other], limit))
+            score = len(mine & theirs) / len(mine | theirs)
+            if score > best[1]:
+                best = (self.pages[other], score)
+        return best
+
+    def save(self, path: Path = INDEX_PATH) -> None:
+        header = json.dumps(
+            {
+                "version": INDEX_VERSION,
+                "byteorder": sys.byteorder,
+                "pages": self.pages,
+                "digests": self.digests,
+                "terms": self.terms,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            f.write(_MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for arr in self._arrays():
+                f.write(len(arr).to_bytes(8, "little"))
+                arr.tofile(f)
+        os.replace(tmp, path)
+
+    def _arrays(self) -> list[array]:
+        return [
+            self.doc_offsets,
+            self.doc_terms,
+            self.doc_tfs,
+            self.doc_lengths,
+            self.term_offsets,
+            self.post_docs,
+            self.post_tfs,
+        ]
+
+    @classmethod
+    def load(cls, path: Path = INDEX_PATH) -> SearchIndex | None:
+        """Read a saved index, or None if missing, stale or unreadable."""
+        try:
+            with path.open("rb") as f:
+                if f.read(len(_MAGIC)) != _MAGIC:
+                    return None
+                size = int.from_bytes(f.read(8), "little")
+                header = json.loads(f.read(size))
+                if header.get("version") != INDEX_VERSION:
+                    return None
+                arrays = []
+                for _ in range(7):
+                    count = int.from_bytes(f.read(8), "little")
+                    arr = array("I")
+                    arr.fromfile(f, count)
+                    if header["byteorder"] != sys.byteorder:
+                        arr.byteswap()
+                    arrays.append(arr)
+        except (OSError, ValueError, EOFError, KeyError):
+            return None
+
+        index = cls()
+        index.pages = header["pages"]
+        index.page_ids = {p: i for i, p in enumerate(index.pages)}
+        index.digests = header["digests"]
+        index.terms = header["terms"]
+        index.term_ids = {t: i for i, t in enumerate(index.terms)}
+        (
+            index.doc_offsets,
+            index.doc_terms,
+            index.doc_tfs,
+            index.doc_lengths,
+            index.term_offsets,
+            index.post_docs,
+            index.post_tfs,
+        ) = arrays
+        return index
+
+
+def navigation_files() -> list[tuple[str, Path]]:
+    """``(page, file)`` for every navigation page that has a file."""
+    out = []
+    for page in load_navigation():
+        path = _page_to_file(page)
+        if path is not None:
+            out.append((page, path))
+    return out
+
+
+def update_index(path: Path = INDEX_PATH) -> tuple[SearchIndex, int]:
+    """Load the saved index, refresh changed pages and save if anything moved."""
+    with phase("index load"):
+        previous = SearchIndex.load(path)
+    index, reread = SearchIndex.build(navigation_files(), previous)
+    with phase("cache save"):
+        if (
+            previous is None
+            or reread
+            or previous.pages != index.pages
+            or previous.digests != index.digests
+        ):
+            index.save(path)
+        HASHES.save()
+    return index, reread
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Build or query the local BM25 search index for docs.json pages."
+    )
+    parser.add_argument(
+        "--query",
+        "-q",
+        help="Search the index and print the best matching pages.",
+    )
+    parser.add_argument(
+        "--similar",
+        metavar="PAGE",
+        help="Print the page sharing the most top terms with PAGE.",
+    )
+    parser.add_argument(
+        "--limit",
+        "-n",
+        type=int,
+        default=10,
+        help="Results to print (default: 10).",
+    )
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_profiling(args)
+
+    index, reread = update_index()
+
+    if args.query:
+        with phase("search"):
+            hits = index.search(args.query, args.limit)
+        if not hits:
+            print("No matches.")
+            return 1
+        for hit in hits:
+            print(f"{hit.score:7.2f}  /{hit.page}")
+        return 0
+
+    if args.similar:
+        page = args.similar.strip("/")
+        if page not in index.page_ids:
+            print(f"Unknown page: {args.similar}", file=sys.stderr)
+            return 2
+        with phase("vocabulary overlap"):
+            other, share = index.vocabulary_overlap(page)
+        print(f"Top terms: {', '.join(index.top_terms(page))}")
+        if other is None:
+            print("No overlapping page.")
+        else:
+            print(f"Most overlap: /{other} (top-term Jaccard {share:.2f})")
+        return 0
+
+    print(
+        f"Search index: {len(index)} pages, {len(index.terms)} terms, "
+        f"{len(index.post_docs)} postings ({reread} pages re-read)."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
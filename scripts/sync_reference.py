@@ -5,11 +5,23 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
-import re
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+from fs_walk import iter_entries
+from hash_cache import CACHE_DIR, HashCache
+from openapi_index import (
+    INDEX_VERSION,
+    Operation,
+    build_operation_index,
+    index_to_json,
+)
+from profiling import add_profile_arguments, count, phase, start_profiling
+from proto_schema import ProtoFile, ProtoParseError, parse_proto, parse_proto_file
+
 ATLAS_ROOT = Path(__file__).resolve().parents[1]
 # Monorepo root is the parent of `platform/`.
 REPO_ROOT = ATLAS_ROOT.parents[1]
@@ -34,6 +46,13 @@ def _resolve_openapi_source() -> Path | None:
 SNIPPETS_DIR = ATLAS_ROOT / "snippets" / "generated"
 PROTO_SNIPPET = SNIPPETS_DIR / "events-proto-summary.mdx"
 SOURCES_MANIFEST = ATLAS_ROOT / "openapi" / "SOURCES.json"
+OPERATIONS_INDEX = ATLAS_ROOT / "openapi" / "OPERATIONS.json"
+OPENAPI_SNIPPETS_DIR = SNIPPETS_DIR / "openapi"
+# Bump when the per-operation snippet layout changes to force regeneration.
+OPENAPI_SNIPPET_VERSION = 1
+
+# Digests of every source/dest file, reused across runs while unchanged.
+HASHES = HashCache(CACHE_DIR / "sync_reference-hashes.json")
 
 
 @dataclass(frozen=True)
@@ -43,12 +62,42 @@ class SourceItem:
     dest_path: Path | None
 
 
+# Worker threads for hashing (I/O-bound; hashlib releases the GIL) and for
+# snippet rendering/writing. Results are always collected in input order.
+JOBS = min(32, (os.cpu_count() or 1) + 4)
+_executor: ThreadPoolExecutor | None = None
+
+
+def _pmap(fn, items) -> list:
+    """Ordered map over a shared, bounded thread pool."""
+    global _executor
+    items = list(items)
+    if JOBS <= 1 or len(items) < 2:
+        return [fn(item) for item in items]
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=JOBS, thread_name_prefix="sync")
+    return list(_executor.map(fn, items))
+
+
+def set_jobs(jobs: int) -> None:
+    global JOBS, _executor
+    JOBS = max(1, jobs)
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+
+
+def _hash_entry(entry: tuple[Path, os.stat_result]) -> str:
+    return HASHES.sha256_file(*entry)
+
+
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    return HASHES.sha256_file(path)
+
+
+def _iter_tree_files(root: Path) -> list[tuple[Path, os.stat_result]]:
+    """Return (path, stat) for every file under root, one stat per file."""
+    return [(Path(e.path), e.stat()) for e in iter_entries(root)]
 
 
 def sha256_path(path: Path) -> str:
@@ -61,11 +110,12 @@ def sha256_path(path: Path) -> str:
 
     if path.is_dir():
         h = hashlib.sha256()
-        for p in sorted([p for p in path.rglob("*") if p.is_file()]):
+        files = sorted(_iter_tree_files(path))
+        for (p, _), digest in zip(files, _pmap(_hash_entry, files)):
             rel = p.relative_to(path).as_posix().encode("utf-8")
             h.update(rel)
             h.update(b"\0")
-            h.update(sha256_file(p).encode("utf-8"))
+            h.update(digest.encode("utf-8"))
             h.update(b"\n")
         return h.hexdigest()
 
@@ -87,26 +137,81 @@ def copy_if_changed(src: Path, dst: Path) -> bool:
         return False
 
     shutil.copyfile(src, dst)
+    HASHES.invalidate(dst)
     return True
 
 
-MESSAGE_RE = re.compile(r"^\s*message\s+(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*\{\s*$")
+# Bump when the per-file snippet layout changes to force regeneration.
+PROTO_SNIPPET_VERSION = 1
+PROTO_SNIPPETS_DIR = SNIPPETS_DIR / "proto"
+# Message names per proto digest, so the summary needs no parse when unchanged.
+PROTO_INDEX = CACHE_DIR / "sync_reference-proto-index.json"
+
+_parsed: dict[str, ProtoFile] = {}
+_message_index: dict[str, list[str]] | None = None
+_message_index_seen: set[str] = set()
+# Proto files that failed to parse this run (path -> error); they are
+# reported and skipped rather than aborting the sync.
+_parse_errors: dict[Path, str] = {}
 
 
 def extract_proto_messages(proto_text: str) -> list[str]:
-    names: list[str] = []
-    for line in proto_text.splitlines():
-        m = MESSAGE_RE.match(line)
-        if m:
-            names.append(m.group("name"))
+    """Return every message name (nested included) in declaration order."""
+    return [m.name for m in parse_proto(proto_text).iter_messages()]
+
+
+def _proto_files(proto_dir: Path) -> list[tuple[Path, os.stat_result]]:
+    return sorted(
+        (p, st) for p, st in _iter_tree_files(proto_dir) if p.suffix == ".proto"
+    )
+
+
+def _parse_cached(path: Path, digest: str) -> ProtoFile | None:
+    """Parsed ``path``, or None (recorded in ``_parse_errors``) if invalid."""
+    pf = _parsed.get(digest)
+    if pf is None:
+        try:
+            with phase("proto parse"):
+                pf = _parsed[digest] = parse_proto_file(path)
+        except ProtoParseError as e:
+            _parse_errors[path] = str(e)
+            return None
+        count("protos parsed")
+    return pf
+
+
+def _message_names(path: Path, digest: str) -> list[str] | None:
+    global _message_index
+    if _message_index is None:
+        try:
+            _message_index = json.loads(PROTO_INDEX.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _message_index = {}
+    _message_index_seen.add(digest)
+    names = _message_index.get(digest)
+    if names is None:
+        pf = _parse_cached(path, digest)
+        if pf is None:
+            return None
+        names = [m.name for m in pf.iter_messages()]
+        _message_index[digest] = names
     return names
 
 
+def save_proto_index() -> None:
+    if _message_index is None:
+        return
+    kept = {d: n for d, n in _message_index.items() if d in _message_index_seen}
+    ensure_dir(PROTO_INDEX.parent)
+    PROTO_INDEX.write_text(json.dumps(kept, sort_keys=True), encoding="utf-8")
+
+
 def generate_proto_snippet(proto_dir: Path) -> str:
     if not proto_dir.exists():
         return "## Event schemas (protobuf)\n\n" "Proto directory not found.\n"
 
-    proto_files = sorted(p for p in proto_dir.glob("*.proto") if p.is_file())
+    proto_files = _proto_files(proto_dir)
+    digests = _pmap(_hash_entry, proto_files)
     lines: list[str] = []
 
     lines.append("## Event schemas (protobuf)")
@@ -119,9 +224,9 @@ def generate_proto_snippet(proto_dir: Path) -> str:
     lines.append("### Sources")
     lines.append("")
 
-    for p in proto_files:
+    for (p, _), digest in zip(proto_files, digests):
         rel = p.relative_to(REPO_ROOT).as_posix()
-        lines.append(f"- `{rel}` (`sha256:{sha256_file(p)[:12]}`)")
+        lines.append(f"- `{rel}` (`sha256:{digest[:12]}`)")
 
     lines.append("")
     lines.append("### Message index")
@@ -129,18 +234,341 @@ def generate_proto_snippet(proto_dir: Path) -> str:
     lines.append("| File | Messages |")
     lines.append("|---|---|")
 
-    for p in proto_files:
-        messages = extract_proto_messages(
-            p.read_text(encoding="utf-8", errors="replace")
-        )
+    for (p, _), digest in zip(proto_files, digests):
+        messages = _message_names(p, digest)
         rel = p.relative_to(REPO_ROOT).as_posix()
-        msg_str = ", ".join(f"`{m}`" for m in messages) if messages else "(none)"
+        if messages is None:
+            msg_str = "(parse error)"
+        else:
+            msg_str = ", ".join(f"`{m}`" for m in messages) if messages else "(none)"
         lines.append(f"| `{rel}` | {msg_str} |")
 
     lines.append("")
     return "\n".join(lines)
 
 
+def _cell(text: str) -> str:
+    return text.replace("|", "\\|")
+
+
+def _local_name(full_name: str, package: str) -> str:
+    if package and full_name.startswith(package + "."):
+        return full_name[len(package) + 1 :]
+    return full_name
+
+
+def _proto_snippet_path(proto: Path, proto_dir: Path) -> Path:
+    return PROTO_SNIPPETS_DIR / proto.relative_to(proto_dir).with_suffix(".mdx")
+
+
+def _proto_snippet_header(proto: Path, digest: str) -> str:
+    rel = proto.relative_to(REPO_ROOT).as_posix()
+    return (
+        f"{{/* Generated by scripts/sync_reference.py (v{PROTO_SNIPPET_VERSION}) "
+        f"from {rel} sha256:{digest}. Do not edit. */}}"
+    )
+
+
+def render_proto_reference(pf: ProtoFile, proto: Path, digest: str) -> str:
+    """Render the field-level reference snippet for one .proto file."""
+    rel = proto.relative_to(REPO_ROOT).as_posix()
+    lines: list[str] = [_proto_snippet_header(proto, digest), ""]
+
+    lines.append(f"## `{proto.name}`")
+    lines.append("")
+    lines.append(f"- Source: `{rel}`")
+    lines.append(f"- Syntax: `{pf.syntax}`")
+    if pf.package:
+        lines.append(f"- Package: `{pf.package}`")
+    if pf.imports:
+        lines.append("- Imports: " + ", ".join(f"`{i}`" for i in pf.imports))
+    lines.append("")
+
+    messages = list(pf.iter_messages())
+    if messages:
+        lines.append("### Messages")
+        lines.append("")
+    for m in messages:
+        lines.append(f"#### `{_local_name(m.full_name, pf.package)}`")
+        lines.append("")
+        if m.comment:
+            lines.append(m.comment)
+            lines.append("")
+        if m.fields:
+            lines.append("| # | Field | Type | Label | Notes |")
+            lines.append("|---:|---|---|---|---|")
+            for f in m.fields:
+                label = f"oneof `{f.oneof}`" if f.oneof else f.label
+                notes = "; ".join(
+                    n for n in ["deprecated" if f.deprecated else "", f.comment] if n
+                )
+                lines.append(
+                    f"| {f.number} | `{f.name}` | `{_cell(f.type)}` | {label} | {_cell(notes)} |"
+                )
+        else:
+            lines.append("(no fields)")
+        if m.reserved:
+            lines.append("")
+            lines.append("Reserved: " + "; ".join(f"`{r}`" for r in m.reserved))
+        lines.append("")
+
+    enums = list(pf.iter_enums())
+    if enums:
+        lines.append("### Enums")
+        lines.append("")
+    for e in enums:
+        lines.append(f"#### `{_local_name(e.full_name, pf.package)}`")
+        lines.append("")
+        if e.comment:
+            lines.append(e.comment)
+            lines.append("")
+        lines.append("| Value | Name | Notes |")
+        lines.append("|---:|---|---|")
+        for v in e.values:
+            lines.append(f"| {v.number} | `{v.name}` | {_cell(v.comment)} |")
+        lines.append("")
+
+    if pf.services:
+        lines.append("### Services")
+        lines.append("")
+    for svc in pf.services:
+        lines.append(f"#### `{svc.name}`")
+        lines.append("")
+        if svc.comment:
+            lines.append(svc.comment)
+            lines.append("")
+        lines.append("| RPC | Request | Response | Notes |")
+        lines.append("|---|---|---|---|")
+        for r in svc.rpcs:
+            req = f"stream `{r.request}`" if r.client_streaming else f"`{r.request}`"
+            resp = f"stream `{r.response}`" if r.server_streaming else f"`{r.response}`"
+            lines.append(f"| `{r.name}` | {req} | {resp} | {_cell(r.comment)} |")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def _first_line(path: Path) -> str | None:
+    count("headers read")
+    try:
+        with phase("header read"), path.open(encoding="utf-8") as f:
+            return f.readline().rstrip("\n")
+    except OSError:
+        return None
+
+
+def sync_proto_references(proto_dir: Path, check: bool) -> list[Path]:
+    """Regenerate per-file proto snippets whose source digest changed.
+
+    Unchanged sources are detected from the digest in each snippet's header
+    line, so they are neither parsed nor rendered. Snippets whose proto was
+    removed are deleted. Returns the outdated paths (in check mode nothing
+    is written).
+    """
+    outdated: list[Path] = []
+    expected: set[Path] = set()
+    pending: list[tuple[Path, str, Path]] = []
+
+    if proto_dir.exists():
+        proto_files = _proto_files(proto_dir)
+        for (p, _), digest in zip(proto_files, _pmap(_hash_entry, proto_files)):
+            out = _proto_snippet_path(p, proto_dir)
+            expected.add(out)
+            if _first_line(out) == _proto_snippet_header(p, digest):
+                continue
+            outdated.append(out)
+            pending.append((p, digest, out))
+
+    def regenerate(job: tuple[Path, str, Path]) -> None:
+        p, digest, out = job
+        pf = _parse_cached(p, digest)
+        if pf is None:
+            return
+        with phase("render"):
+            text = render_proto_reference(pf, p, digest) + "\n"
+        ensure_dir(out.parent)
+        with phase("write"):
+            out.write_text(text, encoding="utf-8")
+        count("snippets written")
+
+    if not check:
+        _pmap(regenerate, pending)
+
+    if PROTO_SNIPPETS_DIR.exists():
+        for p, _ in _iter_tree_files(PROTO_SNIPPETS_DIR):
+            if p.suffix == ".mdx" and p not in expected:
+                outdated.append(p)
+                if not check:
+                    p.unlink()
+                    parent = p.parent
+                    while parent != PROTO_SNIPPETS_DIR and not any(parent.iterdir()):
+                        parent.rmdir()
+                        parent = parent.parent
+
+    return outdated
+
+
+def _openapi_snippet_header(slug: str, meta: dict) -> str:
+    return (
+        f"{{/* Generated by scripts/sync_reference.py (v{OPENAPI_SNIPPET_VERSION}) "
+        f"from openapi/openapi.json {meta['method']} {meta['path']} "
+        f"sha256:{meta['sha256']}. Do not edit. */}}"
+    )
+
+
+def _schema_block(schema: dict) -> list[str]:
+    return ["```json", json.dumps(schema, indent=2, sort_keys=True), "```"]
+
+
+def render_operation_reference(op: Operation, meta: dict) -> str:
+    """Render the reference snippet for one OpenAPI operation."""
+    lines: list[str] = [_openapi_snippet_header(op.slug, meta), ""]
+
+    title = op.summary or op.operation_id or f"{op.method} {op.path}"
+    lines.append(f"## {title}")
+    lines.append("")
+    lines.append(f"`{op.method} {op.path}`" + (" (webhook)" if op.webhook else ""))
+    lines.append("")
+    if op.deprecated:
+        lines.append("> **Deprecated.**")
+        lines.append("")
+    if op.operation_id:
+        lines.append(f"- Operation ID: `{op.operation_id}`")
+    if op.tags:
+        lines.append("- Tags: " + ", ".join(f"`{t}`" for t in op.tags))
+    if op.operation_id or op.tags:
+        lines.append("")
+    if op.description:
+        lines.append(op.description)
+        lines.append("")
+
+    if op.parameters:
+        lines.append("### Parameters")
+        lines.append("")
+        lines.append("| Name | In | Type | Required | Description |")
+        lines.append("|---|---|---|---|---|")
+        for p in op.parameters:
+            schema = p.get("schema") or {}
+            ptype = schema.get("type", "")
+            if schema.get("format"):
+                ptype = f"{ptype} ({schema['format']})"
+            required = "yes" if p.get("required") else "no"
+            desc = _cell(str(p.get("description", "")).replace("\n", " "))
+            lines.append(
+                f"| `{p.get('name', '')}` | {p.get('in', '')} | `{ptype}` | {required} | {desc} |"
+            )
+        lines.append("")
+
+    if op.request_body:
+        lines.append("### Request body")
+        lines.append("")
+        if op.request_body.get("description"):
+            lines.append(op.request_body["description"])
+            lines.append("")
+        for media, content in (op.request_body.get("content") or {}).items():
+            lines.append(f"`{media}`")
+            lines.append("")
+            if isinstance(content, dict) and content.get("schema"):
+                lines.extend(_schema_block(content["schema"]))
+                lines.append("")
+
+    if op.responses:
+        lines.append("### Responses")
+        lines.append("")
+        for status, response in op.responses.items():
+            if not isinstance(response, dict):
+                continue
+            desc = str(response.get("description", "")).replace("\n", " ")
+            lines.append(f"#### `{status}`" + (f" {desc}" if desc else ""))
+            lines.append("")
+            for media, content in (response.get("content") or {}).items():
+                if isinstance(content, dict) and content.get("schema"):
+                    lines.append(f"`{media}`")
+                    lines.append("")
+                    lines.extend(_schema_block(content["schema"]))
+                    lines.append("")
+
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def sync_openapi_references(spec_path: Path | None, check: bool) -> list[Path]:
+    """Regenerate per-operation snippets and the operation index.
+
+    When the spec digest matches the stored index, staleness is decided
+    from snippet header lines alone and the spec is not parsed. Otherwise
+    the spec is parsed once and only operations whose content hash changed
+    are rewritten. Returns the outdated paths (in check mode nothing is
+    written).
+    """
+    outdated: list[Path] = []
+    try:
+        stored = json.loads(OPERATIONS_INDEX.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        stored = {}
+
+    ops_by_slug: dict[str, Operation] | None = None
+    expected_index: dict = {}
+    if spec_path is not None and spec_path.exists():
+        digest = sha256_file(spec_path)
+        if (
+            stored.get("version") == INDEX_VERSION
+            and stored.get("spec_sha256") == digest
+        ):
+            expected_index = stored
+        else:
+            with phase("json"):
+                spec = json.loads(spec_path.read_text(encoding="utf-8"))
+            with phase("openapi index"):
+                ops = build_operation_index(spec)
+            ops_by_slug = {op.slug: op for op in ops}
+            expected_index = index_to_json(ops, digest)
+
+    if expected_index != stored:
+        outdated.append(OPERATIONS_INDEX)
+        if not check:
+            OPERATIONS_INDEX.write_text(
+                json.dumps(expected_index, indent=2, sort_keys=True) + "\n",
+                encoding="utf-8",
+            )
+
+    expected: set[Path] = set()
+    pending: list[tuple[str, dict, Path]] = []
+    for slug, meta in (expected_index.get("operations") or {}).items():
+        out = OPENAPI_SNIPPETS_DIR / f"{slug}.mdx"
+        expected.add(out)
+        if _first_line(out) == _openapi_snippet_header(slug, meta):
+            continue
+        outdated.append(out)
+        pending.append((slug, meta, out))
+
+    if pending and not check:
+        if ops_by_slug is None:
+            with phase("json"):
+                spec = json.loads(spec_path.read_text(encoding="utf-8"))
+            with phase("openapi index"):
+                ops_by_slug = {op.slug: op for op in build_operation_index(spec)}
+        ensure_dir(OPENAPI_SNIPPETS_DIR)
+
+        def regenerate(job: tuple[str, dict, Path]) -> None:
+            slug, meta, out = job
+            with phase("render"):
+                text = render_operation_reference(ops_by_slug[slug], meta)
+            with phase("write"):
+                out.write_text(text, encoding="utf-8")
+            count("snippets written")
+
+        _pmap(regenerate, pending)
+
+    if OPENAPI_SNIPPETS_DIR.exists():
+        for p in OPENAPI_SNIPPETS_DIR.glob("*.mdx"):
+            if p not in expected:
+                outdated.append(p)
+                if not check:
+                    p.unlink()
+
+    return outdated
+
+
 def build_sources_manifest(items: list[SourceItem]) -> dict:
     sources: list[dict] = []
     for it in items:
@@ -187,6 +615,13 @@ def check_manifest_matches_expected(expected: dict) -> bool:
     return current == expected
 
 
+def _report_parse_errors() -> bool:
+    """Print the proto files that failed to parse; True if there were any."""
+    for path in sorted(_parse_errors):
+        print(f"- proto parse error: {_parse_errors[path]}")
+    return bool(_parse_errors)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Sync and verify reference sources (OpenAPI + protobuf event schemas) for Atlas docs."
@@ -196,7 +631,16 @@ def main() -> int:
         action="store_true",
         help="Do not modify files; exit non-zero if output is out of sync.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=JOBS,
+        help=f"Worker threads for hashing and snippet generation (default: {JOBS}).",
+    )
+    add_profile_arguments(parser)
     args = parser.parse_args()
+    set_jobs(args.jobs)
+    start_profiling(args)
 
     ensure_dir(SNIPPETS_DIR)
     ensure_dir(OPENAPI_DEST.parent)
@@ -228,7 +672,8 @@ def main() -> int:
                 ok = False
         # If openapi_src == OPENAPI_DEST (fallback), it's trivially in sync.
 
-        expected_snippet = generate_proto_snippet(PROTO_ROOT)
+        with phase("proto snippet"):
+            expected_snippet = generate_proto_snippet(PROTO_ROOT)
         current_snippet = (
             PROTO_SNIPPET.read_text(encoding="utf-8") if PROTO_SNIPPET.exists() else ""
         )
@@ -239,17 +684,33 @@ def main() -> int:
         if _norm(current_snippet) != _norm(expected_snippet):
             ok = False
 
-        expected_manifest = build_sources_manifest(
-            [
-                SourceItem(
-                    kind="openapi", source_path=openapi_src, dest_path=OPENAPI_DEST
-                ),
-                SourceItem(kind="proto", source_path=PROTO_ROOT, dest_path=None),
-            ]
-        )
-        if not check_manifest_matches_expected(expected_manifest):
+        with phase("proto references"):
+            outdated = sync_proto_references(PROTO_ROOT, check=True)
+        with phase("openapi references"):
+            outdated += sync_openapi_references(OPENAPI_DEST, check=True)
+        if outdated:
             ok = False
+            for p in outdated[:20]:
+                print(f"- outdated: {p.relative_to(ATLAS_ROOT).as_posix()}")
+
+        with phase("manifest"):
+            expected_manifest = build_sources_manifest(
+                [
+                    SourceItem(
+                        kind="openapi", source_path=openapi_src, dest_path=OPENAPI_DEST
+                    ),
+                    SourceItem(kind="proto", source_path=PROTO_ROOT, dest_path=None),
+                ]
+            )
+            if not check_manifest_matches_expected(expected_manifest):
+                ok = False
+
+        with phase("cache save"):
+            HASHES.save()
+            save_proto_index()
 
+        if _report_parse_errors():
+            ok = False
         if not ok:
             print(
                 "Reference outputs are out of sync. Run: python3 scripts/sync_reference.py"
@@ -265,25 +726,41 @@ def main() -> int:
     if copy_if_changed(openapi_src, OPENAPI_DEST):
         changed = True
 
-    snippet = generate_proto_snippet(PROTO_ROOT)
+    with phase("proto snippet"):
+        snippet = generate_proto_snippet(PROTO_ROOT)
     if (not PROTO_SNIPPET.exists()) or PROTO_SNIPPET.read_text(
         encoding="utf-8"
     ) != snippet:
         PROTO_SNIPPET.write_text(snippet + "\n", encoding="utf-8")
         changed = True
 
-    manifest = build_sources_manifest(
-        [
-            SourceItem(kind="openapi", source_path=openapi_src, dest_path=OPENAPI_DEST),
-            SourceItem(kind="proto", source_path=PROTO_ROOT, dest_path=None),
-        ]
-    )
-    SOURCES_MANIFEST.write_text(
-        json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
-    )
+    with phase("proto references"):
+        if sync_proto_references(PROTO_ROOT, check=False):
+            changed = True
+
+    with phase("openapi references"):
+        if sync_openapi_references(OPENAPI_DEST, check=False):
+            changed = True
+
+    with phase("manifest"):
+        manifest = build_sources_manifest(
+            [
+                SourceItem(
+                    kind="openapi", source_path=openapi_src, dest_path=OPENAPI_DEST
+                ),
+                SourceItem(kind="proto", source_path=PROTO_ROOT, dest_path=None),
+            ]
+        )
+        SOURCES_MANIFEST.write_text(
+            json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+    with phase("cache save"):
+        HASHES.save()
+        save_proto_index()
 
+    failed = _report_parse_errors()
     print(f"Synced. Changed={str(changed).lower()}")
-    return 0
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
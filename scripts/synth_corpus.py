@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+Synthetic Atlas trees for benchmarking the docs scripts.
+
+``generate_tree(root, pages)`` lays out a monorepo like the real one
+(``<root>/platform/atlas`` plus ``<root>/shared/proto``) with:
+
+- ``docs.json`` navigation (tabs -> groups -> pages), global anchors and
+  redirects, and a ``mint.json`` whose navigation has drifted a little;
+- markdown pages with frontmatter and ``relatedPages``, Zipf-distributed
+  prose, headings, code fences, in-page links, cards, images and snippet
+  imports, including a small share of stubs, orphans, missing pages and
+  broken links;
+- an ``OWNERS.md`` ownership table with a few uncovered groups;
+- an OpenAPI source spec and protobuf event schemas sized to the corpus.
+
+Output depends only on ``pages`` and ``seed``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+from itertools import accumulate
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+# Written at the tree root; only directories carrying it are ever replaced.
+MARKER = ".synth_corpus.json"
+
+TABS = (
+    ("Customer Docs", "customer", 0.25),
+    ("Developer Guide", "developer", 0.35),
+    ("API Reference", "api", 0.15),
+    ("Enterprise", "enterprise", 0.10),
+    ("Internal (Staff)", "internal", 0.15),
+)
+FRONT_DOOR = (
+    "introduction",
+    "quickstart",
+    "development",
+    "documentation-contract",
+    "architecture-overview",
+    "concepts",
+)
+DEVELOPER_CATEGORIES = ("domain", "platform", "products", "operations")
+CORE_TOPICS = ("overview", "architecture", "setup", "testing", "deployment")
+
+PAGES_PER_GROUP = 25
+VOCABULARY_SIZE = 6000
+LINKS_PER_PAGE = 6
+
+STUB_RATE = 0.08
+ORPHAN_RATE = 0.05
+MISSING_RATE = 0.02
+BROKEN_LINK_RATE = 0.02
+IMAGE_RATE = 0.10
+SNIPPET_RATE = 0.05
+UNOWNED_GROUP_RATE = 0.02
+NAV_DRIFT_RATE = 0.03
+
+_SYLLABLES = (
+    "ka to ri mo na se lu vi pa de go shi ra te mi zo be ku fa lo "
+    "an en in on un ar er or ix ex ly al ic"
+).split()
+
+
+def _vocabulary(rng: random.Random) -> list[str]:
+    words: dict[str, None] = {}
+    while len(words) < VOCABULARY_SIZE:
+        n = rng.choice((2, 2, 3, 3, 3, 4))
+        words["".join(rng.choice(_SYLLABLES) for _ in range(n))] = None
+    return list(words)
+
+
+class _Text:
+    """Zipf-distributed word source (rank ``r`` has weight ``1/r``)."""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.words = _vocabulary(rng)
+        self.cum = list(accumulate(1.0 / r for r in range(1, len(self.words) + 1)))
+
+    def words_(self, k: int) -> list[str]:
+        return self.rng.choices(self.words, cum_weights=self.cum, k=k)
+
+    def sentence(self, k: int) -> str:
+        w = self.words_(k)
+        return " ".join(w).capitalize() + "."
+
+    def title(self, k: int = 3) -> str:
+        return " ".join(w.capitalize() for w in self.words_(k))
+
+    def slug(self, k: int = 2) -> str:
+        return "-".join(self.rng.choices(self.words[:800], k=k))
+
+
+def _plan(
+    rng: random.Random, text: _Text, pages: int
+) -> list[tuple[str, str, list[str]]]:
+    """``(tab, group, pages)`` navigation plan totalling about ``pages``."""
+    plan: list[tuple[str, str, list[str]]] = [
+        ("Getting Started", "Introduction", list(FRONT_DOOR))
+    ]
+    remaining = max(0, pages - len(FRONT_DOOR))
+    used: set[str] = set(FRONT_DOOR)
+
+    for tab, prefix, share in TABS:
+        budget = max(PAGES_PER_GROUP, round(remaining * share))
+        g = 0
+        while budget > 0:
+            if prefix == "developer":
+                category = DEVELOPER_CATEGORIES[g % len(DEVELOPER_CATEGORIES)]
+                base = f"developer/{category}/{text.slug(1)}-{g}"
+            else:
+                base = f"{prefix}/{text.slug(1)}-{g}"
+            size = min(budget, PAGES_PER_GROUP)
+            group_pages: list[str] = []
+            topics = list(CORE_TOPICS) if prefix == "developer" else []
+            while len(group_pages) < size:
+                topic = topics.pop(0) if topics else text.slug(2)
+                page = f"{base}/{topic}"
+                if page not in used:
+                    used.add(page)
+                    group_pages.append(page)
+            plan.append((tab, text.title(2) + f" {g}", group_pages))
+            budget -= size
+            g += 1
+    return plan
+
+
+def _frontmatter(title: str, related: list[str]) -> list[str]:
+    lines = [
+        "---",
+        f'title: "{title}"',
+        'description: "Synthetic page"',
+        'icon: "file"',
+        'status: "migrated"',
+        "tags: []",
+    ]
+    if related:
+        lines.append("relatedPages:")
+        lines.extend(f"  - {r}" for r in related)
+    else:
+        lines.append("relatedPages: []")
+    lines.append("---")
+    return lines
+
+
+def _page_body(
+    rng: random.Random,
+    text: _Text,
+    title: str,
+    nav_pages: list[str],
+    stub: bool,
+) -> list[str]:
+    lines = ["", f"# {title}", ""]
+    if stub:
+        lines += ["TODO: placeholder content for this page.", ""]
+        return lines
+
+    if rng.random() < SNIPPET_RATE:
+        lines[0:0] = ["", "import Intro from '/snippets/snippet-intro.mdx';"]
+        lines += ["<Intro />", ""]
+
+    links = max(0, round(rng.gauss(LINKS_PER_PAGE, 2)))
+    sections = rng.randint(2, 5)
+    for s in range(sections):
+        lines += [f"## {text.title(rng.randint(2, 4))}", ""]
+        for _ in range(rng.randint(1, 3)):
+            sentences = [
+                text.sentence(rng.randint(6, 18)) for _ in range(rng.randint(2, 5))
+            ]
+            per_section = links // sections + (1 if s < links % sections else 0)
+            for _ in range(per_section):
+                if rng.random() < BROKEN_LINK_RATE:
+                    target = f"/{text.slug(2)}/missing"
+                else:
+                    target = f"/{rng.choice(nav_pages)}"
+                anchor = " ".join(text.words_(rng.randint(1, 3)))
+                sentences.insert(
+                    rng.randrange(len(sentences) + 1), f"See [{anchor}]({target})."
+                )
+            lines += [" ".join(sentences), ""]
+        if rng.random() < 0.3:
+            lines += ["```bash", f"atlas {text.slug(1)} --{text.slug(1)}", "```", ""]
+
+    if rng.random() < IMAGE_RATE:
+        lines += [f"![{text.title(2)}](/images/diagram-{rng.randrange(10)}.png)", ""]
+
+    card = rng.choice(nav_pages)
+    lines += [
+        "<CardGroup cols={2}>",
+        f'  <Card title="{text.title(2)}" icon="book" href="/{card}">',
+        f"    {text.sentence(6)}",
+        "  </Card>",
+        "</CardGroup>",
+        "",
+    ]
+    return lines
+
+
+def _owners(plan: list[tuple[str, str, list[str]]], rng: random.Random) -> str:
+    lines = [
+        "# Atlas Docs Ownership",
+        "",
+        "## Ownership matrix",
+        "",
+        "| Page | Primary | Secondary | Team |",
+        "| ---- | ------- | --------- | ---- |",
+    ]
+    for page in FRONT_DOOR:
+        lines.append(f"| {page} | @docs-lead | @product | docs |")
+    lines += [
+        "",
+        "| Section | Primary | Secondary | Team |",
+        "| ------- | ------- | --------- | ---- |",
+    ]
+    for _, _, pages in plan[1:]:
+        if rng.random() < UNOWNED_GROUP_RATE:
+            continue
+        prefix = pages[0].rsplit("/", 1)[0]
+        lines.append(
+            f"| `{prefix}/*` | @owner-{rng.randrange(40)} | @docs-lead | docs |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _openapi(rng: random.Random, text: _Text, operations: int) -> dict:
+    schemas: dict[str, dict] = {
+        "Error": {
+            "type": "object",
+            "properties": {"code": {"type": "string"}, "message": {"type": "string"}},
+        },
+        "Node": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "children": {
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/Node"},
+                },
+            },
+        },
+    }
+    paths: dict[str, dict] = {}
+    resources = max(1, operations // 3)
+    for r in range(resources):
+        name = f"{text.slug(1).replace('-', '')}{r}"
+        schema = name.capitalize()
+        schemas[schema] = {
+            "type": "object",
+            "required": ["id"],
+            "properties": {
+                "id": {"type": "string", "format": "uuid"},
+                "name": {"type": "string"},
+                "count": {"type": "integer"},
+                "parent": {"$ref": "#/components/schemas/Node"},
+            },
+        }
+        ref = {"$ref": f"#/components/schemas/{schema}"}
+        error = {
+            "description": "Error",
+            "content": {
+                "application/json": {"schema": {"$ref": "#/components/schemas/Error"}}
+            },
+        }
+        tag = text.title(1)
+        paths[f"/{name}"] = {
+            "get": {
+                "operationId": f"list{schema}",
+                "tags": [tag],
+                "summary": text.sentence(4),
+                "parameters": [
+                    {"name": "limit", "in": "query", "schema": {"type": "integer"}}
+                ],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {
+                                "schema": {"type": "array", "items": ref}
+                            }
+                        },
+                    },
+                    "default": error,
+                },
+            },
+            "post": {
+                "operationId": f"create{schema}",
+                "tags": [tag],
+                "summary": text.sentence(4),
+                "requestBody": {"content": {"application/json": {"schema": ref}}},
+                "responses": {
+                    "201": {
+                        "description": "Created",
+                        "content": {"application/json": {"schema": ref}},
+                    }
+                },
+            },
+        }
+        paths[f"/{name}/{{id}}"] = {
+            "parameters": [
+                {
+                    "name": "id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "string"},
+                }
+            ],
+            "delete": {
+                "operationId": f"delete{schema}",
+                "tags": [tag],
+                "summary": text.sentence(4),
+                "responses": {"204": {"description": "Deleted"}, "default": error},
+            },
+        }
+    return {
+        "openapi": "3.1.0",
+        "info": {"title": "Synthetic API", "version": "1.0.0"},
+        "paths": paths,
+        "webhooks": {
+            "resourceChanged": {
+                "post": {
+                    "summary": "Resource changed",
+                    "requestBody": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/Node"}
+                            }
+                        }
+                    },
+                    "responses": {"200": {"description": "OK"}},
+                }
+            }
+        },
+        "components": {"schemas": schemas},
+    }
+
+
+def _proto(rng: random.Random, text: _Text, index: int) -> str:
+    package = f"materi.events.{text.slug(1).replace('-', '_')}{index}"
+    lines = ['syntax = "proto3";', "", f"package {package};", ""]
+    enum = f"Kind{index}"
+    lines += [f"enum {enum} {{", f"  KIND{index}_UNSPECIFIED = 0;"]
+    lines += [
+        f"  KIND{index}_{w.upper()} = {i + 1};" for i, w in enumerate(text.words_(4))
+    ]
+    lines += ["}", ""]
+    for m in range(rng.randint(5, 15)):
+        name = f"{text.title(2).replace(' ', '')}Event{m}"
+        lines += [f"// {text.sentence(8)}", f"message {name} {{"]
+        fields = rng.randint(3, 12)
+        for f in range(fields):
+            ftype = rng.choice(("string", "int64", "bool", "double", "bytes", enum))
+            label = "repeated " if rng.random() < 0.15 else ""
+            lines.append(f"  {label}{ftype} field_{f} = {f + 1}; // {text.sentence(4)}")
+        if rng.random() < 0.3:
+            lines += [
+                "  message Detail {",
+                "    string key = 1;",
+                "    string value = 2;",
+                "  }",
+                f"  repeated Detail details = {fields + 1};",
+            ]
+        lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def generate_tree(root: Path, pages: int, seed: int = 0) -> Path:
+    """Write a synthetic monorepo under ``root``; returns the atlas root."""
+    rng = random.Random(seed)
+    text = _Text(rng)
+    atlas = root / "platform" / "atlas"
+    if root.exists() and any(root.iterdir()):
+        if not (root / MARKER).exists():
+            raise FileExistsError(f"{root} exists and is not a synthetic tree")
+        shutil.rmtree(root)
+    atlas.mkdir(parents=True)
+    (root / MARKER).write_text(
+        json.dumps({"pages": pages, "seed": seed}) + "\n", encoding="utf-8"
+    )
+
+    plan = _plan(rng, text, pages)
+    nav_pages = [p for _, _, ps in plan for p in ps]
+
+    # Pages on disk: navigation minus a few missing, plus orphans.
+    missing = {p for p in nav_pages[len(FRONT_DOOR) :] if rng.random() < MISSING_RATE}
+    orphans = [
+        f"internal/archive/{text.slug(2)}-{i}"
+        for i in range(round(len(nav_pages) * ORPHAN_RATE))
+    ]
+    on_disk = [p for p in nav_pages if p not in missing] + orphans
+
+    created_dirs: set[Path] = set()
+    for page in on_disk:
+        path = atlas / f"{page}.mdx"
+        if path.parent not in created_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(path.parent)
+        title = text.title(3)
+        stub = page not in FRONT_DOOR and rng.random() < STUB_RATE
+        related = [
+            f"{p}.mdx" for p in rng.sample(nav_pages, k=rng.choice((0, 0, 1, 2, 3)))
+        ]
+        lines = _frontmatter(title, related) + _page_body(
+            rng, text, title, nav_pages, stub
+        )
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    (atlas / "snippets").mkdir(exist_ok=True)
+    (atlas / "snippets" / "snippet-intro.mdx").write_text(
+        "Materi is the AI-native content platform.\n", encoding="utf-8"
+    )
+    (atlas / "images").mkdir(exist_ok=True)
+    for i in range(10):
+        (atlas / "images" / f"diagram-{i}.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+    (atlas / "favicon.svg").write_text("<svg/>\n", encoding="utf-8")
+
+    tabs: list[dict] = []
+    for tab, group, group_pages in plan:
+        if not tabs or tabs[-1]["tab"] != tab:
+            tabs.append({"tab": tab, "groups": []})
+        tabs[-1]["groups"].append({"group": group, "pages": group_pages})
+    anchors = [
+        {"anchor": "Community", "href": "https://discord.gg/materi", "icon": "discord"},
+        {"anchor": "GitHub", "href": "https://github.com/materi-ai", "icon": "github"},
+    ]
+    redirects = [
+        {
+            "source": f"/old/{text.slug(2)}-{i}",
+            "destination": f"/{rng.choice(nav_pages)}",
+        }
+        for i in range(max(2, len(nav_pages) // 50))
+    ]
+    docs = {
+        "$schema": "https://mintlify.com/docs.json",
+        "theme": "mint",
+        "name": "Synthetic Atlas",
+        "openapi": "/openapi/openapi.json",
+        "favicon": "/favicon.svg",
+        "navigation": {"tabs": tabs, "global": {"anchors": anchors}},
+        "redirects": redirects,
+    }
+    (atlas / "docs.json").write_text(
+        json.dumps(docs, indent=2) + "\n", encoding="utf-8"
+    )
+
+    mint = json.loads(json.dumps(docs))
+    groups = [g for t in mint["navigation"]["tabs"] for g in t["groups"]]
+    for g in groups:
+        for page in list(g["pages"]):
+            if rng.random() < NAV_DRIFT_RATE:
+                g["pages"].remove(page)
+                rng.choice(groups)["pages"].append(page)
+    (atlas / "mint.json").write_text(
+        json.dumps(mint, indent=2) + "\n", encoding="utf-8"
+    )
+
+    (atlas / "OWNERS.md").write_text(_owners(plan, rng), encoding="utf-8")
+
+    spec_dir = atlas / "__ignore__" / "api-reference"
+    spec_dir.mkdir(parents=True)
+    spec = _openapi(rng, text, max(9, pages // 20))
+    (spec_dir / "openapi.json").write_text(
+        json.dumps(spec, indent=2) + "\n", encoding="utf-8"
+    )
+    (atlas / "openapi").mkdir()
+
+    proto_dir = root / "shared" / "proto" / "events"
+    proto_dir.mkdir(parents=True)
+    for i in range(max(2, pages // 200)):
+        (proto_dir / f"events_{i}.proto").write_text(
+            _proto(rng, text, i), encoding="utf-8"
+        )
+
+    (atlas / "scripts").mkdir()
+    for script in SCRIPTS_DIR.glob("*.py"):
+        shutil.copy2(script, atlas / "scripts" / script.name)
+
+    return atlas
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic Atlas tree for benchmarking the docs scripts."
+    )
+    parser.add_argument(
+        "root",
+        type=Path,
+        help="Directory to create (an earlier synthetic tree there is replaced).",
+    )
+    parser.add_argument(
+        "--pages",
+        type=int,
+        default=1000,
+        help="Approximate page count (default: 1000).",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0).")
+    args = parser.parse_args()
+
+    atlas = generate_tree(args.root, args.pages, args.seed)
+    print(f"Generated {atlas}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())